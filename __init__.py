@@ -1,17 +1,35 @@
-"""ElasticSearch e-commerce client package."""
+"""ElasticSearch e-commerce client package.
 
-from .clients.sync_client import EcommerceElasticClient
-from .clients.async_client import AsyncEcommerceClient
-from .models.query_builders import MatchQuery, MatchPhraseQuery, RangeQuery, TermQuery
-from .utils.product_generator import generate_product_data, format_product_details
+Exports are imported on first access, so importing the package does not
+load faker, aiohttp or the clients a caller never uses.
+"""
 
-__all__ = [
-    'EcommerceElasticClient',
-    'AsyncEcommerceClient',
-    'MatchQuery',
-    'MatchPhraseQuery',
-    'RangeQuery',
-    'TermQuery',
-    'generate_product_data',
-    'format_product_details'
-] 
\ No newline at end of file
+import importlib
+
+_EXPORTS = {
+    'EcommerceElasticClient': '.clients.sync_client',
+    'AsyncEcommerceClient': '.clients.async_client',
+    'AioEcommerceClient': '.clients.aio_client',
+    'MatchQuery': '.models.query_builders',
+    'MatchPhraseQuery': '.models.query_builders',
+    'RangeQuery': '.models.query_builders',
+    'TermQuery': '.models.query_builders',
+    'TermsQuery': '.models.query_builders',
+    'BoolQuery': '.models.query_builders',
+    'CriteriaQuery': '.models.query_builders',
+    'generate_product_data': '.utils.product_generator',
+    'format_product_details': '.utils.product_generator'
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
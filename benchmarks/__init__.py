@@ -0,0 +1 @@
+"""Benchmarks for the ElasticSearch clients, run against an in-process stand-in."""
@@ -0,0 +1,116 @@
+"""Check the cold import time of the sync client against a budget.
+
+Each measurement runs in a fresh interpreter. The time to import requests,
+which the sync client cannot do without, is measured the same way and
+subtracted, so the budget covers only this package's own import cost. The
+two imports are timed alternately and the fastest run of each is compared:
+background load only ever adds time, so the minimum is the stable figure.
+Importing the sync client must not load any of DEFERRED_MODULES.
+
+benchmarks.run applies the same check and fails when it does not pass.
+
+Usage:
+    python -m benchmarks.import_time [--budget-ms 60] [--runs 7]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SYNC_CLIENT_MODULE = "elasticsearch.clients.sync_client"
+BASELINE_MODULE = "requests"
+DEFERRED_MODULES = ("faker", "aiohttp", "numpy", "requests_futures")
+DEFAULT_BUDGET_MS = 60
+DEFAULT_RUNS = 7
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+__import__(sys.argv[1])
+elapsed = time.perf_counter() - started
+print(json.dumps({"ms": elapsed * 1000, "loaded": [m for m in sys.argv[2:] if m in sys.modules]}))
+"""
+
+def cold_import(module):
+    """Import a module in a fresh interpreter.
+
+    Args:
+        module (str): Dotted module name
+
+    Returns:
+        dict: ms (import time) and loaded (the DEFERRED_MODULES it pulled in)
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE, module, *DEFERRED_MODULES],
+        cwd=REPO_ROOT, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output)
+
+def measure_import(module=SYNC_CLIENT_MODULE, runs=DEFAULT_RUNS):
+    """Measure the cold import time of a module over several runs.
+
+    Args:
+        module (str): Dotted module name
+        runs (int): Fresh interpreters per measurement
+
+    Returns:
+        dict: module, runs, min_ms, median_ms, baseline_ms (fastest import of
+            requests alone), package_ms (min_ms minus baseline_ms) and
+            deferred_loaded
+    """
+    samples = []
+    baseline = []
+    for _ in range(runs):
+        samples.append(cold_import(module))
+        baseline.append(cold_import(BASELINE_MODULE)["ms"])
+    timings = [sample["ms"] for sample in samples]
+    min_ms = min(timings)
+    baseline_ms = min(baseline)
+    return {
+        "module": module,
+        "runs": runs,
+        "min_ms": min_ms,
+        "median_ms": statistics.median(timings),
+        "baseline_ms": baseline_ms,
+        "package_ms": max(min_ms - baseline_ms, 0.0),
+        "deferred_loaded": sorted({name for sample in samples for name in sample["loaded"]})
+    }
+
+def check_import_budget(budget_ms=DEFAULT_BUDGET_MS, runs=DEFAULT_RUNS):
+    """Return (passed, measurement) for the sync client's cold import.
+
+    Args:
+        budget_ms (float): Allowed import time on top of requests
+        runs (int): Fresh interpreters per measurement
+
+    Returns:
+        tuple: (True if within budget and nothing deferred was loaded, measure_import dict)
+    """
+    result = measure_import(SYNC_CLIENT_MODULE, runs)
+    return result["package_ms"] <= budget_ms and not result["deferred_loaded"], result
+
+def print_import_result(result, budget_ms):
+    """Print a measure_import result against its budget."""
+    print(f"import {result['module']}: {result['min_ms']:.1f} ms best, {result['median_ms']:.1f} ms median "
+          f"({result['package_ms']:.1f} ms on top of {BASELINE_MODULE}, budget {budget_ms:.0f} ms)")
+    if result["deferred_loaded"]:
+        print(f"deferred modules imported eagerly: {', '.join(result['deferred_loaded'])}")
+
+def main(argv=None):
+    """Command line entry point: python -m benchmarks.import_time."""
+    parser = argparse.ArgumentParser(description="Check the sync client's cold import time")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="Allowed import time on top of requests")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args(argv)
+
+    passed, result = check_import_budget(args.budget_ms, args.runs)
+    print_import_result(result, args.budget_ms)
+    return 0 if passed else 1
+
+if __name__ == "__main__":
+    raise SystemExit(main())
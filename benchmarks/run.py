@@ -0,0 +1,237 @@
+"""Benchmark the clients against the in-process stand-in and write JSON results.
+
+The run exits non-zero when the sync client's cold import goes over the
+import budget (see benchmarks.import_time).
+
+Usage:
+    python -m benchmarks.run --output bench_results.json [--latency-ms 1] [--quick]
+        [--import-budget-ms 60]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from elasticsearch.clients.async_client import AsyncEcommerceClient
+from elasticsearch.clients.sync_client import EcommerceElasticClient
+from elasticsearch.models.query_builders import TermQuery
+from elasticsearch.utils.vectorized_generator import iter_product_data
+from .import_time import DEFAULT_BUDGET_MS, check_import_budget, print_import_result
+from .stand_in import StandInServer
+
+FULL_SETTINGS = {
+    "bulk_documents": 20000,
+    "bulk_chunk_size": 500,
+    "bulk_thread_counts": [1, 2, 4, 8],
+    "search_iterations": 500,
+    "concurrency_searches": 400,
+    "concurrency_workers": [1, 2, 4, 8, 16, 32]
+}
+
+QUICK_SETTINGS = {
+    "bulk_documents": 2000,
+    "bulk_chunk_size": 250,
+    "bulk_thread_counts": [1, 4],
+    "search_iterations": 100,
+    "concurrency_searches": 80,
+    "concurrency_workers": [1, 4, 16]
+}
+
+def seeded_products(count, seed):
+    """Generate the same product documents on every run."""
+    return list(iter_product_data(count, seed=seed))
+
+def latency_summary(samples):
+    """Summarize latency samples (seconds) as p50/p95/p99/mean/max in milliseconds."""
+    ordered = sorted(samples)
+
+    def rank(percent):
+        index = max(int(round(percent / 100.0 * len(ordered))) - 1, 0)
+        return ordered[min(index, len(ordered) - 1)] * 1000
+
+    return {
+        "samples": len(ordered),
+        "p50": rank(50),
+        "p95": rank(95),
+        "p99": rank(99),
+        "mean": sum(ordered) / len(ordered) * 1000,
+        "max": ordered[-1] * 1000
+    }
+
+def bench_bulk(port, products, chunk_size, thread_counts):
+    """Measure bulk indexing throughput in documents per second.
+
+    Args:
+        port (int): Stand-in port
+        products (list): Documents to index
+        chunk_size (int): Actions per _bulk request
+        thread_counts (list): Concurrent _bulk requests to try
+
+    Returns:
+        dict: Results keyed by client and concurrency
+    """
+    results = {}
+    with EcommerceElasticClient(port=port) as client:
+        for thread_count in thread_counts:
+            batch = [dict(product) for product in products]
+            start = time.perf_counter()
+            summary = client.bulk_create_products(batch, chunk_size=chunk_size, thread_count=thread_count)
+            elapsed = time.perf_counter() - start
+            results[f"sync_threads_{thread_count}"] = {
+                "documents": summary["indexed"],
+                "seconds": elapsed,
+                "docs_per_sec": summary["indexed"] / elapsed
+            }
+
+    for thread_count in thread_counts:
+        with AsyncEcommerceClient(port=port, max_workers=thread_count) as client:
+            batch = [dict(product) for product in products]
+            start = time.perf_counter()
+            summary = client.wait_for_bulk(client.async_bulk_index(batch, chunk_size=chunk_size))
+            elapsed = time.perf_counter() - start
+            results[f"async_workers_{thread_count}"] = {
+                "documents": summary["indexed"],
+                "seconds": elapsed,
+                "docs_per_sec": summary["indexed"] / elapsed
+            }
+    return results
+
+def bench_search(port, iterations):
+    """Measure single-request latency percentiles for search and document lookups.
+
+    Args:
+        port (int): Stand-in port
+        iterations (int): Requests per operation
+
+    Returns:
+        dict: Latency summary per operation
+    """
+    operations = {
+        "search_by_category": lambda client: client.search_by_category("Electronics"),
+        "search_by_criteria": lambda client: client.search_by_criteria(
+            [{"category": "Electronics"}, {"price_range": {"min": 100, "max": 500}}]
+        ),
+        "get_product_by_id": lambda client: client.get_product_by_id(1),
+        "get_products_by_ids": lambda client: client.get_products_by_ids(list(range(1, 51)))
+    }
+    results = {}
+    with EcommerceElasticClient(port=port) as client:
+        for name, operation in operations.items():
+            operation(client)
+            samples = []
+            for _ in range(iterations):
+                start = time.perf_counter()
+                operation(client)
+                samples.append(time.perf_counter() - start)
+            results[name] = latency_summary(samples)
+    return results
+
+def bench_concurrency(port, searches, worker_counts):
+    """Compare sequential sync searches with the thread-pool client at several pool sizes.
+
+    Args:
+        port (int): Stand-in port
+        searches (int): Searches issued per configuration
+        worker_counts (list): AsyncEcommerceClient pool sizes to try
+
+    Returns:
+        dict: Searches per second and speedup over the sync baseline
+    """
+    with EcommerceElasticClient(port=port) as client:
+        start = time.perf_counter()
+        for _ in range(searches):
+            client.search_by_category("Electronics")
+        baseline = searches / (time.perf_counter() - start)
+    results = {"sync_sequential": {"searches_per_sec": baseline, "speedup": 1.0}}
+
+    query = TermQuery("Category", "Electronics")
+    for workers in worker_counts:
+        with AsyncEcommerceClient(port=port, max_workers=workers) as client:
+            start = time.perf_counter()
+            for _ in range(searches):
+                client.async_multi_search([query])
+            client.wait_for_all_operations()
+            rate = searches / (time.perf_counter() - start)
+        results[f"async_workers_{workers}"] = {"searches_per_sec": rate, "speedup": rate / baseline}
+    return results
+
+def run_benchmarks(latency=0.001, settings=None, seed=42, import_budget_ms=DEFAULT_BUDGET_MS):
+    """Run every benchmark against a fresh stand-in.
+
+    Args:
+        latency (float): Seconds the stand-in waits before each response
+        settings (dict, optional): Sizes and concurrency levels; FULL_SETTINGS by default
+        seed (int): Seed for the generated documents
+        import_budget_ms (float): Allowed cold import time of the sync client on top of requests
+
+    Returns:
+        dict: Machine-readable results with run metadata; results.import_ms
+            includes budget_ms and passed
+    """
+    settings = settings or FULL_SETTINGS
+    products = seeded_products(settings["bulk_documents"], seed)
+
+    with StandInServer(latency=latency, seed=seed) as server:
+        started = time.perf_counter()
+        results = {
+            "bulk": bench_bulk(server.port, products, settings["bulk_chunk_size"], settings["bulk_thread_counts"]),
+            "search_latency_ms": bench_search(server.port, settings["search_iterations"]),
+            "concurrency": bench_concurrency(
+                server.port, settings["concurrency_searches"], settings["concurrency_workers"]
+            ),
+        }
+        passed, results["import_ms"] = check_import_budget(import_budget_ms)
+        results["import_ms"].update(budget_ms=import_budget_ms, passed=passed)
+        requests_served = server.requests
+
+    return {
+        "metadata": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "stand_in_latency_ms": latency * 1000,
+            "seed": seed,
+            "settings": settings,
+            "requests_served": requests_served,
+            "seconds": time.perf_counter() - started
+        },
+        "results": results
+    }
+
+def print_summary(report):
+    """Print the headline numbers of a benchmark report."""
+    results = report["results"]
+    for name, result in results["bulk"].items():
+        print(f"bulk {name}: {result['docs_per_sec']:.0f} docs/sec")
+    for name, result in results["search_latency_ms"].items():
+        print(f"{name}: p50 {result['p50']:.2f} ms, p95 {result['p95']:.2f} ms, p99 {result['p99']:.2f} ms")
+    for name, result in results["concurrency"].items():
+        print(f"concurrency {name}: {result['searches_per_sec']:.0f} searches/sec ({result['speedup']:.1f}x)")
+    print_import_result(results["import_ms"], results["import_ms"]["budget_ms"])
+
+def main(argv=None):
+    """Command line entry point: python -m benchmarks.run."""
+    parser = argparse.ArgumentParser(description="Benchmark the ElasticSearch clients against a local stand-in")
+    parser.add_argument("--output", default="bench_results.json", help="Where to write the JSON results")
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="Stand-in latency per request")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--quick", action="store_true", help="Smaller sizes for a fast smoke run")
+    parser.add_argument("--import-budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="Allowed cold import time of the sync client on top of requests")
+    args = parser.parse_args(argv)
+
+    settings = QUICK_SETTINGS if args.quick else FULL_SETTINGS
+    report = run_benchmarks(args.latency_ms / 1000, settings, args.seed, args.import_budget_ms)
+    with open(args.output, "w") as output:
+        json.dump(report, output, indent=2)
+    print_summary(report)
+    print(f"Results written to {args.output}")
+    if not report["results"]["import_ms"]["passed"]:
+        print("Import budget exceeded")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,163 @@
+"""In-process HTTP stand-in for ElasticSearch with canned responses and configurable latency."""
+
+import gzip
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+from faker import Faker
+from elasticsearch.utils.product_generator import generate_product_data
+
+BULK_ACTIONS = ("index", "create", "update", "delete")
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Answers the endpoints the clients use with precomputed bodies."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        return body
+
+    def _send(self, status, data=b""):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(data)
+
+    def _handle(self):
+        server = self.server
+        body = self._read_body()
+        if server.latency:
+            time.sleep(server.latency)
+        with server.lock:
+            server.requests += 1
+
+        parts = [part for part in urlparse(self.path).path.split("/") if part]
+        endpoint = parts[-1] if parts else ""
+
+        if not parts:
+            return self._send(200, server.root_response)
+        if endpoint == "_bulk":
+            return self._send(200, server.bulk_response(body))
+        if endpoint == "_msearch":
+            return self._send(200, server.msearch_response(body))
+        if endpoint == "_search":
+            return self._send(200, server.search_response)
+        if endpoint == "_mget":
+            return self._send(200, server.mget_response(body))
+        if "_doc" in parts or "_update" in parts:
+            if self.command == "GET":
+                return self._send(200, server.doc_response)
+            if self.command == "DELETE":
+                return self._send(200, b'{"result":"deleted"}')
+            return self._send(201, b'{"_id":"1","result":"created"}')
+        if len(parts) == 1:
+            # Index HEAD / PUT / DELETE
+            status = 404 if self.command == "HEAD" else 200
+            return self._send(status, b'{"acknowledged":true}')
+        return self._send(200, b'{"acknowledged":true}')
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = _handle
+
+class StandInServer(ThreadingHTTPServer):
+    """Threaded HTTP server standing in for an ElasticSearch node.
+
+    Every request sleeps for ``latency`` seconds before answering, which
+    models network plus server time so client concurrency can be measured.
+    Response bodies are built once up front, so the stand-in itself adds
+    as little noise as possible.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, port=0, latency=0.0, search_hits=10, seed=42):
+        """Initialize the stand-in.
+
+        Args:
+            port (int): Port to listen on; 0 picks a free one (default: 0)
+            latency (float): Seconds to wait before answering each request
+            search_hits (int): Number of hits in every canned search response
+            seed (int): Seed for the canned product documents
+        """
+        super().__init__(("127.0.0.1", port), StandInHandler)
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.requests = 0
+        self._thread = None
+
+        random.seed(seed)
+        Faker.seed(seed)
+        products = generate_product_data(search_hits)
+        hits = [{"_id": str(product["ID"]), "_source": product} for product in products]
+        search = {"took": 1, "hits": {"hits": hits}}
+        self.root_response = b'{"version":{"number":"7.17.4"}}'
+        self.search_response = json.dumps(search).encode("utf-8")
+        self.doc_response = json.dumps({"found": True, "_source": products[0]}).encode("utf-8")
+        self._msearch_item = json.dumps(search).encode("utf-8")
+        self._mget_source = json.dumps(products[0]).encode("utf-8")
+
+    def bulk_response(self, body):
+        """Build a successful _bulk response with one item per action."""
+        items = []
+        expect_action = True
+        for line in body.splitlines():
+            if not line.strip():
+                continue
+            if not expect_action:
+                expect_action = True
+                continue
+            operation = next(iter(json.loads(line)))
+            if operation in BULK_ACTIONS:
+                items.append('{"%s":{"_id":"%d","status":%d}}' % (
+                    operation, len(items), 201 if operation in ("index", "create") else 200
+                ))
+                expect_action = operation == "delete"
+        return ('{"took":1,"errors":false,"items":[' + ",".join(items) + "]}").encode("utf-8")
+
+    def msearch_response(self, body):
+        """Build an _msearch response with one canned result per search."""
+        searches = sum(1 for line in body.splitlines() if line.strip()) // 2
+        return b'{"took":1,"responses":[' + b",".join([self._msearch_item] * searches) + b"]}"
+
+    def mget_response(self, body):
+        """Build an _mget response finding every requested ID."""
+        ids = json.loads(body).get("ids", [])
+        docs = [
+            b'{"_id":' + json.dumps(str(product_id)).encode("utf-8") + b',"found":true,"_source":'
+            + self._mget_source + b"}"
+            for product_id in ids
+        ]
+        return b'{"docs":[' + b",".join(docs) + b"]}"
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def start(self):
+        """Serve requests from a daemon thread and return self."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the listening socket."""
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
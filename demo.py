@@ -11,7 +11,11 @@ def demo_sync_client():
     print("\n=== Synchronous Client Demo ===")
     
     # Initialize client
-    client = EcommerceElasticClient()
+    client = EcommerceElasticClient(output_mode="display")
+    
+    # Probe the cluster once; later clients for this host reuse the answer
+    if not client.check_connection():
+        return
     
     # Create index
     print("\nCreating product index...")
@@ -99,7 +103,7 @@ def demo_async_client():
     print("\n=== Asynchronous Client Demo ===")
     
     # Initialize client
-    client = AsyncEcommerceClient(max_workers=5)
+    client = AsyncEcommerceClient(max_workers=5, output_mode="display")
     
     # Create index
     print("\nCreating product index...")
@@ -1,7 +1,16 @@
-"""ElasticSearch client implementations."""
+"""ElasticSearch client implementations.
 
-from .base_client import BaseElasticClient
-from .sync_client import EcommerceElasticClient
-from .async_client import AsyncEcommerceClient
+Clients are imported on first access, so the sync client never pays for
+aiohttp and the asyncio client never pays for requests.
+"""
 
-__all__ = ['BaseElasticClient', 'EcommerceElasticClient', 'AsyncEcommerceClient'] 
\ No newline at end of file
+from ..utils.lazy import lazy_exports
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    'Transport': '.transport',
+    'BaseElasticClient': '.base_client',
+    'EcommerceElasticClient': '.sync_client',
+    'AsyncEcommerceClient': '.async_client',
+    'AioTransport': '.aio_transport',
+    'AioEcommerceClient': '.aio_client'
+})
@@ -0,0 +1,345 @@
+"""Native asyncio ElasticSearch client for e-commerce operations."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from .aio_transport import AioTransport
+from .operations import PointInTimeScan, ProductOperations, Sleep
+from ..utils.aliases import DEFAULT_INDEX_ALIAS
+from ..utils.columns import DEFAULT_COLUMNS, ColumnBuilder
+from ..utils.instrumentation import instrumented
+from ..utils.output import SILENT
+from ..utils.pagination import DEFAULT_KEEP_ALIVE, DEFAULT_PAGE_SIZE
+from ..utils.bulk_helpers import (
+    DEFAULT_CHUNK_SIZE, DEFAULT_INITIAL_BACKOFF, DEFAULT_MAX_BACKOFF, DEFAULT_MAX_CHUNK_BYTES,
+    DEFAULT_MAX_RETRIES, add_chunk_result, chunk_actions, delete_actions, new_bulk_summary, price_update_actions,
+    product_index_actions, update_actions
+)
+
+class AioEcommerceClient(ProductOperations):
+    """Asyncio client for e-commerce operations using aiohttp.
+
+    Every method is a coroutine sharing one keep-alive connector, so a single
+    event loop can keep many searches in flight. Use it as an async context
+    manager, or call close() when done. The operations run the same request
+    plans as BaseElasticClient (see elasticsearch.clients.operations); only
+    the I/O differs.
+    """
+
+    def __init__(self, host='localhost', port=9200, transport=None, query_cache=None, output_mode=SILENT,
+                 instrumentation=None, index_alias=DEFAULT_INDEX_ALIAS, read_alias=None, write_alias=None,
+                 **transport_options):
+        """Initialize the asyncio ElasticSearch client.
+
+        Construction does no I/O; the connection is opened on first use.
+
+        Args:
+            host (str): ElasticSearch host (default: localhost)
+            port (int): ElasticSearch port (default: 9200)
+            transport (AioTransport, optional): Shared transport to send requests through
+            query_cache (QueryCache, optional): Opt-in search result cache, invalidated
+                whenever this client writes to the index
+            output_mode (str): "silent" (default), "log" to use the logging module,
+                or "display" to print every message and search hit
+            instrumentation (Instrumentation, optional): Collector for per-operation
+                statistics; a private one is created when omitted
+            index_alias (str): Alias the versioned product indices sit behind
+                (default: ecommerce_products)
+            read_alias (str, optional): Alias searches and lookups go through;
+                index_alias when omitted
+            write_alias (str, optional): Alias indexing, updates and bulk writes
+                go through; index_alias when omitted
+            **transport_options: Passed to AioTransport when one is created
+                (hosts, selector, sniff_on_start, connection_limit, limit_per_host, timeout, ...)
+        """
+        self._configure(
+            transport or AioTransport(host, port, **transport_options), output_mode, instrumentation,
+            index_alias, read_alias, write_alias, query_cache
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Close the shared aiohttp session and connector."""
+        await self.transport.close()
+
+    @staticmethod
+    def _operation_method(plan_name):
+        """Build the coroutine public method that runs a shared plan."""
+        async def method(self, *args, **kwargs):
+            return await self._run(getattr(self, plan_name)(*args, **kwargs))
+        return method
+
+    async def _perform(self, step):
+        """Send one plan step and return its response(s); a list of requests is sent concurrently."""
+        if isinstance(step, Sleep):
+            return await asyncio.sleep(step.seconds)
+        if isinstance(step, list):
+            return await asyncio.gather(*(self.transport.perform_request(*request) for request in step))
+        return await self.transport.perform_request(*step)
+
+    async def _run(self, plan):
+        """Drive a request plan without blocking the event loop and return its result."""
+        try:
+            step = next(plan)
+            while True:
+                try:
+                    result = await self._perform(step)
+                except Exception as error:
+                    step = plan.throw(error)
+                else:
+                    step = plan.send(result)
+        except StopIteration as stop:
+            return stop.value
+
+    @asynccontextmanager
+    async def bulk_load(self, index_name=None, settings=None, force_merge=False, max_num_segments=1):
+        """Apply ingest-optimized settings for the duration of a bulk load.
+
+        Async counterpart of BaseElasticClient.bulk_load: the original
+        settings are restored and the index refreshed on exit, even if the
+        block raised.
+
+        Args:
+            index_name (str, optional): Index or alias being loaded; the write alias by default
+            settings (dict, optional): Settings to apply during the load;
+                BULK_LOAD_SETTINGS by default
+            force_merge (bool): Force merge after a successful load
+            max_num_segments (int): Segments per shard for the force merge
+
+        Yields:
+            AioEcommerceClient: This client
+
+        Raises:
+            RuntimeError: If the ingest settings could not be read or applied
+        """
+        index_name = self._write_target(index_name)
+        original = await self.begin_bulk_load(index_name, settings)
+
+        try:
+            yield self
+        finally:
+            await self.end_bulk_load(index_name, original)
+
+        if force_merge:
+            await self.force_merge(index_name, max_num_segments)
+
+    @instrumented
+    async def scan_products(self, query=None, page_size=DEFAULT_PAGE_SIZE, sort=None,
+                            keep_alive=DEFAULT_KEEP_ALIVE, fields=None, exclude=None, index=None):
+        """Lazily page through every product matching a query.
+
+        Async generator counterpart of BaseElasticClient.scan_products, using a
+        point in time plus search_after on a stable sort.
+
+        Args:
+            query (dict, optional): Query DSL clause; matches everything when omitted
+            page_size (int): Number of hits fetched per request
+            sort (list, optional): Stable sort; defaults to ID with a shard tiebreaker
+            keep_alive (str): How long to keep the point in time open between pages
+            fields (list, optional): Source fields to return
+            exclude (list, optional): Source fields to leave out
+            index (str, optional): Index or alias to read from; the read alias by default
+
+        Yields:
+            dict: Product source documents
+
+        Raises:
+            RuntimeError: If the point in time cannot be opened or a page request
+                fails, so a truncated stream is never mistaken for a complete one
+        """
+        index_name = self._read_target(index)
+        pit_id = await self.open_point_in_time(index_name, keep_alive)
+        if pit_id is None:
+            raise RuntimeError(f"Could not open a point in time on {index_name}")
+
+        scan = PointInTimeScan(pit_id, query, page_size, sort, keep_alive, fields=fields, exclude=exclude)
+        try:
+            while not scan.done:
+                hits = scan.read(await self.transport.perform_request(*scan.request()))
+                for hit in hits:
+                    yield hit["_source"]
+        finally:
+            await self.close_point_in_time(scan.pit_id)
+
+    @instrumented
+    async def search_columns(self, query=None, columns=DEFAULT_COLUMNS, page_size=DEFAULT_PAGE_SIZE, index=None):
+        """Collect every matching product into compact columns for analytics.
+
+        See BaseElasticClient.search_columns.
+
+        Returns:
+            ProductColumns: NumPy arrays for ID, Price, StockQty and Rating, and
+                interned strings for Category, Subcategory and Brand
+
+        Raises:
+            RuntimeError: If a page cannot be fetched; no partial result is returned
+        """
+        builder = ColumnBuilder(columns)
+        if hasattr(query, "to_dict"):
+            query = query.to_dict()
+        products = self.scan_products(query, page_size, fields=list(columns), index=index)
+        try:
+            async for product in products:
+                builder.append(product)
+        finally:
+            await products.aclose()
+        return builder.build()
+
+    async def _send_bulk_chunk(self, chunk, body, max_retries=DEFAULT_MAX_RETRIES,
+                               initial_backoff=DEFAULT_INITIAL_BACKOFF, max_backoff=DEFAULT_MAX_BACKOFF):
+        """Send one _bulk chunk without blocking the loop; see ProductOperations._bulk_chunk."""
+        return await self._run(self._bulk_chunk(chunk, body, max_retries, initial_backoff, max_backoff))
+
+    @instrumented
+    async def streaming_bulk(self, actions, chunk_size=DEFAULT_CHUNK_SIZE,
+                             max_chunk_bytes=DEFAULT_MAX_CHUNK_BYTES, max_in_flight=4, **retry_options):
+        """Send bulk actions with up to max_in_flight _bulk requests at once.
+
+        If the consumer stops early (closes the generator or an exception is
+        thrown into it), chunks still in flight are cancelled and awaited, so
+        no _bulk request outlives the generator.
+
+        Args:
+            actions (iterable): (action, source) pairs; source is None for deletes
+            chunk_size (int): Maximum number of actions per _bulk request
+            max_chunk_bytes (int): Maximum body size in bytes per _bulk request
+            max_in_flight (int): Maximum concurrent _bulk requests
+            **retry_options: max_retries, initial_backoff, max_backoff for 429 rejections
+
+        Yields:
+            dict: Per-chunk result, in completion order
+        """
+        in_flight = set()
+
+        try:
+            for chunk, body in chunk_actions(actions, chunk_size, max_chunk_bytes, self.transport.serializer):
+                if len(in_flight) >= max_in_flight:
+                    done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+
+                in_flight.add(asyncio.ensure_future(self._send_bulk_chunk(chunk, body, **retry_options)))
+
+            while in_flight:
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def _run_bulk(self, actions, operation, chunk_size, max_chunk_bytes, max_in_flight, **retry_options):
+        """Drain streaming_bulk, folding each chunk result into the summary as it arrives."""
+        summary = new_bulk_summary()
+        async for chunk_result in self.streaming_bulk(
+            actions, chunk_size, max_chunk_bytes, max_in_flight, **retry_options
+        ):
+            add_chunk_result(summary, chunk_result)
+        return self._report_bulk_summary(summary, operation)
+
+    @instrumented
+    async def bulk_create_products(self, products_list, chunk_size=DEFAULT_CHUNK_SIZE,
+                                   max_chunk_bytes=DEFAULT_MAX_CHUNK_BYTES, max_in_flight=4, index=None,
+                                   **retry_options):
+        """Create multiple products using concurrent size-bounded bulk chunks.
+
+        Args:
+            products_list (iterable): Product documents to create
+            chunk_size (int): Maximum number of products per _bulk request
+            max_chunk_bytes (int): Maximum body size in bytes per _bulk request
+            max_in_flight (int): Maximum concurrent _bulk requests
+            index (str, optional): Index or alias to write to; the write alias by default
+            **retry_options: max_retries, initial_backoff, max_backoff for 429 rejections
+
+        Returns:
+            dict: Summary with indexed, retried and failed item counts
+        """
+        index_name = self._write_target(index)
+        actions = product_index_actions(products_list, index_name)
+        return await self._run_bulk(
+            actions, "Bulk creation", chunk_size, max_chunk_bytes, max_in_flight, **retry_options
+        )
+
+    @instrumented
+    async def bulk_load_products(self, products, force_merge=False, chunk_size=DEFAULT_CHUNK_SIZE,
+                                 max_chunk_bytes=DEFAULT_MAX_CHUNK_BYTES, max_in_flight=4, index=None,
+                                 **retry_options):
+        """Initial load or full rebuild: bulk index products with ingest-optimized settings.
+
+        Args:
+            products (iterable): Product documents to index
+            force_merge (bool): Force merge the index after the load
+            chunk_size (int): Maximum number of products per _bulk request
+            max_chunk_bytes (int): Maximum body size in bytes per _bulk request
+            max_in_flight (int): Maximum concurrent _bulk requests
+            index (str, optional): Index or alias to write to; the write alias by default
+            **retry_options: max_retries, initial_backoff, max_backoff for 429 rejections
+
+        Returns:
+            dict: Summary with indexed, retried and failed item counts
+        """
+        async with self.bulk_load(index, force_merge=force_merge):
+            return await self.bulk_create_products(
+                products, chunk_size, max_chunk_bytes, max_in_flight, index, **retry_options
+            )
+
+    @instrumented
+    async def bulk_update_products(self, updates_list, chunk_size=DEFAULT_CHUNK_SIZE,
+                                   max_chunk_bytes=DEFAULT_MAX_CHUNK_BYTES, max_in_flight=4, index=None,
+                                   **retry_options):
+        """Apply partial updates to multiple products.
+
+        Args:
+            updates_list (iterable): Dicts with product_id and update_data
+            index (str, optional): Index or alias to write to; the write alias by default
+
+        Returns:
+            dict: Summary with indexed, retried and failed item counts
+        """
+        index_name = self._write_target(index)
+        actions = update_actions(updates_list, index_name)
+        return await self._run_bulk(
+            actions, "Bulk update", chunk_size, max_chunk_bytes, max_in_flight, **retry_options
+        )
+
+    @instrumented
+    async def bulk_update_prices(self, price_adjustments, chunk_size=DEFAULT_CHUNK_SIZE,
+                                 max_chunk_bytes=DEFAULT_MAX_CHUNK_BYTES, max_in_flight=4, index=None,
+                                 **retry_options):
+        """Update prices for multiple products.
+
+        Args:
+            price_adjustments (iterable): Dicts with product_id and new_price
+            index (str, optional): Index or alias to write to; the write alias by default
+
+        Returns:
+            dict: Summary with indexed, retried and failed item counts
+        """
+        index_name = self._write_target(index)
+        actions = price_update_actions(price_adjustments, index_name)
+        return await self._run_bulk(
+            actions, "Bulk price update", chunk_size, max_chunk_bytes, max_in_flight, **retry_options
+        )
+
+    @instrumented
+    async def bulk_delete_products(self, product_ids, max_in_flight=4, index=None, **retry_options):
+        """Hard delete multiple products.
+
+        Args:
+            product_ids (iterable): Product IDs to delete
+            index (str, optional): Index or alias to write to; the write alias by default
+
+        Returns:
+            dict: Summary with indexed, retried and failed item counts
+        """
+        index_name = self._write_target(index)
+        actions = delete_actions(product_ids, index_name)
+        return await self._run_bulk(
+            actions, "Bulk deletion", DEFAULT_CHUNK_SIZE, DEFAULT_MAX_CHUNK_BYTES, max_in_flight, **retry_options
+        )
@@ -0,0 +1,234 @@
+"""Asyncio HTTP transport built on aiohttp."""
+
+import asyncio
+import time
+import aiohttp
+from .transport import Response
+from ..utils.compression import (
+    ACCEPT_ENCODING, DEFAULT_COMPRESS_THRESHOLD, TransferStats, decode_body, prepare_request_body
+)
+from ..utils.instrumentation import current_operation, is_failure
+from ..utils.node_pool import (
+    DEFAULT_DEAD_TIMEOUT, DEFAULT_FAILURE_THRESHOLD, ROUND_ROBIN, NodePool, NoLiveNodesError, node_url,
+    sniffed_urls
+)
+from ..utils.resilience import DEFAULT_TIMEOUT, RetryPolicy, is_idempotent
+from ..utils.serializer import get_serializer
+
+class AioResponse(Response):
+    """Fully read HTTP response returned by AioTransport."""
+
+    __slots__ = ()
+
+def _client_timeout(timeout):
+    """Convert a float or (connect, read) tuple into an aiohttp ClientTimeout."""
+    if isinstance(timeout, aiohttp.ClientTimeout):
+        return timeout
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+    return aiohttp.ClientTimeout(total=timeout)
+
+class AioTransport:
+    """Keep-alive aiohttp transport shared by every coroutine of a client.
+
+    The ``ClientSession`` and its ``TCPConnector`` are created on first use
+    inside the running event loop, so constructing the transport never
+    blocks or touches the network. Responses are decompressed here rather
+    than by aiohttp so that ``transfer_stats`` sees their wire size.
+    Nodes are load balanced, circuit broken, retried and sniffed as in
+    ``Transport``.
+    """
+
+    def __init__(self, host='localhost', port=9200, scheme='http', headers=None,
+                 connection_limit=100, limit_per_host=0, timeout=DEFAULT_TIMEOUT, serializer=None,
+                 http_compress=False, compress_threshold=DEFAULT_COMPRESS_THRESHOLD,
+                 hosts=None, selector=ROUND_ROBIN, dead_timeout=DEFAULT_DEAD_TIMEOUT,
+                 failure_threshold=DEFAULT_FAILURE_THRESHOLD, sniff_on_start=False, sniff_interval=None,
+                 retry_policy=None):
+        """Initialize the transport.
+
+        Args:
+            host (str): ElasticSearch host (default: localhost)
+            port (int): ElasticSearch port (default: 9200)
+            scheme (str): URL scheme, http or https (default: http)
+            headers (dict, optional): Default headers sent with every request
+            connection_limit (int): Total simultaneous connections (default: 100)
+            limit_per_host (int): Simultaneous connections per host, 0 for no
+                separate limit (default: 0)
+            timeout (float or tuple): Default request timeout in seconds, or a
+                (connect, read) tuple (default: (5, 30))
+            serializer (str or object, optional): JSON serializer for request and
+                response bodies; orjson when installed, the standard library otherwise
+            http_compress (bool): Gzip request bodies of at least compress_threshold
+                bytes and send them with Content-Encoding: gzip (default: False)
+            compress_threshold (int): Minimum body size in bytes to compress (default: 1024)
+            hosts (list, optional): Nodes to spread requests across, as "host:port",
+                URLs, (host, port) tuples or dicts; host and port are ignored when given
+            selector (str): "round_robin" (default) or "least_in_flight"
+            dead_timeout (float): Seconds a node's open circuit rejects requests
+                before a trial request; doubles while the node keeps failing (default: 60)
+            failure_threshold (int): Consecutive failures that open a node's circuit (default: 3)
+            sniff_on_start (bool): Discover the cluster's nodes through _nodes/http
+                before the first request (default: False)
+            sniff_interval (float, optional): Seconds between node rediscoveries
+            retry_policy (RetryPolicy, optional): Retries for idempotent requests;
+                two retries with jittered backoff by default
+        """
+        self.scheme = scheme
+        self.pool = NodePool(
+            [node_url(node, scheme, port) for node in hosts or [(host, port)]],
+            selector=selector, dead_timeout=dead_timeout, failure_threshold=failure_threshold
+        )
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.base_url = self.pool.nodes[0].base_url
+        self.sniff_interval = sniff_interval
+        if sniff_on_start:
+            self._next_sniff = 0.0
+        else:
+            self._next_sniff = time.monotonic() + sniff_interval if sniff_interval else None
+        self.headers = {"Content-Type": "application/json", "Accept-Encoding": ACCEPT_ENCODING}
+        if headers:
+            self.headers.update(headers)
+        self.connection_limit = connection_limit
+        self.limit_per_host = limit_per_host
+        self.timeout = _client_timeout(timeout)
+        self.serializer = get_serializer(serializer)
+        self.compress_threshold = compress_threshold if http_compress else None
+        self.transfer_stats = TransferStats()
+        self._session = None
+
+    @property
+    def session(self):
+        """Return the shared ClientSession, creating it on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.limit_per_host
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=self.timeout,
+                auto_decompress=False
+            )
+        return self._session
+
+    async def perform_request(self, method, path, body=None, params=None, headers=None, timeout=None,
+                              idempotent=None):
+        """Send a request through the shared session.
+
+        Args:
+            method (str): HTTP method
+            path (str): Request path relative to the base URL (e.g. /_bulk)
+            body (dict, str or bytes, optional): Request body; dicts and lists are
+                encoded by the serializer
+            params (dict, optional): Query string parameters
+            headers (dict, optional): Extra headers for this request only
+            timeout (float or tuple, optional): Overrides the default timeout
+            idempotent (bool, optional): Whether the request may be retried;
+                inferred from the method and endpoint when omitted
+
+        Returns:
+            AioResponse: The fully read HTTP response
+
+        Raises:
+            NoLiveNodesError: If every node's circuit is open
+        """
+        if isinstance(body, (dict, list)):
+            body = self.serializer.dumps(body)
+        body, raw_size, compressed = prepare_request_body(body, self.compress_threshold)
+        if compressed:
+            headers = dict(headers or {}, **{"Content-Encoding": "gzip"})
+
+        options = {}
+        if timeout is not None:
+            options["timeout"] = _client_timeout(timeout)
+
+        if self._next_sniff is not None and time.monotonic() >= self._next_sniff:
+            await self.sniff()
+
+        if idempotent is None:
+            idempotent = is_idempotent(method, path)
+
+        started = time.perf_counter()
+        failovers = 0
+        retries = 0
+        while True:
+            node = self.pool.acquire()
+            try:
+                async with self.session.request(
+                    method,
+                    f"{node.base_url}{path}",
+                    data=body,
+                    params=params,
+                    headers=headers,
+                    **options
+                ) as response:
+                    status = response.status
+                    response_headers = response.headers
+                    wire_content = await response.read()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                self.pool.release(node, alive=False)
+                # A connector error means the request never reached the node
+                if isinstance(e, aiohttp.ClientConnectorError) and failovers < len(self.pool) - 1:
+                    failovers += 1
+                    continue
+                if self.retry_policy.should_retry(retries, idempotent):
+                    await asyncio.sleep(self.retry_policy.delay(retries))
+                    retries += 1
+                    continue
+                raise
+            except BaseException:
+                self.pool.release(node)
+                raise
+            unavailable = status in self.retry_policy.retry_statuses
+            self.pool.release(node, alive=not unavailable)
+            if unavailable and self.retry_policy.should_retry(retries, idempotent):
+                await asyncio.sleep(self.retry_policy.delay(retries))
+                retries += 1
+                continue
+            break
+
+        network_seconds = time.perf_counter() - started
+        content = decode_body(wire_content, response_headers.get("Content-Encoding"))
+        request_size = len(body) if body is not None else 0
+        self.transfer_stats.record(raw_size, request_size, len(content), len(wire_content))
+        operation = current_operation()
+        if operation is not None:
+            operation.add_request(request_size, len(wire_content), network_seconds, is_failure(status))
+        return AioResponse(status, content, response_headers, self.serializer)
+
+    async def sniff(self):
+        """Replace the node list with the HTTP nodes the cluster reports.
+
+        Returns:
+            list: Base URLs discovered, empty if sniffing failed (the node list
+                is then left unchanged)
+        """
+        self._next_sniff = time.monotonic() + self.sniff_interval if self.sniff_interval else None
+        try:
+            node = self.pool.acquire()
+        except NoLiveNodesError:
+            return []
+        alive = True
+        urls = []
+        try:
+            async with self.session.get(f"{node.base_url}/_nodes/http") as response:
+                content = decode_body(await response.read(), response.headers.get("Content-Encoding"))
+                if response.status == 200:
+                    urls = sniffed_urls(self.serializer.loads(content), self.scheme)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            alive = False
+        except ValueError:
+            pass
+        finally:
+            self.pool.release(node, alive)
+        self.pool.set_urls(urls)
+        return urls
+
+    async def close(self):
+        """Close the session and its connector."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
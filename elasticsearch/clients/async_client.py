@@ -1,135 +1,173 @@
 """Asynchronous ElasticSearch client for e-commerce operations."""
 
-import json
-from datetime import datetime
-from requests_futures.sessions import FuturesSession
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from .base_client import BaseElasticClient
-from ..models.query_builders import MatchQuery, MatchPhraseQuery, RangeQuery, TermQuery
-from ..utils.product_generator import format_product_details
+from ..utils.aliases import DEFAULT_INDEX_ALIAS
+from ..utils.instrumentation import instrumented
+from ..utils.output import SILENT
+from ..utils.projection import MSEARCH_FILTER_PATH
+from ..utils.bulk_helpers import (
+    DEFAULT_CHUNK_SIZE, DEFAULT_MAX_CHUNK_BYTES, chunk_actions, price_update_actions, product_index_actions,
+    summarize_bulk_results, update_actions
+)
 
 class AsyncEcommerceClient(BaseElasticClient):
-    """Asynchronous client for e-commerce operations using requests-futures."""
+    """Asynchronous client for e-commerce operations using a worker thread pool."""
     
-    def __init__(self, host='localhost', port=9200, max_workers=10):
+    def __init__(self, host='localhost', port=9200, max_workers=10, transport=None, query_cache=None,
+                 output_mode=SILENT, instrumentation=None, index_alias=DEFAULT_INDEX_ALIAS, read_alias=None,
+                 write_alias=None, **transport_options):
         """Initialize the async ElasticSearch client.
         
         Args:
             host (str): ElasticSearch host (default: localhost)
             port (int): ElasticSearch port (default: 9200)
             max_workers (int): Maximum number of concurrent workers (default: 10)
+            transport (Transport, optional): Shared transport to send requests through
+            query_cache (QueryCache, optional): Search result cache shared with other
+                clients; this client's bulk writes and index changes invalidate it
+            output_mode (str): "silent" (default), "log" to use the logging module,
+                or "display" to print every message and search hit
+            instrumentation (Instrumentation, optional): Collector for per-operation
+                statistics, e.g. one shared with a sync client; a private one is
+                created when omitted
+            index_alias (str): Alias the versioned product indices sit behind
+            read_alias (str, optional): Alias searches go through; index_alias when omitted
+            write_alias (str, optional): Alias bulk writes go through; index_alias when omitted
+            **transport_options: Passed to Transport when one is created; the
+                per-host pool size defaults to max_workers
         """
-        super().__init__(host, port)
-        self.session = FuturesSession(max_workers=max_workers)
+        transport_options.setdefault("pool_maxsize", max_workers)
+        super().__init__(
+            host, port, transport=transport, query_cache=query_cache, output_mode=output_mode,
+            instrumentation=instrumentation, index_alias=index_alias, read_alias=read_alias,
+            write_alias=write_alias, **transport_options
+        )
+        self.max_workers = max_workers
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
         self.futures = []
 
-    def async_bulk_index(self, products_list):
-        """Asynchronously index multiple products.
+    def _submit(self, request):
+        """Submit a request to the worker pool and track its future.
+        
+        The request runs in the caller's context, so it is attributed to the
+        instrumented operation that submitted it.
+        """
+        future = self.executor.submit(contextvars.copy_context().run, self.transport.perform_request, *request)
+        self.futures.append(future)
+        return future
+
+    def _run_on_worker(self, plan):
+        """Run a shared request plan on a worker thread and wait for its result."""
+        return self.executor.submit(contextvars.copy_context().run, self._run, plan).result()
+
+    def close(self):
+        """Shut down the worker pool and release pooled connections."""
+        self.executor.shutdown(wait=True)
+        super().close()
+
+    def _submit_bulk(self, actions, chunk_size, max_chunk_bytes, max_in_flight=None, **retry_options):
+        """Submit size-bounded _bulk chunks with at most max_in_flight pending.
+        
+        Each future resolves to a chunk result dict (see BaseElasticClient._send_bulk_chunk).
+        """
+        max_in_flight = max_in_flight or self.max_workers
+        futures = []
+        in_flight = set()
+        
+        for chunk, body in chunk_actions(actions, chunk_size, max_chunk_bytes, self.transport.serializer):
+            if len(in_flight) >= max_in_flight:
+                _, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            
+            future = self.executor.submit(
+                contextvars.copy_context().run, self._send_bulk_chunk, chunk, body, **retry_options
+            )
+            in_flight.add(future)
+            futures.append(future)
+        
+        self.futures.extend(futures)
+        return futures
+
+    @instrumented
+    def wait_for_bulk(self, futures):
+        """Wait for bulk chunk futures and return their combined summary.
         
         Args:
-            products_list (list): List of product documents to index
+            futures (list): Futures returned by one of the async bulk methods
             
         Returns:
-            Future: Future object for the bulk operation
+            dict: Summary with indexed, retried and failed item counts
         """
-        index_name = "ecommerce_products"
-        url = f"{self.base_url}/_bulk"
+        summary = summarize_bulk_results(future.result() for future in futures)
+        self.output.info(
+            "Bulk operation: %s succeeded, %s retried, %s failed",
+            summary["indexed"], summary["retried"], summary["failed"]
+        )
+        return summary
+
+    @instrumented
+    def async_bulk_index(self, products_list, chunk_size=DEFAULT_CHUNK_SIZE,
+                         max_chunk_bytes=DEFAULT_MAX_CHUNK_BYTES, max_in_flight=None, index=None,
+                         **retry_options):
+        """Asynchronously index multiple products in size-bounded chunks.
         
-        # Prepare bulk request body
-        bulk_body = ""
-        for product in products_list:
-            # Add timestamps if not present
-            if "CreatedTime" not in product:
-                product["CreatedTime"] = datetime.now().isoformat()
-            if "UpdatedTime" not in product:
-                product["UpdatedTime"] = datetime.now().isoformat()
+        Args:
+            products_list (iterable): Product documents to index
+            chunk_size (int): Maximum number of products per _bulk request
+            max_chunk_bytes (int): Maximum body size in bytes per _bulk request
+            max_in_flight (int, optional): Maximum pending chunks before submission
+                blocks (default: max_workers)
+            index (str, optional): Index or alias to write to; the write alias by default
+            **retry_options: max_retries, initial_backoff, max_backoff for 429 rejections
             
-            # Add action metadata
-            action = {"index": {"_index": index_name}}
-            bulk_body += json.dumps(action) + "\n"
-            bulk_body += json.dumps(product) + "\n"
-        
-        # Submit async request
-        future = self.session.post(
-            url,
-            headers={"Content-Type": "application/x-ndjson"},
-            data=bulk_body
-        )
-        self.futures.append(future)
-        return future
+        Returns:
+            list: Future objects, one per _bulk chunk, resolving to chunk results
+        """
+        index_name = self._write_target(index)
+        actions = product_index_actions(products_list, index_name)
+        return self._submit_bulk(actions, chunk_size, max_chunk_bytes, max_in_flight, **retry_options)
 
-    def async_multi_search(self, query_builders):
+    @instrumented
+    def async_multi_search(self, query_builders, fields=None, exclude=None, filter_path=MSEARCH_FILTER_PATH,
+                           index=None):
         """Perform multiple searches concurrently.
         
         Args:
             query_builders (list): List of query builder objects
+            fields (list, optional): Source fields to return; all fields when omitted
+            exclude (list, optional): Source fields to leave out
+            filter_path (str): Response filter applied by ElasticSearch
+            index (str, optional): Index or alias to read from; the read alias by default
             
         Returns:
             list: List of Future objects for each search
         """
-        index_name = "ecommerce_products"
-        url = f"{self.base_url}/{index_name}/_msearch"
-        
-        # Prepare multi-search request body
-        search_body = ""
-        for query_builder in query_builders:
-            # Add index header
-            search_body += json.dumps({"index": index_name}) + "\n"
-            # Add search query
-            search_body += json.dumps({"query": query_builder.to_dict()}) + "\n"
-        
-        # Submit async request
-        future = self.session.post(
-            url,
-            headers={"Content-Type": "application/x-ndjson"},
-            data=search_body
-        )
-        self.futures.append(future)
-        return future
+        return self._submit(self._msearch_request(query_builders, fields, exclude, filter_path, index))
 
-    def async_batch_updates(self, updates_list):
+    @instrumented
+    def async_batch_updates(self, updates_list, chunk_size=DEFAULT_CHUNK_SIZE,
+                            max_chunk_bytes=DEFAULT_MAX_CHUNK_BYTES, max_in_flight=None, index=None,
+                            **retry_options):
         """Perform multiple update operations concurrently.
         
         Args:
-            updates_list (list): List of dicts with product_id and update_data
+            updates_list (iterable): Dicts with product_id and update_data
+            chunk_size (int): Maximum number of updates per _bulk request
+            max_chunk_bytes (int): Maximum body size in bytes per _bulk request
+            max_in_flight (int, optional): Maximum pending chunks before submission
+                blocks (default: max_workers)
+            index (str, optional): Index or alias to write to; the write alias by default
+            **retry_options: max_retries, initial_backoff, max_backoff for 429 rejections
             
         Returns:
-            list: List of Future objects for each update
+            list: Future objects, one per _bulk chunk, resolving to chunk results
         """
-        index_name = "ecommerce_products"
-        url = f"{self.base_url}/_bulk"
-        
-        # Prepare bulk request body
-        bulk_body = ""
-        for update in updates_list:
-            product_id = update["product_id"]
-            update_data = update["update_data"]
-            
-            # Add update timestamp
-            update_data["UpdatedTime"] = datetime.now().isoformat()
-            
-            # Create update action
-            action = {
-                "update": {
-                    "_index": index_name,
-                    "_id": product_id
-                }
-            }
-            
-            # Create update document
-            doc = {"doc": update_data}
-            
-            bulk_body += json.dumps(action) + "\n"
-            bulk_body += json.dumps(doc) + "\n"
-        
-        # Submit async request
-        future = self.session.post(
-            url,
-            headers={"Content-Type": "application/x-ndjson"},
-            data=bulk_body
-        )
-        self.futures.append(future)
-        return future
+        index_name = self._write_target(index)
+        actions = update_actions(updates_list, index_name)
+        return self._submit_bulk(actions, chunk_size, max_chunk_bytes, max_in_flight, **retry_options)
 
+    @instrumented
     def wait_for_all_operations(self):
         """Wait for all async operations to complete and return results.
         
@@ -140,122 +178,76 @@ class AsyncEcommerceClient(BaseElasticClient):
         for future in self.futures:
             try:
                 response = future.result()
-                if response.status_code in (200, 201):
+                if isinstance(response, dict):
+                    # Bulk chunk futures resolve to per-item result summaries
+                    results.append(response)
+                elif response.status_code in (200, 201):
                     results.append(response.json())
                 else:
-                    print(f"Operation failed: {response.text}")
+                    self.output.error("Operation failed: %s", response.text)
                     results.append(None)
             except Exception as e:
-                print(f"Error in async operation: {str(e)}")
+                self.output.error("Error in async operation: %s", e)
                 results.append(None)
         
         # Clear futures list
         self.futures = []
         return results
 
-    def async_search_by_criteria(self, criteria_list):
-        """Perform multiple searches based on different criteria concurrently.
+    @instrumented
+    def async_search_by_criteria(self, criteria_list, fields=None, exclude=None, index=None):
+        """Search for products matching all of the given criteria.
+        
+        The criteria are compiled into one bool query in filter context (see
+        CriteriaQuery), so the search is a single request, its filters are
+        cacheable by ElasticSearch and every product is returned once.
         
         Args:
-            criteria_list (list): List of dicts with search criteria
+            criteria_list (list or dict): Search criteria dicts
+            fields (list, optional): Source fields to return; all fields when omitted
+            exclude (list, optional): Source fields to leave out
+            index (str, optional): Index or alias to read from; the read alias by default
             
         Returns:
-            list: Combined results from all searches
+            list: Products matching every criterion
         """
-        query_builders = []
-        
-        for criteria in criteria_list:
-            if "name" in criteria:
-                if criteria.get("fuzzy", False):
-                    query_builders.append(MatchQuery("Name.text", criteria["name"], "AUTO"))
-                else:
-                    query_builders.append(MatchPhraseQuery("Name.text", criteria["name"]))
-            
-            elif "price_range" in criteria:
-                min_price = criteria["price_range"].get("min")
-                max_price = criteria["price_range"].get("max")
-                query_builders.append(RangeQuery("Price", gte=min_price, lte=max_price))
-            
-            elif "category" in criteria:
-                query_builders.append(TermQuery("Category", criteria["category"]))
-            
-            elif "brand" in criteria:
-                query_builders.append(TermQuery("Brand", criteria["brand"]))
-            
-            elif "min_rating" in criteria:
-                query_builders.append(RangeQuery("Rating", gte=criteria["min_rating"]))
-            
-            elif "min_stock" in criteria:
-                query_builders.append(RangeQuery("StockQty", gte=criteria["min_stock"]))
+        plan = self._search_by_criteria(criteria_list, fields=fields, exclude=exclude, index=index)
+        return self._run_on_worker(plan)
+
+    @instrumented
+    def async_facets(self, query=None, index=None, **facet_options):
+        """Count products per facet on a worker thread in one size=0 request.
         
-        # Perform multi-search
-        future = self.async_multi_search(query_builders)
-        response = future.result()
+        See EcommerceElasticClient.facets.
         
-        if response.status_code == 200:
-            results = response.json()
-            all_products = []
-            
-            # Process each search result
-            for result in results.get("responses", []):
-                hits = result.get("hits", {}).get("hits", [])
-                products = [hit["_source"] for hit in hits]
-                all_products.extend(products)
-            
-            # Remove duplicates based on ID
-            unique_products = {p["ID"]: p for p in all_products}.values()
-            
-            print(f"\nFound {len(unique_products)} unique products matching criteria")
-            for product in unique_products:
-                print(format_product_details(product))
+        Args:
+            query (optional): Query builder or Query DSL dict restricting the counted products
+            index (str, optional): Index or alias to read from; the read alias by default
+            **facet_options: terms_fields, terms_size, price_ranges, rating_interval
             
-            return list(unique_products)
-        else:
-            print(f"Multi-search failed: {response.text}")
-            return []
+        Returns:
+            dict: total plus compact buckets per facet, or None if the request failed
+        """
+        return self._run_on_worker(self._facets(query, index, **facet_options))
 
-    def async_bulk_price_updates(self, price_adjustments):
+    @instrumented
+    def async_bulk_price_updates(self, price_adjustments, chunk_size=DEFAULT_CHUNK_SIZE,
+                                 max_chunk_bytes=DEFAULT_MAX_CHUNK_BYTES, max_in_flight=None, index=None,
+                                 **retry_options):
         """Asynchronously update prices for multiple products.
         
         Args:
-            price_adjustments (list): List of dicts with product_id and new_price
+            price_adjustments (iterable): Dicts with product_id and new_price
+            chunk_size (int): Maximum number of updates per _bulk request
+            max_chunk_bytes (int): Maximum body size in bytes per _bulk request
+            max_in_flight (int, optional): Maximum pending chunks before submission
+                blocks (default: max_workers)
+            index (str, optional): Index or alias to write to; the write alias by default
+            **retry_options: max_retries, initial_backoff, max_backoff for 429 rejections
             
         Returns:
-            Future: Future object for the bulk operation
+            list: Future objects, one per _bulk chunk, resolving to chunk results
         """
-        index_name = "ecommerce_products"
-        url = f"{self.base_url}/_bulk"
-        
-        # Prepare bulk request body
-        bulk_body = ""
-        for adjustment in price_adjustments:
-            product_id = adjustment["product_id"]
-            new_price = adjustment["new_price"]
-            
-            # Create update action
-            action = {
-                "update": {
-                    "_index": index_name,
-                    "_id": product_id
-                }
-            }
-            
-            # Create update document
-            doc = {
-                "doc": {
-                    "Price": new_price,
-                    "UpdatedTime": datetime.now().isoformat()
-                }
-            }
-            
-            bulk_body += json.dumps(action) + "\n"
-            bulk_body += json.dumps(doc) + "\n"
-        
-        # Submit async request
-        future = self.session.post(
-            url,
-            headers={"Content-Type": "application/x-ndjson"},
-            data=bulk_body
-        )
-        self.futures.append(future)
-        return future 
\ No newline at end of file
+        index_name = self._write_target(index)
+        actions = price_update_actions(price_adjustments, index_name)
+        return self._submit_bulk(actions, chunk_size, max_chunk_bytes, max_in_flight, **retry_options)
@@ -1,164 +1,234 @@
 """Base ElasticSearch client class."""
 
-import requests
-import json
-from datetime import datetime
-from elasticsearch.models.query_builders import MatchQuery, MatchPhraseQuery, RangeQuery, TermQuery
-from ..utils.product_generator import format_product_details
-
-class BaseElasticClient:
-    """Base class for ElasticSearch clients."""
+import time
+from contextlib import contextmanager
+# PRODUCT_INDEX_MAPPINGS and ClientCommon are re-exported from their old home
+from .operations import PRODUCT_INDEX_MAPPINGS, ClientCommon, PointInTimeScan, ProductOperations, Sleep
+from .transport import Transport
+from ..utils.aliases import DEFAULT_INDEX_ALIAS
+from ..utils.columns import DEFAULT_COLUMNS, product_columns
+from ..utils.instrumentation import instrumented
+from ..utils.output import SILENT
+from ..utils.pagination import DEFAULT_KEEP_ALIVE, DEFAULT_PAGE_SIZE
+from ..utils.bulk_helpers import DEFAULT_INITIAL_BACKOFF, DEFAULT_MAX_BACKOFF, DEFAULT_MAX_RETRIES
+
+class BaseElasticClient(ProductOperations):
+    """Base class for ElasticSearch clients.
+
+    Runs the request plans shared with AioEcommerceClient (see
+    elasticsearch.clients.operations) with blocking transport calls.
+    """
     
-    def __init__(self, host='localhost', port=9200):
+    def __init__(self, host='localhost', port=9200, transport=None, query_cache=None, output_mode=SILENT,
+                 instrumentation=None, index_alias=DEFAULT_INDEX_ALIAS, read_alias=None, write_alias=None,
+                 **transport_options):
         """Initialize the ElasticSearch client.
         
         Args:
             host (str): ElasticSearch host (default: localhost)
             port (int): ElasticSearch port (default: 9200)
+            transport (Transport, optional): Shared transport to send requests through;
+                a new pooled transport is created when omitted
+            query_cache (QueryCache, optional): Opt-in search result cache, invalidated
+                whenever this client writes to the index
+            output_mode (str): "silent" (default), "log" to use the logging module,
+                or "display" to print every message and search hit
+            instrumentation (Instrumentation, optional): Collector for per-operation
+                statistics; a private one is created when omitted
+            index_alias (str): Alias the versioned product indices sit behind
+                (default: ecommerce_products)
+            read_alias (str, optional): Alias searches and lookups go through;
+                index_alias when omitted
+            write_alias (str, optional): Alias indexing, updates and bulk writes
+                go through; index_alias when omitted
+            **transport_options: Passed to Transport (hosts, selector, timeout,
+                retry_policy, failure_threshold, dead_timeout, sniff_on_start,
+                pool_maxsize, serializer, http_compress, ...)
         """
-        self.base_url = f"http://{host}:{port}"
-        self.headers = {"Content-Type": "application/json"}
-        self.check_connection()
+        self._configure(
+            transport or Transport(host, port, **transport_options), output_mode, instrumentation,
+            index_alias, read_alias, write_alias, query_cache
+        )
+        self.headers = self.transport.headers
+
+    def close(self):
+        """Release the pooled connections held by the transport."""
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
-    def check_connection(self):
-        """Check if ElasticSearch is available and log the connection status."""
+    @staticmethod
+    def _operation_method(plan_name):
+        """Build the blocking public method that runs a shared plan."""
+        def method(self, *args, **kwargs):
+            return self._run(getattr(self, plan_name)(*args, **kwargs))
+        return method
+
+    def _perform(self, step):
+        """Send one plan step and return its response(s)."""
+        if isinstance(step, Sleep):
+            return time.sleep(step.seconds)
+        if isinstance(step, list):
+            return [self.transport.perform_request(*request) for request in step]
+        return self.transport.perform_request(*step)
+
+    def _run(self, plan):
+        """Drive a request plan with blocking transport calls and return its result."""
         try:
-            response = requests.get(self.base_url, headers=self.headers)
-            
-            if response.status_code == 200:
-                version = response.json()['version']['number']
-                print(f"Connected successfully to version {version}")
-                return True
-            else:
-                print(f"Failed to connect to ElasticSearch: {response.text}")
-                return False
-        except Exception as e:
-            print(f"Error connecting to ElasticSearch: {str(e)}")
-            return False
-
-    def create_index(self, index_name, mappings=None):
-        """Create an ElasticSearch index with optional mappings.
+            step = next(plan)
+            while True:
+                try:
+                    result = self._perform(step)
+                except Exception as error:
+                    step = plan.throw(error)
+                else:
+                    step = plan.send(result)
+        except StopIteration as stop:
+            return stop.value
+
+    @contextmanager
+    def bulk_load(self, index_name=None, settings=None, force_merge=False, max_num_segments=1):
+        """Apply ingest-optimized settings for the duration of a bulk load.
+
+        Refreshes are disabled and replicas dropped while the block runs. On
+        exit the original settings are restored, even if the block raised,
+        and the index is refreshed. After a successful load the index can
+        also be force merged.
+
+        Args:
+            index_name (str, optional): Index or alias being loaded; the write alias by default
+            settings (dict, optional): Settings to apply during the load;
+                BULK_LOAD_SETTINGS by default
+            force_merge (bool): Force merge after a successful load
+            max_num_segments (int): Segments per shard for the force merge
+
+        Yields:
+            BaseElasticClient: This client
+
+        Raises:
+            RuntimeError: If the ingest settings could not be read or applied
+        """
+        index_name = self._write_target(index_name)
+        original = self.begin_bulk_load(index_name, settings)
+
+        try:
+            yield self
+        finally:
+            self.end_bulk_load(index_name, original)
+
+        if force_merge:
+            self.force_merge(index_name, max_num_segments)
+
+    @instrumented
+    def scan_point_in_time(self, pit_id, query=None, page_size=DEFAULT_PAGE_SIZE, sort=None,
+                           keep_alive=DEFAULT_KEEP_ALIVE, slice_id=None, max_slices=None, fields=None,
+                           exclude=None):
+        """Page through an already open point in time, one page at a time.
         
         Args:
-            index_name (str): Name of the index to create
-            mappings (dict, optional): Index mappings/schema definition
+            pit_id (str): Point-in-time ID
+            query (dict, optional): Query DSL clause; matches everything when omitted
+            page_size (int): Number of hits fetched per request
+            sort (list, optional): Stable sort; defaults to ID with a shard tiebreaker
+            keep_alive (str): How long to keep the point in time open between pages
+            slice_id (int, optional): Slice to read when several readers share the PIT
+            max_slices (int, optional): Total number of slices
+            fields (list, optional): Source fields to return
+            exclude (list, optional): Source fields to leave out
+            
+        Yields:
+            tuple: (list of hits, current point-in-time ID) per page
+            
+        Raises:
+            RuntimeError: If a page request fails, so callers never mistake a
+                partial scan for a complete one
         """
-        url = f"{self.base_url}/{index_name}"
-        response = requests.head(url, headers=self.headers)
-        if response.status_code == 200:
-            print(f"Index {index_name} already exists")
-            return True
-
-        body = {}
-        if mappings:
-            body["mappings"] = mappings
-
-        response = requests.put(url, headers=self.headers, data=json.dumps(body) if body else None)
-
-        if response.status_code in (200, 201):
-            print(f"Created index {index_name}")
-            return True
-        else:
-            print(f"Failed to create index {index_name}: {response.text}")
-            return False
-
-    def create_product_index(self):
-        """Create the main products index with proper mappings.
+        scan = PointInTimeScan(pit_id, query, page_size, sort, keep_alive, slice_id, max_slices, fields, exclude)
+        while not scan.done:
+            hits = scan.read(self.transport.perform_request(*scan.request()))
+            yield hits, scan.pit_id
+
+    @instrumented
+    def scan_products(self, query=None, page_size=DEFAULT_PAGE_SIZE, sort=None,
+                      keep_alive=DEFAULT_KEEP_ALIVE, fields=None, exclude=None, index=None):
+        """Lazily page through every product matching a query.
         
-        Returns:
-            bool: True if index was created successfully, False otherwise
+        Uses a point in time plus search_after on a stable sort, so client
+        memory stays at one page and the cluster never does deep from/size
+        pagination. The point in time is closed when the generator finishes
+        or is closed early.
+        
+        Args:
+            query (dict, optional): Query DSL clause; matches everything when omitted
+            page_size (int): Number of hits fetched per request
+            sort (list, optional): Stable sort; defaults to ID with a shard tiebreaker
+            keep_alive (str): How long to keep the point in time open between pages
+            fields (list, optional): Source fields to return
+            exclude (list, optional): Source fields to leave out
+            index (str, optional): Index or alias to read from; the read alias by default
+            
+        Yields:
+            dict: Product source documents
+            
+        Raises:
+            RuntimeError: If the point in time cannot be opened or a page request
+                fails, so a truncated stream is never mistaken for a complete one
         """
-        index_name = "ecommerce_products"
-        mappings = {
-            "properties": {
-                "ID": {"type": "integer"},
-                "Name": {
-                    "type": "text",    # For full-text search
-                    "fields": {
-                        "keyword": {    # Sub-field for exact matching
-                            "type": "keyword"
-                        }
-                    }
-                },
-                "Description": {"type": "text"},
-                "Category": {"type": "keyword"},
-                "Subcategory": {"type": "keyword"},
-                "Price": {"type": "float"},
-                "StockQty": {"type": "integer"},
-                "Brand": {"type": "keyword"},
-                "CreatedTime": {"type": "date"},
-                "UpdatedTime": {"type": "date"},
-                "Rating": {
-                    "type": "float",
-                    "minimum": 0,
-                    "maximum": 5
-                },
-                "Active": {"type": "boolean"}
-            }
-        }
+        index_name = self._read_target(index)
+        pit_id = self.open_point_in_time(index_name, keep_alive)
+        if pit_id is None:
+            raise RuntimeError(f"Could not open a point in time on {index_name}")
         
-        return self.create_index(index_name, mappings)
+        try:
+            pages = self.scan_point_in_time(
+                pit_id, query, page_size, sort, keep_alive, fields=fields, exclude=exclude
+            )
+            for hits, pit_id in pages:
+                for hit in hits:
+                    yield hit["_source"]
+        finally:
+            self.close_point_in_time(pit_id)
 
-    def delete_product_index(self):
-        """Delete the products index (use with caution).
+    @instrumented
+    def search_columns(self, query=None, columns=DEFAULT_COLUMNS, page_size=DEFAULT_PAGE_SIZE, index=None):
+        """Collect every matching product into compact columns for analytics.
+        
+        Pages through all matches like scan_products, fetching only the
+        requested fields, and appends each page to typed column buffers, so
+        only one page of source dicts exists at a time. Needs numpy.
         
+        Args:
+            query (optional): Query builder (anything with to_dict()) or Query DSL
+                dict; matches everything when omitted
+            columns (iterable): Columns to collect (see utils.columns.DEFAULT_COLUMNS)
+            page_size (int): Hits fetched per request
+            index (str, optional): Index or alias to read from; the read alias by default
+            
         Returns:
-            bool: True if index was deleted successfully, False otherwise
+            ProductColumns: NumPy arrays for ID, Price, StockQty and Rating, and
+                interned strings for Category, Subcategory and Brand
+
+        Raises:
+            RuntimeError: If a page cannot be fetched; no partial result is returned
         """
-        index_name = "ecommerce_products"
-        url = f"{self.base_url}/{index_name}"
-        
+        if hasattr(query, "to_dict"):
+            query = query.to_dict()
+        products = self.scan_products(query, page_size, fields=list(columns), index=index)
         try:
-            response = requests.delete(url, headers=self.headers)
-            
-            if response.status_code == 200:
-                print(f"Successfully deleted index {index_name}")
-                return True
-            elif response.status_code == 404:
-                print(f"Index {index_name} does not exist")
-                return False
-            else:
-                print(f"Failed to delete index {index_name}: {response.text}")
-                return False
-        except Exception as e:
-            print(f"Error deleting index {index_name}: {str(e)}")
-            return False
-
-    def check_index_health(self):
-        """Check the health and status of the products index.
+            return product_columns(products, columns)
+        finally:
+            products.close()
+
+    def _send_bulk_chunk(self, chunk, body, max_retries=DEFAULT_MAX_RETRIES,
+                         initial_backoff=DEFAULT_INITIAL_BACKOFF, max_backoff=DEFAULT_MAX_BACKOFF):
+        """Send one _bulk chunk and wait for it; see ProductOperations._bulk_chunk.
         
         Returns:
-            dict: Dictionary containing index health information
+            dict: Chunk result with count, ok, took, indexed, retried, failed
+                and failed_items
         """
-        index_name = "ecommerce_products"
-        url = f"{self.base_url}/{index_name}/_stats"
-        
-        try:
-            response = requests.get(url, headers=self.headers)
-            
-            if response.status_code == 200:
-                stats = response.json()
-                index_stats = stats['indices'][index_name]
-                
-                health_url = f"{self.base_url}/_cluster/health/{index_name}"
-                health_response = requests.get(health_url, headers=self.headers)
-                health_info = health_response.json() if health_response.status_code == 200 else {}
-                
-                health_data = {
-                    "status": health_info.get("status", "unknown"),
-                    "number_of_shards": health_info.get("number_of_shards", 0),
-                    "number_of_replicas": health_info.get("number_of_replicas", 0),
-                    "active_shards": health_info.get("active_shards", 0),
-                    "unassigned_shards": health_info.get("unassigned_shards", 0),
-                    "document_count": index_stats.get("total", {}).get("docs", {}).get("count", 0)
-                }
-                
-                print(f"Index health check results for {index_name}:")
-                print(json.dumps(health_data, indent=2))
-                return health_data
-            else:
-                print(f"Failed to get index stats: {response.text}")
-                return None
-        except Exception as e:
-            print(f"Error checking index health: {str(e)}")
-            return None 
\ No newline at end of file
+        return self._run(self._bulk_chunk(chunk, body, max_retries, initial_backoff, max_backoff))
@@ -0,0 +1,1404 @@
+"""Request plans shared by the synchronous and asyncio clients.
+
+A plan is a generator method that yields the requests an operation needs
+and is sent back each response; whatever it returns is the operation's
+result. Plans never do I/O themselves, so one implementation serves both
+clients: BaseElasticClient runs them with blocking calls and
+AioEcommerceClient awaits them. A plan can also yield:
+
+- a list of Requests, sent together (concurrently on the asyncio client),
+  and is sent back the list of responses
+- Sleep(seconds), e.g. between retries or task polls
+
+Transport exceptions are thrown back into the plan at the yield, so its
+usual try/except handling applies. Plans call each other with yield from.
+
+Plans decorated with @operation are exposed by every client as a public
+method named without the leading underscore, e.g. _create_index becomes
+create_index.
+"""
+
+import functools
+from collections import namedtuple
+from ..models.query_builders import CriteriaQuery, MatchQuery, MatchPhraseQuery, RangeQuery, TermQuery
+from ..utils.aliases import (
+    alias_definitions, alias_map, create_index_body, latest_index, legacy_indices, next_index_version,
+    swap_alias_actions, versioned_index_name
+)
+from ..utils.documents import prepare_product, upsert_body
+from ..utils.facets import FACETS_FILTER_PATH, facet_body, parse_facets
+from ..utils.index_settings import BULK_LOAD_SETTINGS, FORCE_MERGE_TIMEOUT, current_settings
+from ..utils.instrumentation import Instrumentation, instrumented
+from ..utils.mget import DEFAULT_MGET_BATCH_SIZE, id_batches, mget_sources
+from ..utils.output import ClientOutput
+from ..utils.pagination import DEFAULT_KEEP_ALIVE, DEFAULT_PAGE_SIZE, build_page_body, scan_page
+from ..utils.projection import (
+    MGET_FILTER_PATH, MSEARCH_FILTER_PATH, SCAN_FILTER_PATH, SEARCH_FILTER_PATH, apply_source_filter,
+    doc_params, hit_sources, msearch_body
+)
+from ..utils.reindex import (
+    DEFAULT_POLL_INTERVAL, reindex_body, reindex_failures, reindex_params, reindex_summary, task_progress
+)
+from ..utils.resilience import DEFAULT_CONNECT_TIMEOUT, bulk_is_idempotent
+from ..utils.server_info import cached_server_info, parse_version, store_server_info
+from ..utils.bulk_helpers import (
+    DEFAULT_INITIAL_BACKOFF, DEFAULT_MAX_BACKOFF, DEFAULT_MAX_RETRIES, NDJSON_HEADERS, backoff_delay,
+    build_bulk_body, finish_chunk_result, new_chunk_result, record_bulk_error, record_bulk_response,
+    record_retry
+)
+
+PRODUCT_INDEX_MAPPINGS = {
+    "properties": {
+        "ID": {"type": "integer"},
+        "Name": {
+            "type": "text",    # For full-text search
+            "fields": {
+                "keyword": {    # Sub-field for exact matching
+                    "type": "keyword"
+                }
+            }
+        },
+        "Description": {"type": "text"},
+        "Category": {"type": "keyword"},
+        "Subcategory": {"type": "keyword"},
+        "Price": {"type": "float"},
+        "StockQty": {"type": "integer"},
+        "Brand": {"type": "keyword"},
+        "CreatedTime": {"type": "date"},
+        "UpdatedTime": {"type": "date"},
+        "Rating": {
+            "type": "float",
+            "minimum": 0,
+            "maximum": 5
+        },
+        "Active": {"type": "boolean"}
+    }
+}
+
+# One HTTP request of a plan, in Transport.perform_request argument order
+Request = namedtuple(
+    "Request", ["method", "path", "body", "params", "headers", "timeout", "idempotent"],
+    defaults=(None, None, None, None, None)
+)
+
+# Pause a plan without blocking the event loop on the asyncio client
+Sleep = namedtuple("Sleep", ["seconds"])
+
+def operation(plan):
+    """Mark a plan as a public client operation.
+
+    Args:
+        plan (function): Generator method whose name starts with an underscore
+
+    Returns:
+        function: The same plan, tagged with the public method name
+    """
+    plan.operation = plan.__name__.lstrip("_")
+    return plan
+
+class PointInTimeScan:
+    """search_after paging state over an open point in time.
+
+    request() builds the next page request; read(response) checks the page,
+    advances the cursor and returns its hits. done is True once the last
+    page has been read.
+    """
+
+    def __init__(self, pit_id, query=None, page_size=DEFAULT_PAGE_SIZE, sort=None,
+                 keep_alive=DEFAULT_KEEP_ALIVE, slice_id=None, max_slices=None, fields=None, exclude=None):
+        """Initialize the scan; see build_page_body for the arguments."""
+        self.pit_id = pit_id
+        self.query = query
+        self.page_size = page_size
+        self.sort = sort
+        self.keep_alive = keep_alive
+        self.slice_id = slice_id
+        self.max_slices = max_slices
+        self.fields = fields
+        self.exclude = exclude
+        self.search_after = None
+        self.done = False
+
+    def request(self):
+        """Return the Request for the next page."""
+        body = build_page_body(
+            self.query, self.pit_id, self.page_size, self.sort, self.search_after, self.keep_alive,
+            self.slice_id, self.max_slices, self.fields, self.exclude
+        )
+        return Request("POST", "/_search", body=body, params={"filter_path": SCAN_FILTER_PATH})
+
+    def read(self, response):
+        """Read one page response and move the cursor past it.
+
+        Args:
+            response: Transport response to the last request()
+
+        Returns:
+            list: Hits of the page
+
+        Raises:
+            RuntimeError: If the page request failed
+        """
+        hits, self.pit_id, self.search_after = scan_page(response, self.page_size, self.pit_id)
+        self.done = self.search_after is None
+        return hits
+
+class ClientCommon:
+    """Configuration and bookkeeping shared by the synchronous and asyncio clients."""
+
+    def _configure(self, transport, output_mode, instrumentation, index_alias, read_alias, write_alias,
+                   query_cache=None):
+        """Set the attributes every client has; called from __init__."""
+        self.transport = transport
+        self.base_url = transport.base_url
+        self.output = ClientOutput(output_mode)
+        self.instrumentation = instrumentation or Instrumentation()
+        self.index_alias = index_alias
+        self.read_alias = read_alias or index_alias
+        self.write_alias = write_alias or index_alias
+        self.query_cache = query_cache
+
+    def transfer_stats(self):
+        """Return raw versus on-the-wire byte counters for this client's transport.
+
+        Returns:
+            dict: Request/response raw and wire bytes, saved_bytes and compression_ratio
+        """
+        return self.transport.transfer_stats.snapshot()
+
+    def stats(self):
+        """Return per-operation request statistics.
+
+        Returns:
+            dict: Operation name -> count, errors, latency_ms (p50/p95/p99/mean/max),
+                request/response bytes, server_took_ms, network_ms and client_overhead_ms
+        """
+        return self.instrumentation.stats()
+
+    def _read_target(self, index=None):
+        """Index or alias to read from: the per-call index or the read alias."""
+        return index or self.read_alias
+
+    def _write_target(self, index=None):
+        """Index or alias to write to: the per-call index or the write alias."""
+        return index or self.write_alias
+
+    def _invalidate_query_cache(self):
+        """Drop cached search results after a write through this client."""
+        if self.query_cache is not None:
+            self.query_cache.invalidate()
+
+    def _report_bulk_summary(self, summary, operation):
+        """Report a bulk summary and return it."""
+        self.output.info(
+            "%s: %s succeeded, %s retried, %s failed",
+            operation, summary["indexed"], summary["retried"], summary["failed"]
+        )
+        for failure in summary["failed_items"][:10]:
+            self.output.error("  Failed item: %s", failure)
+        hidden = len(summary["failed_items"][10:]) + summary["omitted_failed_items"]
+        if hidden:
+            self.output.error("  ... and %s more failed items", hidden)
+        return summary
+
+class ProductOperations(ClientCommon):
+    """Request plans for every operation the synchronous and asyncio clients share.
+
+    A client class that defines _operation_method(plan_name) gets one
+    instrumented public method per @operation plan, unless it defines that
+    method itself; subclasses of such a client inherit the methods.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "_operation_method" not in vars(cls):
+            return
+        for plan_name in dir(cls):
+            plan = getattr(cls, plan_name)
+            name = getattr(plan, "operation", None)
+            if name is None or name in vars(cls):
+                continue
+            method = functools.update_wrapper(cls._operation_method(plan_name), plan, updated=())
+            method.__name__ = name
+            method.__qualname__ = f"{cls.__name__}.{name}"
+            setattr(cls, name, instrumented(method))
+
+    @operation
+    def _server_info(self, refresh=False):
+        """Return the cluster's root endpoint (GET /) response.
+
+        The host is probed on first use only; the answer is cached for the
+        process and shared by every client talking to the same host.
+        Failed probes are not cached.
+
+        Args:
+            refresh (bool): Probe the host again even if its answer is cached
+
+        Returns:
+            dict: Cluster name, UUID and version details, or None if the cluster
+                could not be reached
+        """
+        if not refresh:
+            info = cached_server_info(self.base_url)
+            if info is not None:
+                return info
+
+        try:
+            response = yield Request("GET", "/")
+
+            if response.status_code == 200:
+                info = response.json()
+                store_server_info(self.base_url, info)
+                self.output.info("Connected successfully to version %s", info['version']['number'])
+                return info
+            else:
+                self.output.error("Failed to connect to ElasticSearch: %s", response.text)
+                return None
+        except Exception as e:
+            self.output.error("Error connecting to ElasticSearch: %s", e)
+            return None
+
+    @operation
+    def _server_version(self, refresh=False):
+        """Return the server version for feature gating, e.g. (8, 11, 1).
+
+        Args:
+            refresh (bool): Probe the host again even if its answer is cached
+
+        Returns:
+            tuple: Version components, or None if the cluster could not be reached
+        """
+        info = yield from self._server_info(refresh)
+        return parse_version(info["version"]["number"]) if info else None
+
+    @operation
+    def _check_connection(self, refresh=False):
+        """Check if ElasticSearch is available.
+
+        Args:
+            refresh (bool): Probe the host again even if its answer is cached
+
+        Returns:
+            bool: True if the cluster answered, False otherwise
+        """
+        info = yield from self._server_info(refresh)
+        return info is not None
+
+    @operation
+    def _create_index(self, index_name, mappings=None, aliases=None):
+        """Create an ElasticSearch index with optional mappings.
+
+        Args:
+            index_name (str): Name of the index to create
+            mappings (dict, optional): Index mappings/schema definition
+            aliases (dict, optional): Aliases to point at the new index
+
+        Returns:
+            bool: True if the index exists or was created, False otherwise
+        """
+        path = f"/{index_name}"
+        response = yield Request("HEAD", path)
+        if response.status_code == 200:
+            self.output.info("Index %s already exists", index_name)
+            return True
+
+        response = yield Request("PUT", path, body=create_index_body(mappings, aliases))
+
+        if response.status_code in (200, 201):
+            self.output.info("Created index %s", index_name)
+            return True
+        else:
+            self.output.error("Failed to create index %s: %s", index_name, response.text)
+            return False
+
+    @operation
+    def _get_index_aliases(self, target):
+        """Resolve an index, alias or wildcard pattern to concrete indices.
+
+        Args:
+            target (str): Index name, alias or pattern such as ecommerce_products-v*
+
+        Returns:
+            dict: Concrete index name -> list of its aliases; empty if nothing
+                matches, None if the lookup failed
+        """
+        try:
+            response = yield Request("GET", f"/{target}/_alias")
+
+            if response.status_code == 200:
+                return alias_map(response.json())
+            elif response.status_code == 404:
+                return {}
+            else:
+                self.output.error("Failed to resolve %s: %s", target, response.text)
+                return None
+        except Exception as e:
+            self.output.error("Error resolving %s: %s", target, e)
+            return None
+
+    @operation
+    def _create_product_index(self, version=None, attach_aliases=True, mappings=None):
+        """Create a versioned products index with proper mappings.
+
+        The concrete index is named <index_alias>-v<version> and, with
+        attach_aliases, the read and write aliases point at it. Pass
+        attach_aliases=False to build a new version off to the side
+        without touching live traffic.
+
+        Args:
+            version (int, optional): Version to create; when omitted the index
+                already behind the read alias is kept, or the next free version
+                is created
+            attach_aliases (bool): Point the read and write aliases at the new index
+            mappings (dict, optional): Mappings for the new index; PRODUCT_INDEX_MAPPINGS by default
+
+        Returns:
+            str: Name of the concrete index, or None if it could not be created.
+                A pre-alias concrete index named like the read or write alias is
+                returned as is when no version is requested (see reindex_products).
+        """
+        if attach_aliases:
+            current = yield from self._aliased_indices()
+            if current is None:
+                return None
+            legacy = legacy_indices(current, self.read_alias, self.write_alias)
+            if legacy:
+                # The aliases cannot be created while an index holds their name
+                self.output.info(
+                    "Index %s predates versioned indices; run reindex_products to move it behind aliases",
+                    legacy[0]
+                )
+                if version is not None:
+                    self.output.error("Cannot point the aliases at a new index while %s exists", legacy[0])
+                    return None
+                return legacy[0]
+            if current and version is None:
+                index_name = latest_index(current, self.index_alias)
+                self.output.info("Index %s already exists behind %s", index_name, self.read_alias)
+                return index_name
+
+        if version is None:
+            existing = yield from self._get_index_aliases(f"{self.index_alias}-v*")
+            if existing is None:
+                return None
+            version = next_index_version(existing, self.index_alias)
+
+        index_name = versioned_index_name(self.index_alias, version)
+        aliases = alias_definitions(self.read_alias, self.write_alias) if attach_aliases else None
+        created = yield from self._create_index(index_name, mappings or PRODUCT_INDEX_MAPPINGS, aliases)
+        return index_name if created else None
+
+    @operation
+    def _delete_product_index(self, index=None):
+        """Delete the products index (use with caution).
+
+        Args:
+            index (str, optional): Index or alias to delete; by default every
+                index behind the read and write aliases
+
+        Returns:
+            bool: True if index was deleted successfully, False otherwise
+        """
+        targets = {index} if index else {self.read_alias, self.write_alias}
+        indices = set()
+        for target in targets:
+            resolved = yield from self._get_index_aliases(target)
+            if resolved is None:
+                return False
+            indices.update(resolved)
+        index_name = ",".join(sorted(indices)) or ",".join(sorted(targets))
+
+        try:
+            response = yield Request("DELETE", f"/{index_name}")
+
+            if response.status_code == 200:
+                self._invalidate_query_cache()
+                self.output.info("Successfully deleted index %s", index_name)
+                return True
+            elif response.status_code == 404:
+                self.output.info("Index %s does not exist", index_name)
+                return False
+            else:
+                self.output.error("Failed to delete index %s: %s", index_name, response.text)
+                return False
+        except Exception as e:
+            self.output.error("Error deleting index %s: %s", index_name, e)
+            return False
+
+    def _aliased_indices(self):
+        """Return concrete index -> aliases for every index behind the read and write aliases."""
+        current = {}
+        for alias in {self.read_alias, self.write_alias}:
+            resolved = yield from self._get_index_aliases(alias)
+            if resolved is None:
+                return None
+            current.update(resolved)
+        return current
+
+    @operation
+    def _start_reindex(self, source, dest, slices="auto", requests_per_second=None, query=None):
+        """Start a server-side _reindex as a background task.
+
+        Args:
+            source (str or list): Index, alias or indices to copy from
+            dest (str): Concrete index to copy into
+            slices (int or str): Parallel slices; "auto" uses one per shard
+            requests_per_second (float, optional): Throttle; unthrottled when omitted
+            query (dict, optional): Query DSL clause restricting the documents copied
+
+        Returns:
+            str: Task ID, or None if the reindex could not be started
+        """
+        try:
+            response = yield Request(
+                "POST", "/_reindex", body=reindex_body(source, dest, query),
+                params=reindex_params(slices, requests_per_second)
+            )
+
+            if response.status_code == 200:
+                return response.json()["task"]
+            else:
+                self.output.error("Failed to start reindex into %s: %s", dest, response.text)
+                return None
+        except Exception as e:
+            self.output.error("Error starting reindex into %s: %s", dest, e)
+            return None
+
+    @operation
+    def _wait_for_task(self, task_id, poll_interval=DEFAULT_POLL_INTERVAL, progress=None):
+        """Poll the tasks API until a reindex task completes.
+
+        Args:
+            task_id (str): Task ID returned by start_reindex
+            poll_interval (float): Seconds between polls
+            progress (callable, optional): Called with the task_progress dict
+                after every poll, e.g. print_reindex_progress
+
+        Returns:
+            dict: Final task_progress dict, or None if the task could not be read
+        """
+        while True:
+            try:
+                response = yield Request("GET", f"/_tasks/{task_id}")
+
+                if response.status_code != 200:
+                    self.output.error("Failed to read task %s: %s", task_id, response.text)
+                    return None
+                status = task_progress(response.json())
+            except Exception as e:
+                self.output.error("Error reading task %s: %s", task_id, e)
+                return None
+
+            self.output.info(
+                "Reindexed %s/%s products (%.0f docs/sec, ETA %s s)",
+                status["done"], status["total"], status["docs_per_sec"], status["eta_seconds"]
+            )
+            if progress:
+                progress(status)
+            if status["completed"]:
+                return status
+            yield Sleep(poll_interval)
+
+    @operation
+    def _swap_aliases(self, new_index, current=None):
+        """Atomically point the read and write aliases at another index.
+
+        Args:
+            new_index (str): Concrete index the aliases should point at
+            current (dict, optional): Concrete index -> aliases the aliases are
+                moved away from; looked up when omitted
+
+        Returns:
+            bool: True if the aliases were moved, False otherwise
+        """
+        if current is None:
+            current = yield from self._aliased_indices()
+            if current is None:
+                return False
+        actions = swap_alias_actions(self.read_alias, self.write_alias, current, new_index)
+
+        try:
+            response = yield Request("POST", "/_aliases", body={"actions": actions})
+
+            if response.status_code == 200:
+                self._invalidate_query_cache()
+                self.output.info("Aliases %s now point at %s", self.read_alias, new_index)
+                return True
+            else:
+                self.output.error("Failed to swap aliases to %s: %s", new_index, response.text)
+                return False
+        except Exception as e:
+            self.output.error("Error swapping aliases to %s: %s", new_index, e)
+            return False
+
+    @operation
+    def _reindex_products(self, mappings=None, version=None, slices="auto", delete_old=False,
+                          poll_interval=DEFAULT_POLL_INTERVAL, progress=None, requests_per_second=None):
+        """Rebuild the products index under new mappings without downtime.
+
+        Creates the next index version off to the side, copies every product
+        into it with a sliced server-side _reindex (ingest-optimized settings
+        applied meanwhile), then swaps the read and write aliases over in one
+        atomic request. Readers keep using the old index until the swap.
+        Writes made while the copy runs go to the old index and are not
+        carried over, so pause writers or replay them afterwards.
+
+        This is also the migration for deployments that predate versioned
+        indices: a concrete index named like the read or write alias is
+        copied like any other, then deleted in the same atomic _aliases
+        request that creates the aliases, whatever delete_old says.
+
+        Args:
+            mappings (dict, optional): Mappings of the new index; PRODUCT_INDEX_MAPPINGS by default
+            version (int, optional): Version of the new index; the next free one by default
+            slices (int or str): Parallel reindex slices; "auto" uses one per shard
+            delete_old (bool): Delete the old indices after the swap
+            poll_interval (float): Seconds between task progress polls
+            progress (callable, optional): Called with a progress dict after every poll
+            requests_per_second (float, optional): Reindex throttle
+
+        Returns:
+            dict: Summary with source, dest, documents, seconds, docs_per_sec and
+                deleted_old, or None if the rebuild failed; the aliases are only
+                moved when the copy succeeded
+        """
+        current = yield from self._aliased_indices()
+        if current is None:
+            return None
+        if not current:
+            self.output.error("Nothing to reindex: %s does not exist", self.read_alias)
+            return None
+
+        dest = yield from self._create_product_index(version, attach_aliases=False, mappings=mappings)
+        if dest is None:
+            return None
+
+        original = yield from self._begin_bulk_load(dest)
+        try:
+            task_id = yield from self._start_reindex(
+                self.read_alias, dest, slices=slices, requests_per_second=requests_per_second
+            )
+            if task_id is None:
+                return None
+            status = yield from self._wait_for_task(task_id, poll_interval, progress)
+        finally:
+            yield from self._end_bulk_load(dest, original)
+
+        failures = reindex_failures(status)
+        if failures:
+            self.output.error("Reindex into %s failed, aliases left unchanged: %s", dest, failures)
+            return None
+
+        # A concrete index named like an alias is removed by the swap itself
+        legacy = legacy_indices(current, self.read_alias, self.write_alias)
+        swapped = yield from self._swap_aliases(dest, current)
+        if not swapped:
+            return None
+
+        old_indices = sorted(current)
+        remaining = [index for index in old_indices if index not in legacy]
+        deleted_old = bool(legacy) and not remaining
+        if delete_old and remaining:
+            deleted_old = yield from self._delete_product_index(",".join(remaining))
+        return reindex_summary(old_indices, dest, status, deleted_old)
+
+    @operation
+    def _check_index_health(self, index=None):
+        """Check the health and status of the products index.
+
+        Args:
+            index (str, optional): Index or alias to check; the read alias by default
+
+        Returns:
+            dict: Dictionary containing index health information
+        """
+        index_name = self._read_target(index)
+
+        try:
+            response = yield Request("GET", f"/{index_name}/_stats")
+
+            if response.status_code == 200:
+                stats = response.json()
+                # An alias can span several concrete indices
+                document_count = sum(
+                    index_stats.get("total", {}).get("docs", {}).get("count", 0)
+                    for index_stats in stats['indices'].values()
+                )
+
+                health_response = yield Request("GET", f"/_cluster/health/{index_name}")
+                health_info = health_response.json() if health_response.status_code == 200 else {}
+
+                health_data = {
+                    "status": health_info.get("status", "unknown"),
+                    "number_of_shards": health_info.get("number_of_shards", 0),
+                    "number_of_replicas": health_info.get("number_of_replicas", 0),
+                    "active_shards": health_info.get("active_shards", 0),
+                    "unassigned_shards": health_info.get("unassigned_shards", 0),
+                    "document_count": document_count
+                }
+
+                self.output.data(health_data, "Index health check results for %s:", index_name)
+                return health_data
+            else:
+                self.output.error("Failed to get index stats: %s", response.text)
+                return None
+        except Exception as e:
+            self.output.error("Error checking index health: %s", e)
+            return None
+
+    @operation
+    def _get_index_settings(self, index_name=None, keys=tuple(BULK_LOAD_SETTINGS)):
+        """Read the current values of index settings.
+
+        Args:
+            index_name (str, optional): Index or alias to read the settings of;
+                the write alias by default
+            keys (iterable): Dotted setting names, e.g. "index.refresh_interval"
+
+        Returns:
+            dict: Setting name -> value, None for settings left at their default;
+                None if the settings could not be read
+        """
+        index_name = self._write_target(index_name)
+        try:
+            response = yield Request("GET", f"/{index_name}/_settings", params={"flat_settings": "true"})
+
+            if response.status_code == 200:
+                return current_settings(response.json(), index_name, keys)
+            else:
+                self.output.error("Failed to read settings of %s: %s", index_name, response.text)
+                return None
+        except Exception as e:
+            self.output.error("Error reading settings of %s: %s", index_name, e)
+            return None
+
+    @operation
+    def _update_index_settings(self, index_name, settings):
+        """Update dynamic index settings.
+
+        Args:
+            index_name (str): Index to update
+            settings (dict): Dotted setting names to new values; None resets a
+                setting to its default
+
+        Returns:
+            bool: True if the settings were applied, False otherwise
+        """
+        try:
+            response = yield Request("PUT", f"/{index_name}/_settings", body=settings)
+
+            if response.status_code == 200:
+                self.output.info("Updated settings of %s: %s", index_name, settings)
+                return True
+            else:
+                self.output.error("Failed to update settings of %s: %s", index_name, response.text)
+                return False
+        except Exception as e:
+            self.output.error("Error updating settings of %s: %s", index_name, e)
+            return False
+
+    @operation
+    def _refresh_index(self, index_name=None):
+        """Make everything indexed so far visible to search.
+
+        Args:
+            index_name (str, optional): Index or alias to refresh; the write alias by default
+
+        Returns:
+            bool: True if the refresh succeeded, False otherwise
+        """
+        index_name = self._write_target(index_name)
+        try:
+            response = yield Request("POST", f"/{index_name}/_refresh")
+
+            if response.status_code == 200:
+                return True
+            else:
+                self.output.error("Failed to refresh %s: %s", index_name, response.text)
+                return False
+        except Exception as e:
+            self.output.error("Error refreshing %s: %s", index_name, e)
+            return False
+
+    @operation
+    def _force_merge(self, index_name=None, max_num_segments=1, timeout=FORCE_MERGE_TIMEOUT):
+        """Merge the segments of an index, e.g. once a full rebuild is finished.
+
+        Args:
+            index_name (str, optional): Index or alias to merge; the write alias by default
+            max_num_segments (int): Segments to merge each shard down to
+            timeout (float): Seconds to wait for the merge to finish
+
+        Returns:
+            bool: True if the merge succeeded, False otherwise
+        """
+        index_name = self._write_target(index_name)
+        try:
+            response = yield Request(
+                "POST", f"/{index_name}/_forcemerge",
+                params={"max_num_segments": max_num_segments}, timeout=(DEFAULT_CONNECT_TIMEOUT, timeout)
+            )
+
+            if response.status_code == 200:
+                self.output.info("Force merged %s to %s segment(s)", index_name, max_num_segments)
+                return True
+            else:
+                self.output.error("Failed to force merge %s: %s", index_name, response.text)
+                return False
+        except Exception as e:
+            self.output.error("Error force merging %s: %s", index_name, e)
+            return False
+
+    @operation
+    def _begin_bulk_load(self, index_name, settings=None):
+        """Apply ingest-optimized settings and return the values they replaced.
+
+        Prefer the bulk_load context manager, which restores them on exit.
+
+        Args:
+            index_name (str): Concrete index or alias being loaded
+            settings (dict, optional): Settings to apply; BULK_LOAD_SETTINGS by default
+
+        Returns:
+            dict: Original values, to pass to end_bulk_load
+
+        Raises:
+            RuntimeError: If the settings could not be read or applied
+        """
+        settings = settings or BULK_LOAD_SETTINGS
+        original = yield from self._get_index_settings(index_name, tuple(settings))
+        if original is None:
+            raise RuntimeError(f"Could not read the settings of {index_name}")
+        applied = yield from self._update_index_settings(index_name, settings)
+        if not applied:
+            yield from self._update_index_settings(index_name, original)
+            raise RuntimeError(f"Could not apply bulk load settings to {index_name}")
+        return original
+
+    @operation
+    def _end_bulk_load(self, index_name, original):
+        """Restore the settings replaced by begin_bulk_load and refresh the index.
+
+        Args:
+            index_name (str): Concrete index or alias that was loaded
+            original (dict): Values returned by begin_bulk_load
+        """
+        yield from self._update_index_settings(index_name, original)
+        yield from self._refresh_index(index_name)
+
+    @operation
+    def _index_document(self, index_name, document, doc_id=None):
+        """Index a document in ElasticSearch.
+
+        Args:
+            index_name (str): Target index name
+            document (dict): Document to index
+            doc_id (str, optional): Custom document ID
+
+        Returns:
+            dict: Index response, or None if the document could not be indexed
+        """
+        if doc_id:
+            path = f"/{index_name}/_doc/{doc_id}"
+        else:
+            path = f"/{index_name}/_doc"
+
+        try:
+            response = yield Request("POST", path, body=document)
+            self._invalidate_query_cache()
+
+            if response.status_code in (200, 201):
+                result = response.json()
+                self.output.info("Document indexed successfully with ID: %s", result['_id'])
+                return result
+            else:
+                self.output.error("Failed to index document: %s", response.text)
+                return None
+        except Exception as e:
+            self.output.error("Error indexing document: %s", e)
+            return None
+
+    @operation
+    def _create_product(self, product_data, index=None):
+        """Create a single product.
+
+        Args:
+            product_data (dict): Product data including all required fields
+            index (str, optional): Index or alias to write to; the write alias by default
+
+        Returns:
+            dict: Response from ElasticSearch with created document details
+
+        Raises:
+            ValueError: If a required field is missing
+        """
+        index_name = self._write_target(index)
+
+        # Validate required fields and add timestamps if not provided
+        return (yield from self._index_document(index_name, prepare_product(product_data)))
+
+    @operation
+    def _get_product_by_id(self, product_id, fields=None, exclude=None, index=None):
+        """Retrieve a product by its ID.
+
+        Args:
+            product_id (str): The ID of the product to retrieve
+            fields (list, optional): Source fields to return; all fields when omitted
+            exclude (list, optional): Source fields to leave out
+            index (str, optional): Index or alias to read from; the read alias by default
+
+        Returns:
+            dict: Product document if found, None otherwise
+        """
+        index_name = self._read_target(index)
+
+        try:
+            response = yield Request(
+                "GET", f"/{index_name}/_doc/{product_id}", params=doc_params(fields, exclude)
+            )
+
+            if response.status_code == 200:
+                return response.json().get("_source", {})
+            elif response.status_code == 404:
+                self.output.info("Product with ID %s not found", product_id)
+                return None
+            else:
+                self.output.error("Error retrieving product: %s", response.text)
+                return None
+        except Exception as e:
+            self.output.error("Error getting product: %s", e)
+            return None
+
+    @operation
+    def _get_products_by_ids(self, product_ids, fields=None, exclude=None,
+                             batch_size=DEFAULT_MGET_BATCH_SIZE, index=None):
+        """Retrieve many products by ID with _mget, one request per batch.
+
+        The asyncio client sends the batches concurrently.
+
+        Args:
+            product_ids (list): IDs of the products to retrieve
+            fields (list, optional): Source fields to return; all fields when omitted
+            exclude (list, optional): Source fields to leave out
+            batch_size (int): Maximum IDs per _mget request (default: 500)
+            index (str, optional): Index or alias to read from; the read alias by default
+
+        Returns:
+            list: One entry per requested ID, in input order: the product
+                document, or None if that ID was not found. None if a
+                request failed.
+        """
+        path = f"/{self._read_target(index)}/_mget"
+        params = doc_params(fields, exclude, MGET_FILTER_PATH)
+
+        batches = list(id_batches(product_ids, batch_size))
+
+        try:
+            responses = yield [Request("POST", path, body={"ids": batch}, params=params) for batch in batches]
+
+            products = []
+            for batch, response in zip(batches, responses):
+                if response.status_code != 200:
+                    self.output.error("Error retrieving products: %s", response.text)
+                    return None
+                products.extend(mget_sources(response.json(), batch))
+            return products
+        except Exception as e:
+            self.output.error("Error getting products: %s", e)
+            return None
+
+    @operation
+    def _update_product(self, product_id, update_data, index=None):
+        """Update specific fields of a product.
+
+        Args:
+            product_id (str): ID of the product to update
+            update_data (dict): Fields to update with new values
+            index (str, optional): Index or alias to write to; the write alias by default
+
+        Returns:
+            dict: Update response if successful, None otherwise
+        """
+        path = f"/{self._write_target(index)}/_update/{product_id}"
+
+        try:
+            # A partial-document update can be resent safely
+            response = yield Request("POST", path, body=upsert_body(update_data), idempotent=True)
+            self._invalidate_query_cache()
+
+            if response.status_code in (200, 201):
+                self.output.info("Successfully updated product %s", product_id)
+                return response.json()
+            else:
+                self.output.error("Failed to update product: %s", response.text)
+                return None
+        except Exception as e:
+            self.output.error("Error updating product: %s", e)
+            return None
+
+    @operation
+    def _delete_product(self, product_id, soft_delete=True, index=None):
+        """Delete a product (soft or hard delete).
+
+        Args:
+            product_id (str): ID of the product to delete
+            soft_delete (bool): If True, marks as inactive instead of deleting
+            index (str, optional): Index or alias to write to; the write alias by default
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if soft_delete:
+            # Soft delete by updating Active status
+            updated = yield from self._update_product(product_id, {"Active": False}, index)
+            return updated is not None
+
+        path = f"/{self._write_target(index)}/_doc/{product_id}"
+
+        try:
+            response = yield Request("DELETE", path)
+            self._invalidate_query_cache()
+
+            if response.status_code == 200:
+                self.output.info("Successfully deleted product %s", product_id)
+                return True
+            else:
+                self.output.error("Failed to delete product: %s", response.text)
+                return False
+        except Exception as e:
+            self.output.error("Error deleting product: %s", e)
+            return False
+
+    @operation
+    def _open_point_in_time(self, index_name=None, keep_alive=DEFAULT_KEEP_ALIVE):
+        """Open a point in time on an index for consistent paging.
+
+        Args:
+            index_name (str, optional): Index or alias to open the point in time on;
+                the read alias by default
+            keep_alive (str): How long to keep it open between pages
+
+        Returns:
+            str: Point-in-time ID, or None if it could not be opened
+        """
+        index_name = self._read_target(index_name)
+        try:
+            response = yield Request("POST", f"/{index_name}/_pit", params={"keep_alive": keep_alive})
+
+            if response.status_code == 200:
+                return response.json()["id"]
+            else:
+                self.output.error("Failed to open point in time: %s", response.text)
+                return None
+        except Exception as e:
+            self.output.error("Error opening point in time: %s", e)
+            return None
+
+    @operation
+    def _close_point_in_time(self, pit_id):
+        """Close a point in time and free its search contexts.
+
+        Args:
+            pit_id (str): Point-in-time ID
+        """
+        try:
+            yield Request("DELETE", "/_pit", body={"id": pit_id})
+        except Exception as e:
+            self.output.error("Error closing point in time: %s", e)
+
+    def _search(self, query, fields=None, exclude=None, index=None):
+        """Run a search and return the hit sources.
+
+        When a query cache is configured, results are served from it and
+        stored in it as encoded JSON, keyed by the canonical query body.
+
+        Args:
+            query (dict): Query DSL clause
+            fields (list, optional): Source fields to return
+            exclude (list, optional): Source fields to leave out
+            index (str, optional): Index or alias to read from; the read alias by default
+
+        Returns:
+            list: Product source documents, or None if the search failed
+        """
+        path = f"/{self._read_target(index)}/_search"
+        search_query = apply_source_filter({"query": query}, fields, exclude)
+
+        try:
+            cache_key = None
+            if self.query_cache is not None:
+                cache_key = self.query_cache.make_key(path, search_query)
+                generation = self.query_cache.generation
+                cached = self.query_cache.get(cache_key)
+                if cached is not None:
+                    # Decoding gives every hit its own copy of the documents
+                    return self.transport.serializer.loads(cached)
+
+            response = yield Request("GET", path, body=search_query, params={"filter_path": SEARCH_FILTER_PATH})
+
+            if response.status_code == 200:
+                products = hit_sources(response.json())
+
+                if cache_key is not None:
+                    self.query_cache.set(cache_key, self.transport.serializer.dumps(products), generation)
+                return products
+            else:
+                self.output.error("Search failed: %s", response.text)
+                return None
+        except Exception as e:
+            self.output.error("Error searching products: %s", e)
+            return None
+
+    def _find_products(self, query_builder, stream, page_size, fields, exclude, index, summary=None, *args):
+        """Search plan behind search_products and the search_by_* methods.
+
+        Args:
+            query_builder: Query builder for the search
+            stream, page_size, fields, exclude, index: As for search_products
+            summary (str, optional): Message reported with the hits, formatted
+                with the hit count followed by args
+
+        Returns:
+            list: Matching products (empty if the search failed), or the
+                client's scan_products stream when stream is True
+        """
+        query = query_builder.to_dict()
+        if stream:
+            return self.scan_products(query, page_size, fields=fields, exclude=exclude, index=index)
+
+        products = yield from self._search(query, fields, exclude, index)
+        if products is None:
+            return []
+
+        # Display formatted results
+        if summary:
+            self.output.products(products, summary, len(products), *args)
+        return products
+
+    @operation
+    def _search_products(self, query_builder, stream=False, page_size=DEFAULT_PAGE_SIZE,
+                         fields=None, exclude=None, index=None):
+        """Generic search method that accepts a query builder.
+
+        The search_by_* methods accept the same stream, page_size, fields,
+        exclude and index options.
+
+        Args:
+            query_builder: An object that implements to_dict() method for query construction
+            stream (bool): If True, return a lazy generator over every match (an
+                async generator on the asyncio client)
+            page_size (int): Hits fetched per page when streaming
+            fields (list, optional): Source fields to return; all fields when omitted
+            exclude (list, optional): Source fields to leave out
+            index (str, optional): Index or alias to read from; the read alias by default
+
+        Returns:
+            list: List of matching products, or a generator when stream is True
+
+        Raises:
+            RuntimeError: While a streamed result is consumed, if a page request
+                fails (see scan_products); the search_by_* streams behave the same
+        """
+        return (yield from self._find_products(query_builder, stream, page_size, fields, exclude, index))
+
+    @operation
+    def _search_products_by_name(self, product_name, fuzzy=False, stream=False, page_size=DEFAULT_PAGE_SIZE,
+                                 fields=None, exclude=None, index=None):
+        """Search products by name with optional fuzzy matching.
+
+        Args:
+            product_name (str): Name to search for
+            fuzzy (bool): If True, enables fuzzy matching
+            stream (bool): If True, return a lazy generator over every match
+            page_size (int): Hits fetched per page when streaming
+            fields (list, optional): Source fields to return; all fields when omitted
+            exclude (list, optional): Source fields to leave out
+            index (str, optional): Index or alias to read from; the read alias by default
+
+        Returns:
+            list: List of matching products, or a generator when stream is True
+        """
+        # Create appropriate query based on fuzzy parameter
+        if fuzzy:
+            query_builder = MatchQuery("Name", product_name, "AUTO")
+        else:
+            query_builder = MatchPhraseQuery("Name", product_name)
+        return (yield from self._find_products(
+            query_builder, stream, page_size, fields, exclude, index,
+            "Found %s products matching '%s':", product_name
+        ))
+
+    @operation
+    def _search_by_price_range(self, min_price, max_price, stream=False, page_size=DEFAULT_PAGE_SIZE,
+                               fields=None, exclude=None, index=None):
+        """Find products within a price range.
+
+        Args:
+            min_price (float): Minimum price
+            max_price (float): Maximum price
+            stream (bool): If True, return a lazy generator over every match
+            page_size (int): Hits fetched per page when streaming
+            fields (list, optional): Source fields to return; all fields when omitted
+            exclude (list, optional): Source fields to leave out
+            index (str, optional): Index or alias to read from; the read alias by default
+
+        Returns:
+            list: List of products within the price range, or a generator when stream is True
+        """
+        return (yield from self._find_products(
+            RangeQuery("Price", gte=min_price, lte=max_price), stream, page_size, fields, exclude, index,
+            "Found %s products in price range $%s - $%s:", min_price, max_price
+        ))
+
+    @operation
+    def _search_by_category(self, category, stream=False, page_size=DEFAULT_PAGE_SIZE,
+                            fields=None, exclude=None, index=None):
+        """Search products by category.
+
+        Args:
+            category (str): Category to search for
+            stream (bool): If True, return a lazy generator over every match
+            page_size (int): Hits fetched per page when streaming
+            fields (list, optional): Source fields to return; all fields when omitted
+            exclude (list, optional): Source fields to leave out
+            index (str, optional): Index or alias to read from; the read alias by default
+
+        Returns:
+            list: List of products in the category, or a generator when stream is True
+        """
+        return (yield from self._find_products(
+            TermQuery("Category", category), stream, page_size, fields, exclude, index,
+            "Found %s products in category '%s':", category
+        ))
+
+    @operation
+    def _search_by_brand(self, brand, stream=False, page_size=DEFAULT_PAGE_SIZE,
+                         fields=None, exclude=None, index=None):
+        """Search products by brand.
+
+        Args:
+            brand (str): Brand to search for
+            stream (bool): If True, return a lazy generator over every match
+            page_size (int): Hits fetched per page when streaming
+            fields (list, optional): Source fields to return; all fields when omitted
+            exclude (list, optional): Source fields to leave out
+            index (str, optional): Index or alias to read from; the read alias by default
+
+        Returns:
+            list: List of products from the brand, or a generator when stream is True
+        """
+        return (yield from self._find_products(
+            TermQuery("Brand", brand), stream, page_size, fields, exclude, index,
+            "Found %s products from brand '%s':", brand
+        ))
+
+    @operation
+    def _search_by_rating(self, min_rating, stream=False, page_size=DEFAULT_PAGE_SIZE,
+                          fields=None, exclude=None, index=None):
+        """Search products by minimum rating.
+
+        Args:
+            min_rating (float): Minimum rating to search for
+            stream (bool): If True, return a lazy generator over every match
+            page_size (int): Hits fetched per page when streaming
+            fields (list, optional): Source fields to return; all fields when omitted
+            exclude (list, optional): Source fields to leave out
+            index (str, optional): Index or alias to read from; the read alias by default
+
+        Returns:
+            list: List of products with rating >= min_rating, or a generator when stream is True
+        """
+        return (yield from self._find_products(
+            RangeQuery("Rating", gte=min_rating), stream, page_size, fields, exclude, index,
+            "Found %s products with rating >= %s:", min_rating
+        ))
+
+    @operation
+    def _search_by_stock(self, min_stock, stream=False, page_size=DEFAULT_PAGE_SIZE,
+                         fields=None, exclude=None, index=None):
+        """Search products by minimum stock quantity.
+
+        Args:
+            min_stock (int): Minimum stock quantity to search for
+            stream (bool): If True, return a lazy generator over every match
+            page_size (int): Hits fetched per page when streaming
+            fields (list, optional): Source fields to return; all fields when omitted
+            exclude (list, optional): Source fields to leave out
+            index (str, optional): Index or alias to read from; the read alias by default
+
+        Returns:
+            list: List of products with stock >= min_stock, or a generator when stream is True
+        """
+        return (yield from self._find_products(
+            RangeQuery("StockQty", gte=min_stock), stream, page_size, fields, exclude, index,
+            "Found %s products with stock >= %s:", min_stock
+        ))
+
+    @operation
+    def _search_by_date_range(self, start_date, end_date, stream=False, page_size=DEFAULT_PAGE_SIZE,
+                              fields=None, exclude=None, index=None):
+        """Search products by creation date range.
+
+        Args:
+            start_date (str): Start date in ISO format
+            end_date (str): End date in ISO format
+            stream (bool): If True, return a lazy generator over every match
+            page_size (int): Hits fetched per page when streaming
+            fields (list, optional): Source fields to return; all fields when omitted
+            exclude (list, optional): Source fields to leave out
+            index (str, optional): Index or alias to read from; the read alias by default
+
+        Returns:
+            list: List of products created within the date range, or a generator when stream is True
+        """
+        return (yield from self._find_products(
+            RangeQuery("CreatedTime", gte=start_date, lte=end_date), stream, page_size, fields, exclude, index,
+            "Found %s products created between %s and %s:", start_date, end_date
+        ))
+
+    @operation
+    def _search_by_criteria(self, criteria, stream=False, page_size=DEFAULT_PAGE_SIZE,
+                            fields=None, exclude=None, index=None):
+        """Search products matching all of the given criteria in one request.
+
+        The criteria are compiled into one bool query in filter context (see
+        CriteriaQuery), so the search is a single request and every product
+        is returned once.
+
+        Args:
+            criteria (dict or list): Criteria dicts, compiled by CriteriaQuery
+            stream (bool): If True, return a lazy generator over every match
+            page_size (int): Hits fetched per page when streaming
+            fields (list, optional): Source fields to return; all fields when omitted
+            exclude (list, optional): Source fields to leave out
+            index (str, optional): Index or alias to read from; the read alias by default
+
+        Returns:
+            list: List of products matching every criterion, or a generator when stream is True
+        """
+        return (yield from self._find_products(
+            CriteriaQuery(criteria), stream, page_size, fields, exclude, index,
+            "Found %s products matching criteria:"
+        ))
+
+    @operation
+    def _facets(self, query=None, index=None, **facet_options):
+        """Count products per Category, Subcategory, Brand, price range and rating.
+
+        All facets come from one size=0 search, so no documents are fetched.
+        The request sets request_cache=true: repeated facet requests are
+        answered from the shard request cache until the index changes. Keep
+        the query free of "now" date math so it stays cacheable.
+
+        Args:
+            query (optional): Query builder (anything with to_dict()) or Query DSL
+                dict restricting the counted products; every product when omitted
+            index (str, optional): Index or alias to read from; the read alias by default
+            **facet_options: terms_fields, terms_size, price_ranges, rating_interval
+                (see facet_aggregations)
+
+        Returns:
+            dict: total plus compact buckets per facet (see parse_facets), or None
+                if the request failed
+        """
+        index_name = self._read_target(index)
+        if hasattr(query, "to_dict"):
+            query = query.to_dict()
+        body = facet_body(query, **facet_options)
+
+        try:
+            response = yield Request(
+                "GET", f"/{index_name}/_search", body=body,
+                params={"request_cache": "true", "filter_path": FACETS_FILTER_PATH}
+            )
+
+            if response.status_code == 200:
+                return parse_facets(response.json(), body["aggs"])
+            else:
+                self.output.error("Facet request failed: %s", response.text)
+                return None
+        except Exception as e:
+            self.output.error("Error counting facets: %s", e)
+            return None
+
+    def _msearch_request(self, query_builders, fields=None, exclude=None, filter_path=MSEARCH_FILTER_PATH,
+                         index=None):
+        """Build the _msearch Request running one projected search per query builder."""
+        index_name = self._read_target(index)
+        body = msearch_body(query_builders, index_name, fields, exclude, self.transport.serializer)
+        return Request(
+            "POST", f"/{index_name}/_msearch", body=body, params={"filter_path": filter_path},
+            headers=NDJSON_HEADERS
+        )
+
+    @operation
+    def _multi_search(self, query_builders, fields=None, exclude=None, index=None):
+        """Run several searches in a single _msearch request.
+
+        Args:
+            query_builders (list): List of query builder objects
+            fields (list, optional): Source fields to return; all fields when omitted
+            exclude (list, optional): Source fields to leave out
+            index (str, optional): Index or alias to read from; the read alias by default
+
+        Returns:
+            list: One list of matching products per query builder; empty if the
+                request failed
+        """
+        if not query_builders:
+            return []
+
+        try:
+            response = yield self._msearch_request(query_builders, fields, exclude, index=index)
+
+            if response.status_code == 200:
+                return [hit_sources(result) for result in response.json().get("responses", [])]
+            else:
+                self.output.error("Multi-search failed: %s", response.text)
+                return []
+        except Exception as e:
+            self.output.error("Error in multi-search: %s", e)
+            return []
+
+    def _bulk_chunk(self, chunk, body, max_retries=DEFAULT_MAX_RETRIES,
+                    initial_backoff=DEFAULT_INITIAL_BACKOFF, max_backoff=DEFAULT_MAX_BACKOFF):
+        """Send one _bulk chunk, retrying only the items the cluster rejected.
+
+        Each item in the bulk response is checked individually. Items rejected
+        with 429 / es_rejected_execution_exception are resent with jittered
+        exponential backoff; other item errors are reported as failures.
+
+        Args:
+            chunk (list): (action, source) pairs in the chunk
+            body (bytes): NDJSON body for the chunk
+            max_retries (int): Maximum number of retry rounds for rejected items
+            initial_backoff (float): Base backoff delay in seconds
+            max_backoff (float): Maximum backoff delay in seconds
+
+        Returns:
+            dict: Chunk result with count, ok, took, indexed, retried, failed
+                and failed_items
+        """
+        result = new_chunk_result(len(chunk))
+        pending = chunk
+        attempt = 0
+
+        while pending:
+            rejected = []
+            try:
+                response = yield Request(
+                    "POST", "/_bulk", body=body, headers=NDJSON_HEADERS, idempotent=bulk_is_idempotent(pending)
+                )
+                rejected = record_bulk_response(result, pending, response)
+            except Exception as e:
+                record_bulk_error(result, pending, e)
+
+            rejected = record_retry(result, rejected, attempt, max_retries)
+            if rejected:
+                yield Sleep(backoff_delay(attempt, initial_backoff, max_backoff))
+                attempt += 1
+                body = build_bulk_body(rejected, self.transport.serializer)
+            pending = rejected
+
+        self._invalidate_query_cache()
+        return finish_chunk_result(result)
@@ -0,0 +1,261 @@
+"""HTTP transport shared by the ElasticSearch clients."""
+
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from ..utils.compression import (
+    ACCEPT_ENCODING, DEFAULT_COMPRESS_THRESHOLD, TransferStats, prepare_request_body
+)
+from ..utils.instrumentation import current_operation, is_failure
+from ..utils.node_pool import (
+    DEFAULT_DEAD_TIMEOUT, DEFAULT_FAILURE_THRESHOLD, ROUND_ROBIN, NodePool, NoLiveNodesError, node_url,
+    sniffed_urls
+)
+from ..utils.resilience import DEFAULT_TIMEOUT, RetryPolicy, is_idempotent
+from ..utils.serializer import DEFAULT_SERIALIZER, get_serializer
+
+class Response:
+    """Fully read HTTP response whose body is decoded by the transport's serializer."""
+
+    __slots__ = ("status_code", "content", "headers", "serializer")
+
+    def __init__(self, status_code, content, headers, serializer=DEFAULT_SERIALIZER):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.serializer = serializer
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        data = self.serializer.loads(self.content)
+        if isinstance(data, dict) and isinstance(data.get("took"), int):
+            operation = current_operation()
+            if operation is not None:
+                operation.add_took(data["took"])
+        return data
+
+def _connect_failed(error):
+    """True if a requests error happened before the request reached the node."""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+class Transport:
+    """Pooled keep-alive HTTP transport used by every client method.
+
+    A single ``HTTPAdapter`` owns the urllib3 connection pools, so TCP
+    connections are reused across calls. Each thread gets its own
+    ``requests.Session`` mounted on that shared adapter, which keeps
+    session state thread-local while the pool itself is shared.
+
+    Compressed responses are always negotiated; request bodies are gzipped
+    only when ``http_compress`` is on and they reach the size threshold.
+    Raw and on-the-wire byte counts are kept in ``transfer_stats``.
+
+    Requests are spread across every node in ``hosts`` by a ``NodePool``.
+    A node that cannot be reached, times out or answers 502/503/504 counts
+    a failure against its circuit breaker. Requests that never reached a
+    node are sent to the next one; idempotent requests are also retried
+    after timeouts and unavailable responses, as the ``RetryPolicy``
+    allows. With ``sniff_on_start`` or ``sniff_interval`` the node list is
+    refreshed from ``_nodes/http`` on the first request that finds it due.
+    """
+
+    def __init__(self, host='localhost', port=9200, scheme='http', headers=None,
+                 pool_connections=10, pool_maxsize=10, pool_block=False, timeout=DEFAULT_TIMEOUT,
+                 serializer=None, http_compress=False, compress_threshold=DEFAULT_COMPRESS_THRESHOLD,
+                 hosts=None, selector=ROUND_ROBIN, dead_timeout=DEFAULT_DEAD_TIMEOUT,
+                 failure_threshold=DEFAULT_FAILURE_THRESHOLD, sniff_on_start=False, sniff_interval=None,
+                 retry_policy=None):
+        """Initialize the transport.
+
+        Args:
+            host (str): ElasticSearch host (default: localhost)
+            port (int): ElasticSearch port (default: 9200)
+            scheme (str): URL scheme, http or https (default: http)
+            headers (dict, optional): Default headers sent with every request
+            pool_connections (int): Number of per-host pools to cache (default: 10)
+            pool_maxsize (int): Maximum keep-alive connections per host (default: 10)
+            pool_block (bool): If True, block when a host pool is exhausted instead
+                of opening throwaway connections (default: False)
+            timeout (float or tuple): Default request timeout in seconds, or a
+                (connect, read) tuple (default: (5, 30))
+            serializer (str or object, optional): JSON serializer for request and
+                response bodies; orjson when installed, the standard library otherwise
+            http_compress (bool): Gzip request bodies of at least compress_threshold
+                bytes and send them with Content-Encoding: gzip (default: False)
+            compress_threshold (int): Minimum body size in bytes to compress (default: 1024)
+            hosts (list, optional): Nodes to spread requests across, as "host:port",
+                URLs, (host, port) tuples or dicts; host and port are ignored when given
+            selector (str): "round_robin" (default) or "least_in_flight"
+            dead_timeout (float): Seconds a node's open circuit rejects requests
+                before a trial request; doubles while the node keeps failing (default: 60)
+            failure_threshold (int): Consecutive failures that open a node's circuit (default: 3)
+            sniff_on_start (bool): Discover the cluster's nodes through _nodes/http
+                before the first request (default: False)
+            sniff_interval (float, optional): Seconds between node rediscoveries
+            retry_policy (RetryPolicy, optional): Retries for idempotent requests;
+                two retries with jittered backoff by default
+        """
+        self.scheme = scheme
+        self.pool = NodePool(
+            [node_url(node, scheme, port) for node in hosts or [(host, port)]],
+            selector=selector, dead_timeout=dead_timeout, failure_threshold=failure_threshold
+        )
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.base_url = self.pool.nodes[0].base_url
+        self.sniff_interval = sniff_interval
+        if sniff_on_start:
+            self._next_sniff = 0.0
+        else:
+            self._next_sniff = time.monotonic() + sniff_interval if sniff_interval else None
+        self.headers = {"Content-Type": "application/json", "Accept-Encoding": ACCEPT_ENCODING}
+        if headers:
+            self.headers.update(headers)
+        self.timeout = timeout
+        self.serializer = get_serializer(serializer)
+        self.compress_threshold = compress_threshold if http_compress else None
+        self.transfer_stats = TransferStats()
+        self.adapter = HTTPAdapter(
+            pool_connections=max(pool_connections, len(self.pool)),
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self._local = threading.local()
+        self._sessions = []
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        """Return the calling thread's session, creating it on first use."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", self.adapter)
+            session.mount("https://", self.adapter)
+            session.headers.update(self.headers)
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def perform_request(self, method, path, body=None, params=None, headers=None, timeout=None,
+                        idempotent=None):
+        """Send a request through the pooled session.
+
+        Args:
+            method (str): HTTP method
+            path (str): Request path relative to the base URL (e.g. /_bulk)
+            body (dict, str or bytes, optional): Request body; dicts and lists are
+                encoded by the serializer
+            params (dict, optional): Query string parameters
+            headers (dict, optional): Extra headers for this request only
+            timeout (float or tuple, optional): Overrides the default timeout
+            idempotent (bool, optional): Whether the request may be retried;
+                inferred from the method and endpoint when omitted
+
+        Returns:
+            Response: The fully read HTTP response
+
+        Raises:
+            NoLiveNodesError: If every node's circuit is open
+        """
+        if isinstance(body, (dict, list)):
+            body = self.serializer.dumps(body)
+        body, raw_size, compressed = prepare_request_body(body, self.compress_threshold)
+        if compressed:
+            headers = dict(headers or {}, **{"Content-Encoding": "gzip"})
+
+        if self._next_sniff is not None and time.monotonic() >= self._next_sniff:
+            self.sniff()
+
+        if idempotent is None:
+            idempotent = is_idempotent(method, path)
+
+        started = time.perf_counter()
+        failovers = 0
+        retries = 0
+        while True:
+            node = self.pool.acquire()
+            try:
+                response = self.session.request(
+                    method,
+                    f"{node.base_url}{path}",
+                    data=body,
+                    params=params,
+                    headers=headers,
+                    timeout=self.timeout if timeout is None else timeout
+                )
+                content = response.content
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self.pool.release(node, alive=False)
+                # Requests that never reached a node are safe to send to another
+                if _connect_failed(e) and failovers < len(self.pool) - 1:
+                    failovers += 1
+                    continue
+                if self.retry_policy.should_retry(retries, idempotent):
+                    time.sleep(self.retry_policy.delay(retries))
+                    retries += 1
+                    continue
+                raise
+            except BaseException:
+                self.pool.release(node)
+                raise
+            unavailable = response.status_code in self.retry_policy.retry_statuses
+            self.pool.release(node, alive=not unavailable)
+            if unavailable and self.retry_policy.should_retry(retries, idempotent):
+                time.sleep(self.retry_policy.delay(retries))
+                retries += 1
+                continue
+            break
+        network_seconds = time.perf_counter() - started
+        # urllib3 counts the bytes it read off the socket, before decoding
+        wire_size = getattr(response.raw, "tell", lambda: len(content))()
+        request_size = len(body) if body is not None else 0
+        self.transfer_stats.record(raw_size, request_size, len(content), wire_size)
+        operation = current_operation()
+        if operation is not None:
+            operation.add_request(request_size, wire_size, network_seconds, is_failure(response.status_code))
+        return Response(response.status_code, content, response.headers, self.serializer)
+
+    def sniff(self):
+        """Replace the node list with the HTTP nodes the cluster reports.
+
+        Returns:
+            list: Base URLs discovered, empty if sniffing failed (the node list
+                is then left unchanged)
+        """
+        self._next_sniff = time.monotonic() + self.sniff_interval if self.sniff_interval else None
+        try:
+            node = self.pool.acquire()
+        except NoLiveNodesError:
+            return []
+        alive = True
+        urls = []
+        try:
+            response = self.session.get(f"{node.base_url}/_nodes/http", timeout=self.timeout)
+            if response.status_code == 200:
+                urls = sniffed_urls(self.serializer.loads(response.content), self.scheme)
+        except (requests.ConnectionError, requests.Timeout):
+            alive = False
+        except ValueError:
+            pass
+        finally:
+            self.pool.release(node, alive)
+        self.pool.set_urls(urls)
+        return urls
+
+    def close(self):
+        """Close every session and release pooled connections."""
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions = []
+        self._local = threading.local()
+        self.adapter.close()
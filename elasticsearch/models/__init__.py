@@ -1,5 +1,10 @@
 """Query builder models for ElasticSearch."""
 
-from .query_builders import MatchQuery, MatchPhraseQuery, RangeQuery, TermQuery
+from .query_builders import (
+    BoolQuery, CriteriaQuery, MatchQuery, MatchPhraseQuery, RangeQuery, TermQuery, TermsQuery
+)
 
-__all__ = ['MatchQuery', 'MatchPhraseQuery', 'RangeQuery', 'TermQuery'] 
\ No newline at end of file
+__all__ = [
+    'MatchQuery', 'MatchPhraseQuery', 'RangeQuery', 'TermQuery',
+    'TermsQuery', 'BoolQuery', 'CriteriaQuery'
+] 
\ No newline at end of file
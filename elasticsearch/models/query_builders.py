@@ -44,4 +44,92 @@ class TermQuery:
         self.value = value
     
     def to_dict(self):
-        return {"term": {self.field: self.value}} 
\ No newline at end of file
+        return {"term": {self.field: self.value}}
+
+class TermsQuery:
+    """Builds a terms query matching any of several exact values."""
+    def __init__(self, field, values):
+        self.field = field
+        self.values = list(values)
+    
+    def to_dict(self):
+        return {"terms": {self.field: self.values}}
+
+class BoolQuery:
+    """Builds a bool query from other query builders.
+    
+    Clauses in filters and must_not run in filter context: they do not
+    score and ElasticSearch can cache them in the node query cache.
+    """
+    def __init__(self, must=None, filters=None, should=None, must_not=None):
+        self.must = list(must or [])
+        self.filters = list(filters or [])
+        self.should = list(should or [])
+        self.must_not = list(must_not or [])
+    
+    def to_dict(self):
+        bool_dict = {}
+        for key, clauses in (("must", self.must), ("filter", self.filters),
+                             ("should", self.should), ("must_not", self.must_not)):
+            if clauses:
+                bool_dict[key] = [clause.to_dict() for clause in clauses]
+        return {"bool": bool_dict}
+
+class CriteriaQuery:
+    """Compiles product search criteria into one bool query.
+    
+    Criteria are combined with AND. A name criterion is full-text and goes
+    in must so it still ranks results; every other criterion is an exact
+    filter clause. Criteria can be given as one dict or a list of dicts:
+    
+        {"name": "laptop", "fuzzy": True}
+        {"price_range": {"min": 100, "max": 500}}
+        {"category": "Electronics"} or {"category": ["Books", "Electronics"]}
+        {"brand": "Apple"} or {"brand": ["Apple", "Sony"]}
+        {"min_rating": 4.0}
+        {"min_stock": 10}
+        {"date_range": {"start": "2024-01-01", "end": "2024-03-31"}}
+    """
+    def __init__(self, criteria):
+        if isinstance(criteria, dict):
+            criteria = [criteria]
+        self.criteria = list(criteria)
+    
+    def _exact(self, field, value):
+        if isinstance(value, (list, tuple, set)):
+            return TermsQuery(field, value)
+        return TermQuery(field, value)
+    
+    def build(self):
+        """Return the compiled BoolQuery."""
+        must = []
+        filters = []
+        
+        for criteria in self.criteria:
+            for key, value in criteria.items():
+                if key == "fuzzy":
+                    continue
+                elif key == "name":
+                    if criteria.get("fuzzy", False):
+                        must.append(MatchQuery("Name", value, "AUTO"))
+                    else:
+                        must.append(MatchPhraseQuery("Name", value))
+                elif key == "price_range":
+                    filters.append(RangeQuery("Price", gte=value.get("min"), lte=value.get("max")))
+                elif key == "category":
+                    filters.append(self._exact("Category", value))
+                elif key == "brand":
+                    filters.append(self._exact("Brand", value))
+                elif key == "min_rating":
+                    filters.append(RangeQuery("Rating", gte=value))
+                elif key == "min_stock":
+                    filters.append(RangeQuery("StockQty", gte=value))
+                elif key == "date_range":
+                    filters.append(RangeQuery("CreatedTime", gte=value.get("start"), lte=value.get("end")))
+                else:
+                    raise ValueError(f"Unknown search criterion: {key}")
+        
+        return BoolQuery(must=must, filters=filters)
+    
+    def to_dict(self):
+        return self.build().to_dict()
@@ -1,5 +1,18 @@
-"""Utility functions for ElasticSearch operations."""
+"""Utility functions for ElasticSearch operations.
 
-from .product_generator import generate_product_data, format_product_details
+Helpers are imported on first access; faker and NumPy load only when a
+generator is used.
+"""
 
-__all__ = ['generate_product_data', 'format_product_details'] 
\ No newline at end of file
+from .lazy import lazy_exports
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    'generate_product_data': '.product_generator',
+    'format_product_details': '.product_generator',
+    'chunk_actions': '.bulk_helpers',
+    'product_index_actions': '.bulk_helpers',
+    'QueryCache': '.cache',
+    'Instrumentation': '.instrumentation',
+    'generate_product_batches': '.vectorized_generator',
+    'iter_product_data': '.vectorized_generator'
+})
@@ -0,0 +1,153 @@
+"""Naming helpers for versioned product indices behind read and write aliases."""
+
+import re
+
+DEFAULT_INDEX_ALIAS = "ecommerce_products"
+
+def versioned_index_name(alias, version):
+    """Return the concrete index name for a version, e.g. ecommerce_products-v3.
+
+    Args:
+        alias (str): Alias the versioned indices sit behind
+        version (int): Index version
+
+    Returns:
+        str: Concrete index name
+    """
+    return f"{alias}-v{version}"
+
+def index_version(index_name, alias):
+    """Return the version of a concrete index named by versioned_index_name.
+
+    Args:
+        index_name (str): Concrete index name
+        alias (str): Alias the versioned indices sit behind
+
+    Returns:
+        int: Version, or None if the name is not a version of the alias
+    """
+    match = re.fullmatch(re.escape(alias) + r"-v(\d+)", index_name)
+    return int(match.group(1)) if match else None
+
+def next_index_version(index_names, alias):
+    """Return the version after the highest existing one (1 if there is none).
+
+    Args:
+        index_names (iterable): Existing concrete index names
+        alias (str): Alias the versioned indices sit behind
+
+    Returns:
+        int: Next free version
+    """
+    versions = [index_version(name, alias) for name in index_names]
+    return max([version for version in versions if version is not None], default=0) + 1
+
+def alias_definitions(read_alias, write_alias):
+    """Build the aliases section of a create-index body.
+
+    The write alias is marked as the write index, so writes keep working
+    while the read alias spans more than one index.
+
+    Args:
+        read_alias (str): Alias searches and lookups go through
+        write_alias (str): Alias indexing and updates go through
+
+    Returns:
+        dict: Alias name -> alias definition
+    """
+    aliases = {read_alias: {}}
+    aliases[write_alias] = {"is_write_index": True}
+    return aliases
+
+def create_index_body(mappings=None, aliases=None):
+    """Build a create-index body.
+
+    Args:
+        mappings (dict, optional): Index mappings
+        aliases (dict, optional): Aliases section, e.g. from alias_definitions
+
+    Returns:
+        dict: Request body, or None when there is nothing to send
+    """
+    body = {}
+    if mappings:
+        body["mappings"] = mappings
+    if aliases:
+        body["aliases"] = aliases
+    return body or None
+
+def alias_map(response):
+    """Turn a GET <target>/_alias response into concrete index -> alias names.
+
+    Args:
+        response (dict): Decoded _alias response
+
+    Returns:
+        dict: Concrete index name -> list of its aliases
+    """
+    return {index: list(data.get("aliases", {})) for index, data in response.items()}
+
+def latest_index(index_names, alias):
+    """Return the highest version among concrete indices of an alias.
+
+    Args:
+        index_names (iterable): Concrete index names
+        alias (str): Alias the versioned indices sit behind
+
+    Returns:
+        str: Index name; names that are not versions of the alias rank lowest
+    """
+    return max(index_names, key=lambda name: index_version(name, alias) or 0)
+
+def legacy_indices(current, read_alias, write_alias):
+    """Return the concrete indices that are named like one of the aliases.
+
+    Deployments from before versioned indices have a concrete index named
+    ecommerce_products, which blocks creating an alias of that name.
+
+    Args:
+        current (dict): Concrete index -> its aliases
+        read_alias (str): Alias searches and lookups go through
+        write_alias (str): Alias indexing, updates and bulk writes go through
+
+    Returns:
+        list: Names of the blocking concrete indices, sorted
+    """
+    return sorted(index for index in current if index in (read_alias, write_alias))
+
+def swap_alias_actions(read_alias, write_alias, current, new_index):
+    """Build _aliases actions moving the read and write aliases to a new index.
+
+    All actions go in one _aliases request, which ElasticSearch applies
+    atomically, so readers never see both versions or neither. A concrete
+    index named like one of the aliases (see legacy_indices) is deleted
+    with a remove_index action in the same request, so the alias can take
+    its name.
+
+    Args:
+        read_alias (str): Alias searches and lookups go through
+        write_alias (str): Alias indexing, updates and bulk writes go through
+        current (dict): Concrete index -> its aliases, for the indices the
+            aliases point at now; new_index itself is skipped
+        new_index (str): Concrete index the aliases should point at
+
+    Returns:
+        list: Actions for the _aliases API
+    """
+    actions = [
+        {"remove_index": {"index": index}}
+        for index in legacy_indices(current, read_alias, write_alias)
+        if index != new_index
+    ]
+    actions.extend(
+        {"remove": {"index": index, "alias": alias}}
+        for index, aliases in current.items()
+        if index != new_index
+        for alias in dict.fromkeys((read_alias, write_alias))
+        if alias in aliases
+    )
+    actions.extend(
+        {"add": dict(definition, index=new_index, alias=alias)}
+        for alias, definition in alias_definitions(read_alias, write_alias).items()
+    )
+    return actions
@@ -0,0 +1,298 @@
+"""Helpers for building and chunking _bulk request bodies."""
+
+import random
+from .documents import stamp_product, stamp_update
+from .serializer import DEFAULT_SERIALIZER
+
+DEFAULT_CHUNK_SIZE = 500
+DEFAULT_MAX_CHUNK_BYTES = 10 * 1024 * 1024
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_INITIAL_BACKOFF = 0.5
+DEFAULT_MAX_BACKOFF = 30.0
+MAX_FAILED_ITEMS = 100
+NDJSON_HEADERS = {"Content-Type": "application/x-ndjson"}
+
+def product_index_actions(products, index_name):
+    """Yield index actions for products, adding timestamps when missing.
+
+    Args:
+        products (iterable): Any iterable or generator of product documents
+        index_name (str): Target index name
+
+    Yields:
+        tuple: (action, source) pair for each product
+    """
+    for product in products:
+        yield {"index": {"_index": index_name}}, stamp_product(product)
+
+def update_actions(updates, index_name):
+    """Yield partial-update actions for products.
+
+    Args:
+        updates (iterable): Dicts with product_id and update_data
+        index_name (str): Target index name
+
+    Yields:
+        tuple: (action, source) pair for each update
+    """
+    for update in updates:
+        action = {"update": {"_index": index_name, "_id": update["product_id"]}}
+        yield action, {"doc": stamp_update(update["update_data"])}
+
+def price_update_actions(price_adjustments, index_name):
+    """Yield price update actions for products.
+
+    Args:
+        price_adjustments (iterable): Dicts with product_id and new_price
+        index_name (str): Target index name
+
+    Yields:
+        tuple: (action, source) pair for each adjustment
+    """
+    for adjustment in price_adjustments:
+        action = {"update": {"_index": index_name, "_id": adjustment["product_id"]}}
+        yield action, {"doc": stamp_update({"Price": adjustment["new_price"]})}
+
+def delete_actions(product_ids, index_name):
+    """Yield delete actions for product IDs.
+
+    Args:
+        product_ids (iterable): Product IDs to delete
+        index_name (str): Target index name
+
+    Yields:
+        tuple: (action, None) pair for each ID
+    """
+    for product_id in product_ids:
+        yield {"delete": {"_index": index_name, "_id": product_id}}, None
+
+def encode_action(action, source, serializer=DEFAULT_SERIALIZER):
+    """Encode one action (and its source, if any) as NDJSON lines.
+
+    Args:
+        action (dict): Bulk action metadata
+        source (dict): Document or partial update, None for deletes
+        serializer (object): JSON serializer producing bytes
+
+    Returns:
+        bytes: NDJSON lines terminated by a newline
+    """
+    if source is None:
+        return serializer.dumps(action) + b"\n"
+    return b"".join((serializer.dumps(action), b"\n", serializer.dumps(source), b"\n"))
+
+def build_bulk_body(actions, serializer=DEFAULT_SERIALIZER):
+    """Build an NDJSON body for a list of (action, source) pairs.
+
+    Args:
+        actions (list): (action, source) pairs
+        serializer (object): JSON serializer producing bytes
+
+    Returns:
+        bytes: NDJSON request body
+    """
+    return b"".join(encode_action(action, source, serializer) for action, source in actions)
+
+def chunk_actions(actions, chunk_size=DEFAULT_CHUNK_SIZE, max_chunk_bytes=DEFAULT_MAX_CHUNK_BYTES,
+                  serializer=DEFAULT_SERIALIZER):
+    """Group actions into NDJSON bodies bounded by count and byte size.
+
+    Only one chunk is held in memory at a time, so any iterable or generator
+    can be streamed. Each action is encoded to bytes exactly once and the
+    fragments are joined once per chunk. A single action larger than
+    max_chunk_bytes is sent on its own.
+
+    Args:
+        actions (iterable): (action, source) pairs; source is None for deletes
+        chunk_size (int): Maximum number of actions per chunk
+        max_chunk_bytes (int): Maximum encoded body size per chunk
+        serializer (object): JSON serializer producing bytes
+
+    Yields:
+        tuple: (list of (action, source) pairs, NDJSON body bytes)
+    """
+    chunk = []
+    lines = []
+    size = 0
+
+    for action, source in actions:
+        data = encode_action(action, source, serializer)
+        data_size = len(data)
+
+        if chunk and (len(chunk) >= chunk_size or size + data_size > max_chunk_bytes):
+            yield chunk, b"".join(lines)
+            chunk = []
+            lines = []
+            size = 0
+
+        chunk.append((action, source))
+        lines.append(data)
+        size += data_size
+
+    if chunk:
+        yield chunk, b"".join(lines)
+
+def split_bulk_items(chunk, items):
+    """Classify each bulk response item against the action that produced it.
+
+    Items rejected with 429 / es_rejected_execution_exception are returned for
+    retry; every other error is a permanent failure.
+
+    Args:
+        chunk (list): (action, source) pairs in the order they were sent
+        items (list): The "items" array of the bulk response
+
+    Returns:
+        tuple: (succeeded count, list of rejected pairs, list of failed items)
+    """
+    succeeded = 0
+    rejected = []
+    failed = []
+
+    for pair, item in zip(chunk, items):
+        operation, info = next(iter(item.items()))
+        status = info.get("status", 500)
+        error = info.get("error")
+
+        if status < 300 or (operation == "delete" and status == 404 and not error):
+            succeeded += 1
+        elif status == 429 or (isinstance(error, dict) and error.get("type") == "es_rejected_execution_exception"):
+            rejected.append(pair)
+        else:
+            failed.append({"action": pair[0], "status": status, "error": error})
+
+    return succeeded, rejected, failed
+
+def new_chunk_result(count):
+    """Return an empty result for a _bulk chunk of count actions (see record_bulk_response)."""
+    return {
+        "count": count, "ok": True, "took": 0,
+        "indexed": 0, "retried": 0, "failed": 0, "failed_items": []
+    }
+
+def record_bulk_response(result, pending, response):
+    """Add one _bulk response to a chunk result.
+
+    Args:
+        result (dict): Chunk result from new_chunk_result, updated in place
+        pending (list): (action, source) pairs sent in the request
+        response: Transport response with status_code, json() and text
+
+    Returns:
+        list: Rejected (action, source) pairs to resend; the whole request
+            when the cluster answered 429
+    """
+    if response.status_code == 429:
+        return pending
+    if response.status_code != 200:
+        result["failed"] += len(pending)
+        result["failed_items"].append({"status": response.status_code, "error": response.text})
+        return []
+    data = response.json()
+    result["took"] += data.get("took", 0)
+    succeeded, rejected, failed = split_bulk_items(pending, data.get("items", []))
+    result["indexed"] += succeeded
+    result["failed"] += len(failed)
+    result["failed_items"].extend(failed)
+    return rejected
+
+def record_bulk_error(result, pending, error):
+    """Count every pending action as failed after a request error (e.g. connection lost)."""
+    result["failed"] += len(pending)
+    result["failed_items"].append({"status": None, "error": str(error)})
+
+def record_retry(result, rejected, attempt, max_retries):
+    """Decide whether rejected actions are resent.
+
+    Args:
+        result (dict): Chunk result, updated in place
+        rejected (list): (action, source) pairs rejected with 429
+        attempt (int): Retry rounds already made
+        max_retries (int): Maximum retry rounds
+
+    Returns:
+        list: The pairs to resend; empty once retries are exhausted, in which
+            case they are recorded as failed
+    """
+    if not rejected:
+        return []
+    if attempt >= max_retries:
+        result["failed"] += len(rejected)
+        result["failed_items"].extend(
+            {"action": action, "status": 429, "error": "rejected after retries"}
+            for action, _ in rejected
+        )
+        return []
+    result["retried"] += len(rejected)
+    return rejected
+
+def finish_chunk_result(result):
+    """Mark a chunk result ok when nothing failed and return it."""
+    result["ok"] = result["failed"] == 0
+    return result
+
+def backoff_delay(attempt, initial_backoff=DEFAULT_INITIAL_BACKOFF, max_backoff=DEFAULT_MAX_BACKOFF):
+    """Return a fully jittered exponential backoff delay in seconds.
+
+    Args:
+        attempt (int): Zero-based retry attempt
+        initial_backoff (float): Base delay for the first retry
+        max_backoff (float): Upper bound on the delay
+
+    Returns:
+        float: Seconds to sleep before the next attempt
+    """
+    return random.uniform(0, min(max_backoff, initial_backoff * (2 ** attempt)))
+
+def new_bulk_summary():
+    """Return an empty bulk summary to fold chunk results into (see add_chunk_result)."""
+    return {
+        "took": 0, "errors": False, "indexed": 0, "retried": 0, "failed": 0,
+        "failed_items": [], "omitted_failed_items": 0
+    }
+
+def add_chunk_result(summary, chunk_result, max_failed_items=MAX_FAILED_ITEMS):
+    """Fold one chunk result into a bulk summary.
+
+    Only the first max_failed_items failure details are kept; later ones are
+    just counted in omitted_failed_items, so the summary stays small however
+    many chunks fail.
+
+    Args:
+        summary (dict): Summary from new_bulk_summary, updated in place
+        chunk_result (dict): Chunk result from streaming or parallel bulk
+        max_failed_items (int): Maximum failure details kept in the summary
+
+    Returns:
+        dict: The updated summary
+    """
+    summary["took"] += chunk_result["took"]
+    summary["indexed"] += chunk_result["indexed"]
+    summary["retried"] += chunk_result["retried"]
+    summary["failed"] += chunk_result["failed"]
+    summary["errors"] = summary["failed"] > 0
+
+    failed_items = chunk_result["failed_items"]
+    room = max(max_failed_items - len(summary["failed_items"]), 0)
+    summary["failed_items"].extend(failed_items[:room])
+    summary["omitted_failed_items"] += max(len(failed_items) - room, 0)
+    return summary
+
+def summarize_bulk_results(chunk_results, max_failed_items=MAX_FAILED_ITEMS):
+    """Combine per-chunk bulk results into a final summary.
+
+    Chunk results are folded in one at a time, so a generator is consumed
+    without holding every result.
+
+    Args:
+        chunk_results (iterable): Chunk results from streaming or parallel bulk
+        max_failed_items (int): Maximum failure details kept in the summary
+
+    Returns:
+        dict: Totals of indexed, retried and failed items, the first
+            max_failed_items failure details and omitted_failed_items
+    """
+    summary = new_bulk_summary()
+    for chunk_result in chunk_results:
+        add_chunk_result(summary, chunk_result, max_failed_items)
+    return summary
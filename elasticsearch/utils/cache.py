@@ -0,0 +1,106 @@
+"""In-process cache for search results."""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+
+class QueryCache:
+    """Thread-safe LRU cache with per-entry TTL for search results.
+
+    Entries are keyed by the request path plus the canonical JSON form of
+    the query body, so logically identical queries share an entry no
+    matter how their dicts were built. Values are returned as stored; the
+    clients store encoded JSON bytes, so every hit decodes to fresh
+    objects that callers can modify freely.
+    """
+
+    def __init__(self, max_entries=1024, ttl=60.0):
+        """Initialize the cache.
+
+        Args:
+            max_entries (int): Maximum cached queries before LRU eviction (default: 1024)
+            ttl (float): Seconds an entry stays valid (default: 60)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.generation = 0
+
+    @staticmethod
+    def make_key(path, body):
+        """Build a cache key from a request path and query body.
+
+        Values JSON cannot encode, such as datetimes in a range query, are
+        keyed by their str() form, matching how the request body is sent.
+
+        Args:
+            path (str): Request path, e.g. /ecommerce_products/_search
+            body (dict): Query body
+
+        Returns:
+            str: Canonical cache key
+        """
+        return path + "\n" + json.dumps(body, sort_keys=True, separators=(",", ":"), default=str)
+
+    def get(self, key):
+        """Return the cached value for a key, or None on a miss or expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key, value, generation=None):
+        """Store a value, evicting the least recently used entries if full.
+
+        Args:
+            key (str): Cache key from make_key
+            value: Value to cache
+            generation (int, optional): The cache generation read before the
+                request was sent; the value is dropped if an invalidation has
+                happened since, so in-flight reads cannot store stale results
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self):
+        """Drop every cached entry, e.g. after a write to the index."""
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+            self.generation += 1
+
+    def stats(self):
+        """Return hit/miss counters and the current size.
+
+        Returns:
+            dict: hits, misses, evictions, invalidations, size and hit_ratio
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+                "hit_ratio": self.hits / lookups if lookups else 0.0
+            }
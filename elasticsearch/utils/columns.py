@@ -0,0 +1,145 @@
+"""Compact column store for large search results."""
+
+import sys
+from array import array
+
+# Column name -> array typecode: int64 ("q") or float64 ("d")
+NUMERIC_COLUMNS = {"ID": "q", "Price": "d", "StockQty": "q", "Rating": "d"}
+STRING_COLUMNS = ("Category", "Subcategory", "Brand")
+DEFAULT_COLUMNS = tuple(NUMERIC_COLUMNS) + STRING_COLUMNS
+MISSING_INT = -1
+_MISSING = {"q": MISSING_INT, "d": float("nan")}
+_CONVERT = {"q": int, "d": float}
+_DTYPES = {"q": "int64", "d": "float64"}
+
+def _numpy():
+    """Import NumPy, which only the column store needs."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Columnar results require numpy: pip install numpy") from None
+    return numpy
+
+class ProductColumns:
+    """Search results stored column by column.
+
+    Numeric columns are NumPy arrays (ID and StockQty int64, Price and
+    Rating float64; missing values are -1 and NaN). String columns are lists
+    of interned strings, so every distinct Category or Brand is stored once
+    and each product costs one pointer per string column instead of a dict
+    of boxed values.
+    """
+
+    def __init__(self, columns, length):
+        """Initialize the column store; use product_columns to build one.
+
+        Args:
+            columns (dict): Column name -> NumPy array or list of strings
+            length (int): Number of products
+        """
+        self.columns = columns
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def keys(self):
+        """Return the column names."""
+        return self.columns.keys()
+
+    def row(self, position):
+        """Return one product as a dict, e.g. to display a single result.
+
+        Args:
+            position (int): Row number
+
+        Returns:
+            dict: Column name -> value
+        """
+        return {
+            name: column[position] if isinstance(column, list) else column[position].item()
+            for name, column in self.columns.items()
+        }
+
+    def nbytes(self):
+        """Return the approximate memory held by the columns in bytes."""
+        total = 0
+        for column in self.columns.values():
+            if isinstance(column, list):
+                total += sys.getsizeof(column) + sum(sys.getsizeof(value) for value in set(column))
+            else:
+                total += column.nbytes
+        return total
+
+class ColumnBuilder:
+    """Append products to typed column buffers, then build a ProductColumns.
+
+    Numeric values go into arrays of 8-byte machine values as products
+    stream in, so the source dicts can be dropped page by page.
+    """
+
+    def __init__(self, columns=DEFAULT_COLUMNS):
+        """Initialize the builder.
+
+        Args:
+            columns (iterable): Names from NUMERIC_COLUMNS and STRING_COLUMNS
+
+        Raises:
+            ValueError: If a column is neither numeric nor a string column
+            ImportError: If numpy is not installed
+        """
+        self.names = tuple(columns)
+        unknown = [name for name in self.names if name not in NUMERIC_COLUMNS and name not in STRING_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unsupported columns {unknown}; choose from {DEFAULT_COLUMNS}")
+        self.np = _numpy()
+        self.numeric = {name: array(NUMERIC_COLUMNS[name]) for name in self.names if name in NUMERIC_COLUMNS}
+        self.strings = {name: [] for name in self.names if name in STRING_COLUMNS}
+        self.length = 0
+
+    def append(self, product):
+        """Add one product source document."""
+        for name, values in self.numeric.items():
+            value = product.get(name)
+            code = values.typecode
+            values.append(_MISSING[code] if value is None else _CONVERT[code](value))
+        for name, values in self.strings.items():
+            value = product.get(name)
+            values.append(sys.intern(value) if isinstance(value, str) else value)
+        self.length += 1
+
+    def build(self):
+        """Return the collected columns; the NumPy arrays share the buffers' memory.
+
+        Returns:
+            ProductColumns: The collected columns
+        """
+        built = {}
+        for name in self.names:
+            if name in self.numeric:
+                values = self.numeric[name]
+                built[name] = self.np.frombuffer(values, dtype=_DTYPES[values.typecode])
+            else:
+                built[name] = self.strings[name]
+        return ProductColumns(built, self.length)
+
+def product_columns(products, columns=DEFAULT_COLUMNS):
+    """Collect products into a ProductColumns store, one product at a time.
+
+    Args:
+        products (iterable): Product source documents, e.g. from scan_products
+        columns (iterable): Names from NUMERIC_COLUMNS and STRING_COLUMNS
+
+    Returns:
+        ProductColumns: The collected columns
+    """
+    builder = ColumnBuilder(columns)
+    for product in products:
+        builder.append(product)
+    return builder.build()
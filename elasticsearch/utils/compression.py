@@ -0,0 +1,115 @@
+"""Gzip helpers and byte counters for compressed HTTP traffic."""
+
+import gzip
+import threading
+import zlib
+
+DEFAULT_COMPRESS_THRESHOLD = 1024
+COMPRESS_LEVEL = 6
+ACCEPT_ENCODING = "gzip, deflate"
+
+def gzip_body(body):
+    """Gzip a request body.
+
+    Args:
+        body (bytes): Encoded request body
+
+    Returns:
+        bytes: Compressed body
+    """
+    return gzip.compress(body, compresslevel=COMPRESS_LEVEL)
+
+def prepare_request_body(body, threshold=None):
+    """Gzip a request body when it is at least threshold bytes long.
+
+    Args:
+        body (bytes or str): Encoded request body, or None
+        threshold (int, optional): Minimum size to compress; None disables compression
+
+    Returns:
+        tuple: (body to send, raw size in bytes, True if the body was gzipped)
+    """
+    if body is None:
+        return None, 0, False
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    raw_size = len(body)
+    if threshold is not None and raw_size >= threshold:
+        return gzip_body(body), raw_size, True
+    return body, raw_size, False
+
+def decode_body(content, content_encoding):
+    """Undo the Content-Encoding of a response body.
+
+    Args:
+        content (bytes): Body as received on the wire
+        content_encoding (str): Value of the Content-Encoding header, if any
+
+    Returns:
+        bytes: Decoded body
+    """
+    encoding = (content_encoding or "").strip().lower()
+    if encoding == "gzip":
+        return gzip.decompress(content)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(content)
+        except zlib.error:
+            return zlib.decompress(content, -zlib.MAX_WBITS)
+    return content
+
+class TransferStats:
+    """Thread-safe counters for raw (uncompressed) versus wire bytes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Set every counter back to zero."""
+        with self._lock:
+            self.requests = 0
+            self.compressed_requests = 0
+            self.request_raw_bytes = 0
+            self.request_wire_bytes = 0
+            self.response_raw_bytes = 0
+            self.response_wire_bytes = 0
+
+    def record(self, request_raw, request_wire, response_raw, response_wire):
+        """Count one request/response exchange.
+
+        Args:
+            request_raw (int): Request body size before compression
+            request_wire (int): Request body size as sent
+            response_raw (int): Response body size after decompression
+            response_wire (int): Response body size as received
+        """
+        with self._lock:
+            self.requests += 1
+            if request_wire != request_raw:
+                self.compressed_requests += 1
+            self.request_raw_bytes += request_raw
+            self.request_wire_bytes += request_wire
+            self.response_raw_bytes += response_raw
+            self.response_wire_bytes += response_wire
+
+    def snapshot(self):
+        """Return the counters and how many bytes compression saved.
+
+        Returns:
+            dict: Request and response raw/wire bytes, saved_bytes and
+                compression_ratio (raw / wire over both directions)
+        """
+        with self._lock:
+            raw = self.request_raw_bytes + self.response_raw_bytes
+            wire = self.request_wire_bytes + self.response_wire_bytes
+            return {
+                "requests": self.requests,
+                "compressed_requests": self.compressed_requests,
+                "request_raw_bytes": self.request_raw_bytes,
+                "request_wire_bytes": self.request_wire_bytes,
+                "response_raw_bytes": self.response_raw_bytes,
+                "response_wire_bytes": self.response_wire_bytes,
+                "saved_bytes": raw - wire,
+                "compression_ratio": raw / wire if wire else 1.0
+            }
@@ -0,0 +1,60 @@
+"""Helpers for preparing product documents and partial updates before they are sent."""
+
+from datetime import datetime
+
+REQUIRED_PRODUCT_FIELDS = ("Name", "Description", "Category", "Price", "StockQty", "Brand")
+
+def stamp_product(product):
+    """Add CreatedTime and UpdatedTime to a product document when missing.
+
+    Args:
+        product (dict): Product document, updated in place
+
+    Returns:
+        dict: The same document, for chaining
+    """
+    if "CreatedTime" not in product:
+        product["CreatedTime"] = datetime.now().isoformat()
+    if "UpdatedTime" not in product:
+        product["UpdatedTime"] = datetime.now().isoformat()
+    return product
+
+def prepare_product(product):
+    """Validate a new product and add its timestamps.
+
+    Args:
+        product (dict): Product document, updated in place
+
+    Returns:
+        dict: The same document, ready to index
+
+    Raises:
+        ValueError: If one of REQUIRED_PRODUCT_FIELDS is missing
+    """
+    for field in REQUIRED_PRODUCT_FIELDS:
+        if field not in product:
+            raise ValueError(f"Missing required field: {field}")
+    return stamp_product(product)
+
+def stamp_update(update_data):
+    """Set UpdatedTime on a partial update.
+
+    Args:
+        update_data (dict): Fields to update, updated in place
+
+    Returns:
+        dict: The same fields, for chaining
+    """
+    update_data["UpdatedTime"] = datetime.now().isoformat()
+    return update_data
+
+def upsert_body(update_data):
+    """Build an _update body applying a partial document, creating it if missing.
+
+    Args:
+        update_data (dict): Fields to update; UpdatedTime is set in place
+
+    Returns:
+        dict: _update request body
+    """
+    return {"doc": stamp_update(update_data), "doc_as_upsert": True}
@@ -0,0 +1,129 @@
+"""Bounded-memory export of the products index to NDJSON."""
+
+import argparse
+import contextvars
+import gzip
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .pagination import DEFAULT_KEEP_ALIVE, DEFAULT_PAGE_SIZE, EXPORT_SORT
+
+def print_progress(documents, elapsed):
+    """Default progress reporter: documents written and throughput so far."""
+    rate = documents / elapsed if elapsed > 0 else 0.0
+    print(f"Exported {documents} products in {elapsed:.1f}s ({rate:.0f} docs/sec)")
+
+def _open_output(output_path, compress):
+    """Open the output file in binary mode, gzip-compressed if requested."""
+    if compress:
+        return gzip.open(output_path, "wb")
+    return open(output_path, "wb")
+
+def export_products(client, output_path, query=None, fields=None, slices=4,
+                    page_size=DEFAULT_PAGE_SIZE, compress=None, keep_alive=DEFAULT_KEEP_ALIVE,
+                    progress=None, progress_interval=5.0, index=None):
+    """Stream the products index to an NDJSON file using parallel PIT slices.
+
+    All slices share one point in time and run in their own thread. Each
+    slice writes a full page to the file before fetching the next one, so
+    peak memory is one page per slice whatever the size of the index.
+
+    Args:
+        client (BaseElasticClient): Client used to talk to ElasticSearch
+        output_path (str): Destination file; one product _source per line
+        query (dict, optional): Query DSL clause to restrict the export
+        fields (list, optional): Source fields to export; all fields when omitted
+        slices (int): Number of slices read in parallel
+        page_size (int): Hits fetched per request per slice
+        compress (bool, optional): Gzip the output; defaults to True for .gz paths
+        keep_alive (str): How long to keep the point in time open between pages
+        progress (callable, optional): Called as progress(documents, elapsed_seconds),
+            e.g. print_progress; no progress is reported when omitted
+        progress_interval (float): Minimum seconds between progress calls
+        index (str, optional): Index or alias to export; the client's read alias by default
+
+    Returns:
+        dict: Export statistics (documents, bytes, seconds, docs_per_sec, failed_slices)
+    """
+    if compress is None:
+        compress = output_path.endswith(".gz")
+
+    pit_id = client.open_point_in_time(index, keep_alive)
+    if pit_id is None:
+        return None
+
+    dumps = client.transport.serializer.dumps
+    lock = threading.Lock()
+    stats = {"documents": 0, "bytes": 0, "failed_slices": []}
+    start = time.perf_counter()
+    last_report = [start]
+
+    def export_slice(output, slice_id):
+        pages = client.scan_point_in_time(
+            pit_id, query, page_size, EXPORT_SORT, keep_alive,
+            slice_id=slice_id, max_slices=slices, fields=fields
+        )
+        for hits, _ in pages:
+            if not hits:
+                continue
+            data = b"".join(dumps(hit.get("_source", {})) + b"\n" for hit in hits)
+
+            with lock:
+                output.write(data)
+                stats["documents"] += len(hits)
+                stats["bytes"] += len(data)
+                now = time.perf_counter()
+                if progress and now - last_report[0] >= progress_interval:
+                    last_report[0] = now
+                    progress(stats["documents"], now - start)
+
+    try:
+        with _open_output(output_path, compress) as output:
+            with ThreadPoolExecutor(max_workers=slices) as executor:
+                futures = {
+                    executor.submit(contextvars.copy_context().run, export_slice, output, slice_id): slice_id
+                    for slice_id in range(slices)
+                }
+                for future, slice_id in futures.items():
+                    try:
+                        future.result()
+                    except Exception as e:
+                        client.output.error("Export of slice %s failed: %s", slice_id, e)
+                        stats["failed_slices"].append(slice_id)
+    finally:
+        client.close_point_in_time(pit_id)
+
+    elapsed = time.perf_counter() - start
+    stats["seconds"] = elapsed
+    stats["docs_per_sec"] = stats["documents"] / elapsed if elapsed > 0 else 0.0
+    if progress:
+        progress(stats["documents"], elapsed)
+    return stats
+
+def main(argv=None):
+    """Command line entry point: python -m elasticsearch.utils.export OUTPUT."""
+    from ..clients.sync_client import EcommerceElasticClient
+
+    parser = argparse.ArgumentParser(description="Export the products index to NDJSON")
+    parser.add_argument("output", help="Output file (.gz for gzip compression)")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=9200)
+    parser.add_argument("--slices", type=int, default=4)
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument("--fields", help="Comma-separated source fields to export")
+    parser.add_argument("--index", help="Index or alias to export (default: ecommerce_products)")
+    args = parser.parse_args(argv)
+
+    fields = args.fields.split(",") if args.fields else None
+    client = EcommerceElasticClient(args.host, args.port)
+    try:
+        stats = export_products(
+            client, args.output, fields=fields, slices=args.slices, page_size=args.page_size,
+            progress=print_progress, index=args.index
+        )
+    finally:
+        client.close()
+    return 0 if stats and not stats["failed_slices"] else 1
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,88 @@
+"""Facet aggregations for category pages: term counts, price ranges and a rating histogram."""
+
+TERMS_FACETS = ("Category", "Subcategory", "Brand")
+DEFAULT_TERMS_SIZE = 20
+DEFAULT_PRICE_RANGES = ((None, 50), (50, 100), (100, 250), (250, 500), (500, 1000), (1000, None))
+DEFAULT_RATING_INTERVAL = 1
+PRICE_FACET = "price"
+RATING_FACET = "rating"
+FACETS_FILTER_PATH = (
+    "hits.total.value,aggregations.*.buckets.key,aggregations.*.buckets.doc_count,"
+    "aggregations.*.buckets.from,aggregations.*.buckets.to"
+)
+
+def facet_aggregations(terms_fields=TERMS_FACETS, terms_size=DEFAULT_TERMS_SIZE,
+                       price_ranges=DEFAULT_PRICE_RANGES, rating_interval=DEFAULT_RATING_INTERVAL):
+    """Build the aggregations for a facet request.
+
+    Args:
+        terms_fields (iterable): Keyword fields to count values of
+        terms_size (int): Buckets per terms facet, most frequent first
+        price_ranges (iterable): (from, to) Price bounds; None leaves a side open.
+            Empty to skip the price facet
+        rating_interval (float): Rating histogram bucket width; None to skip it
+
+    Returns:
+        dict: Aggregation name -> aggregation definition
+    """
+    aggs = {field: {"terms": {"field": field, "size": terms_size}} for field in terms_fields}
+    if price_ranges:
+        ranges = []
+        for low, high in price_ranges:
+            bounds = {}
+            if low is not None:
+                bounds["from"] = low
+            if high is not None:
+                bounds["to"] = high
+            ranges.append(bounds)
+        aggs[PRICE_FACET] = {"range": {"field": "Price", "ranges": ranges}}
+    if rating_interval:
+        aggs[RATING_FACET] = {
+            "histogram": {
+                "field": "Rating",
+                "interval": rating_interval,
+                "min_doc_count": 0,
+                "extended_bounds": {"min": 0, "max": 5}
+            }
+        }
+    return aggs
+
+def facet_body(query=None, **facet_options):
+    """Build a size=0 search body returning only facet aggregations.
+
+    Args:
+        query (dict, optional): Query DSL clause restricting the counted products
+        **facet_options: Passed to facet_aggregations
+
+    Returns:
+        dict: Search request body
+    """
+    body = {"size": 0, "track_total_hits": True, "aggs": facet_aggregations(**facet_options)}
+    if query:
+        body["query"] = query
+    return body
+
+def parse_facets(response, names=()):
+    """Turn a facet search response into compact bucket lists.
+
+    Args:
+        response (dict): Decoded search response
+        names (iterable): Aggregation names to report even when they have no
+            buckets (filter_path drops empty aggregations from the response)
+
+    Returns:
+        dict: total (matching products), one list of (key, count) tuples per
+            terms facet and for rating, and (from, to, count) tuples for price
+            with None for an open bound
+    """
+    facets = {"total": response.get("hits", {}).get("total", {}).get("value", 0)}
+    facets.update((name, []) for name in names)
+    for name, aggregation in response.get("aggregations", {}).items():
+        buckets = aggregation.get("buckets", [])
+        if name == PRICE_FACET:
+            facets[name] = [
+                (bucket.get("from"), bucket.get("to"), bucket.get("doc_count", 0)) for bucket in buckets
+            ]
+        else:
+            facets[name] = [(bucket["key"], bucket.get("doc_count", 0)) for bucket in buckets]
+    return facets
@@ -0,0 +1,45 @@
+"""Helpers for reading and tuning index settings around bulk loads."""
+
+BULK_LOAD_SETTINGS = {
+    "index.refresh_interval": "-1",
+    "index.number_of_replicas": 0
+}
+FORCE_MERGE_TIMEOUT = 3600
+
+def flatten_settings(settings, prefix=""):
+    """Flatten nested index settings into dotted keys.
+
+    Args:
+        settings (dict): Settings as returned by GET _settings, nested or flat
+        prefix (str): Key prefix used while recursing
+
+    Returns:
+        dict: Settings keyed like "index.refresh_interval"
+    """
+    flat = {}
+    for key, value in settings.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_settings(value, name + "."))
+        else:
+            flat[name] = value
+    return flat
+
+def current_settings(response, index_name, keys):
+    """Pick the current values of the given settings from a GET _settings response.
+
+    Keys that are not set explicitly on the index map to None, which resets
+    them to the cluster default when written back.
+
+    Args:
+        response (dict): Decoded GET /<index>/_settings response
+        index_name (str): Index (or alias) the settings were read for
+        keys (iterable): Dotted setting names
+
+    Returns:
+        dict: Setting name -> current value or None
+    """
+    # An alias resolves to the concrete index name in the response
+    index_settings = response.get(index_name) or next(iter(response.values()), {})
+    flat = flatten_settings(index_settings.get("settings", {}))
+    return {key: flat.get(key) for key in keys}
@@ -0,0 +1,364 @@
+"""Per-operation request instrumentation: latency, bytes, server took and client overhead."""
+
+import contextvars
+import functools
+import inspect
+import threading
+import time
+from collections import deque
+from .output import logger
+
+DEFAULT_RESERVOIR_SIZE = 2048
+
+_current_operation = contextvars.ContextVar("elasticsearch_operation", default=None)
+
+def current_operation():
+    """Return the OperationScope of the client call in progress, or None."""
+    return _current_operation.get()
+
+def is_failure(status_code):
+    """Return True for HTTP statuses counted as failed requests (>= 400, except 404)."""
+    return status_code >= 400 and status_code != 404
+
+class LatencyStats:
+    """Latency summary over a bounded reservoir of the most recent samples.
+
+    Count, mean and max cover every sample; percentiles are computed from the
+    last reservoir_size samples so memory stays bounded.
+    """
+
+    def __init__(self, reservoir_size=DEFAULT_RESERVOIR_SIZE):
+        self.samples = deque(maxlen=reservoir_size)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value):
+        """Add one latency sample in seconds."""
+        self.samples.append(value)
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def snapshot(self):
+        """Return p50/p95/p99, mean and max in milliseconds."""
+        ordered = sorted(self.samples)
+
+        def rank(percent):
+            if not ordered:
+                return 0.0
+            index = max(int(round(percent / 100.0 * len(ordered))) - 1, 0)
+            return ordered[min(index, len(ordered) - 1)] * 1000
+
+        return {
+            "p50": rank(50),
+            "p95": rank(95),
+            "p99": rank(99),
+            "mean": self.total / self.count * 1000 if self.count else 0.0,
+            "max": self.max * 1000
+        }
+
+class OperationScope:
+    """Accumulates the HTTP requests made during one client operation.
+
+    The transports add to the scope of the calling context; worker threads
+    and asyncio tasks started inside the operation share it, so updates are
+    locked.
+    """
+
+    def __init__(self, instrumentation, operation):
+        self.instrumentation = instrumentation
+        self.operation = operation
+        self.requests = 0
+        self.failed_requests = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.network_seconds = 0.0
+        self.took_ms = 0
+        self.closed = False
+        self._lock = threading.Lock()
+
+    def add_request(self, request_bytes, response_bytes, network_seconds, failed=False):
+        """Count one HTTP exchange made on behalf of the operation."""
+        with self._lock:
+            if not self.closed:
+                self.requests += 1
+                self.failed_requests += 1 if failed else 0
+                self.request_bytes += request_bytes
+                self.response_bytes += response_bytes
+                self.network_seconds += network_seconds
+                return
+        self._record_late(requests=1, failed_requests=1 if failed else 0, request_bytes=request_bytes,
+                          response_bytes=response_bytes, network_time=network_seconds)
+
+    def add_took(self, took_ms):
+        """Add the server-side took reported by a decoded response."""
+        with self._lock:
+            if not self.closed:
+                self.took_ms += took_ms
+                return
+        self._record_late(took=took_ms)
+
+    def _record_late(self, **values):
+        """Record work that finished after the operation returned, e.g. a
+        pending bulk future, on its own and without a latency sample."""
+        record = {
+            "operation": self.operation, "latency": None, "network_time": 0.0,
+            "client_overhead": None, "requests": 0, "failed_requests": 0,
+            "request_bytes": 0, "response_bytes": 0, "took": 0, "error": False
+        }
+        record.update(values)
+        self.instrumentation.record(record)
+
+    def close(self, latency, error=False):
+        """Finish the operation and hand its record to the instrumentation."""
+        with self._lock:
+            self.closed = True
+            record = {
+                "operation": self.operation,
+                "latency": latency,
+                "network_time": self.network_seconds,
+                "client_overhead": max(latency - self.network_seconds, 0.0),
+                "requests": self.requests,
+                "failed_requests": self.failed_requests,
+                "request_bytes": self.request_bytes,
+                "response_bytes": self.response_bytes,
+                "took": self.took_ms,
+                "error": error
+            }
+        self.instrumentation.record(record)
+
+class Instrumentation:
+    """Thread-safe per-operation statistics plus hooks for external exporters.
+
+    Each finished client operation produces one record dict with operation,
+    latency, network_time and client_overhead (seconds; latency and overhead
+    are None for background requests that finished after their operation),
+    requests, failed_requests (HTTP status >= 400 other than 404),
+    request_bytes, response_bytes, took (server milliseconds) and error (the
+    method raised). Records are aggregated for stats() and passed to every
+    registered hook, e.g. to feed Prometheus histograms.
+    """
+
+    def __init__(self, reservoir_size=DEFAULT_RESERVOIR_SIZE):
+        """Initialize the instrumentation.
+
+        Args:
+            reservoir_size (int): Recent latency samples kept per operation for percentiles
+        """
+        self.reservoir_size = reservoir_size
+        self._operations = {}
+        self._hooks = []
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook):
+        """Register a callable invoked as hook(record) after every operation."""
+        with self._lock:
+            self._hooks.append(hook)
+
+    def remove_hook(self, hook):
+        """Unregister a hook added with add_hook."""
+        with self._lock:
+            self._hooks.remove(hook)
+
+    def record(self, record):
+        """Aggregate one operation record and pass it to the hooks."""
+        with self._lock:
+            entry = self._operations.get(record["operation"])
+            if entry is None:
+                entry = self._operations[record["operation"]] = {
+                    "count": 0, "errors": 0, "requests": 0, "failed_requests": 0,
+                    "request_bytes": 0, "response_bytes": 0, "took_ms": 0,
+                    "latency": LatencyStats(self.reservoir_size),
+                    "network_seconds": 0.0, "client_overhead_seconds": 0.0
+                }
+            entry["requests"] += record["requests"]
+            entry["failed_requests"] += record["failed_requests"]
+            entry["request_bytes"] += record["request_bytes"]
+            entry["response_bytes"] += record["response_bytes"]
+            entry["took_ms"] += record["took"]
+            entry["network_seconds"] += record["network_time"]
+            if record["latency"] is not None:
+                entry["count"] += 1
+                entry["errors"] += 1 if record["error"] else 0
+                entry["latency"].add(record["latency"])
+                entry["client_overhead_seconds"] += record["client_overhead"]
+            hooks = list(self._hooks)
+
+        for hook in hooks:
+            try:
+                hook(record)
+            except Exception:
+                logger.exception("Instrumentation hook failed")
+
+    def stats(self):
+        """Return a snapshot of the statistics of every operation.
+
+        Returns:
+            dict: Operation name -> count, errors, requests, failed_requests, latency_ms
+                (p50/p95/p99/mean/max), request_bytes, response_bytes,
+                server_took_ms, network_ms and client_overhead_ms (totals)
+        """
+        with self._lock:
+            return {
+                operation: {
+                    "count": entry["count"],
+                    "errors": entry["errors"],
+                    "requests": entry["requests"],
+                    "failed_requests": entry["failed_requests"],
+                    "latency_ms": entry["latency"].snapshot(),
+                    "request_bytes": entry["request_bytes"],
+                    "response_bytes": entry["response_bytes"],
+                    "server_took_ms": entry["took_ms"],
+                    "network_ms": entry["network_seconds"] * 1000,
+                    "client_overhead_ms": entry["client_overhead_seconds"] * 1000
+                }
+                for operation, entry in self._operations.items()
+            }
+
+    def reset(self):
+        """Drop every collected statistic; hooks stay registered."""
+        with self._lock:
+            self._operations = {}
+
+def _open_scope(client, operation):
+    """Start a scope unless an outer operation is already being recorded."""
+    instrumentation = getattr(client, "instrumentation", None)
+    if instrumentation is None or _current_operation.get() is not None:
+        return None
+    return OperationScope(instrumentation, operation)
+
+def _scoped_generator(scope, generator, active=0.0):
+    """Run a generator inside an operation scope and close the scope when it ends.
+
+    Args:
+        scope (OperationScope): Scope the generator's requests are recorded in
+        generator (generator): Generator to drive
+        active (float): Seconds already spent on the operation, e.g. by the
+            call that created the generator
+
+    Yields:
+        The generator's items
+    """
+    error = False
+    try:
+        while True:
+            token = _current_operation.set(scope)
+            started = time.perf_counter()
+            try:
+                item = next(generator)
+            except StopIteration:
+                return
+            except BaseException:
+                error = True
+                raise
+            finally:
+                active += time.perf_counter() - started
+                _current_operation.reset(token)
+            yield item
+    finally:
+        token = _current_operation.set(scope)
+        try:
+            generator.close()
+        finally:
+            _current_operation.reset(token)
+        scope.close(active, error)
+
+async def _scoped_async_generator(scope, generator, active=0.0):
+    """Async counterpart of _scoped_generator."""
+    error = False
+    try:
+        while True:
+            token = _current_operation.set(scope)
+            started = time.perf_counter()
+            try:
+                item = await generator.__anext__()
+            except StopAsyncIteration:
+                return
+            except BaseException:
+                error = True
+                raise
+            finally:
+                active += time.perf_counter() - started
+                _current_operation.reset(token)
+            yield item
+    finally:
+        await generator.aclose()
+        scope.close(active, error)
+
+def instrumented(method):
+    """Record calls to a client method as one operation named after it.
+
+    Works on plain methods, coroutines, generators and async generators.
+    Nested instrumented calls are attributed to the outermost operation.
+    For generators only the time spent producing items counts as latency,
+    not the time the caller spends consuming them. A method or coroutine
+    that returns a generator, such as a search called with stream=True,
+    stays open until the generator is exhausted or closed, so the paging
+    requests are recorded under the method's own name; a stream that is
+    never iterated is not recorded.
+    """
+    operation = method.__name__
+
+    if inspect.isasyncgenfunction(method):
+        @functools.wraps(method)
+        async def async_generator_wrapper(self, *args, **kwargs):
+            scope = _open_scope(self, operation)
+            if scope is None:
+                async for item in method(self, *args, **kwargs):
+                    yield item
+                return
+            async for item in _scoped_async_generator(scope, method(self, *args, **kwargs)):
+                yield item
+        return async_generator_wrapper
+
+    if inspect.isgeneratorfunction(method):
+        @functools.wraps(method)
+        def generator_wrapper(self, *args, **kwargs):
+            scope = _open_scope(self, operation)
+            if scope is None:
+                yield from method(self, *args, **kwargs)
+                return
+            yield from _scoped_generator(scope, method(self, *args, **kwargs))
+        return generator_wrapper
+
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def coroutine_wrapper(self, *args, **kwargs):
+            scope = _open_scope(self, operation)
+            if scope is None:
+                return await method(self, *args, **kwargs)
+            token = _current_operation.set(scope)
+            started = time.perf_counter()
+            try:
+                result = await method(self, *args, **kwargs)
+            except BaseException:
+                scope.close(time.perf_counter() - started, error=True)
+                raise
+            finally:
+                _current_operation.reset(token)
+            if inspect.isasyncgen(result):
+                return _scoped_async_generator(scope, result, time.perf_counter() - started)
+            scope.close(time.perf_counter() - started)
+            return result
+        return coroutine_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        scope = _open_scope(self, operation)
+        if scope is None:
+            return method(self, *args, **kwargs)
+        token = _current_operation.set(scope)
+        started = time.perf_counter()
+        try:
+            result = method(self, *args, **kwargs)
+        except BaseException:
+            scope.close(time.perf_counter() - started, error=True)
+            raise
+        finally:
+            _current_operation.reset(token)
+        if inspect.isgenerator(result):
+            return _scoped_generator(scope, result, time.perf_counter() - started)
+        scope.close(time.perf_counter() - started)
+        return result
+    return wrapper
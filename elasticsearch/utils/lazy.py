@@ -0,0 +1,33 @@
+"""Lazy package exports, so importing a package does not import its submodules."""
+
+import importlib
+import sys
+
+def lazy_exports(module_name, mapping):
+    """Build the module-level hooks that import a package's exports on first access.
+
+    Usage in a package __init__:
+        __all__, __getattr__, __dir__ = lazy_exports(__name__, {"Name": ".submodule"})
+
+    Args:
+        module_name (str): The package's __name__
+        mapping (dict): Exported name -> relative module that defines it
+
+    Returns:
+        tuple: (__all__ list, module __getattr__, module __dir__)
+    """
+    exports = dict(mapping)
+
+    def __getattr__(name):
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, module_name), name)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[module_name])) | set(exports))
+
+    return list(exports), __getattr__, __dir__
@@ -0,0 +1,41 @@
+"""Helpers for looking up many products by ID with _mget."""
+
+DEFAULT_MGET_BATCH_SIZE = 500
+
+def id_batches(product_ids, batch_size=DEFAULT_MGET_BATCH_SIZE):
+    """Split a list of IDs into bounded batches, keeping their order.
+
+    Args:
+        product_ids (list): Product IDs to look up
+        batch_size (int): Maximum IDs per _mget request
+
+    Yields:
+        list: Consecutive slices of the IDs, as strings
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    ids = [str(product_id) for product_id in product_ids]
+    for start in range(0, len(ids), batch_size):
+        yield ids[start:start + batch_size]
+
+def mget_sources(result, ids):
+    """Extract product sources from an _mget response, in request order.
+
+    Docs are matched to the requested IDs by _id rather than by position,
+    so a doc trimmed from the response (e.g. an error entry) cannot shift
+    the products after it.
+
+    Args:
+        result (dict): Decoded _mget response, including docs._id
+        ids (list): IDs of the batch the response answers
+
+    Returns:
+        list: One product dict per requested ID, or None where it was not
+            found or its lookup failed
+    """
+    sources = {
+        doc["_id"]: doc.get("_source", {})
+        for doc in result.get("docs", [])
+        if doc.get("found") and "_id" in doc
+    }
+    return [sources.get(product_id) for product_id in ids]
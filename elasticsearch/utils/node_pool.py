@@ -0,0 +1,200 @@
+"""Multi-node selection, per-node circuit breakers and sniffing helpers for the transports."""
+
+import threading
+import time
+from urllib.parse import urlsplit
+
+ROUND_ROBIN = "round_robin"
+LEAST_IN_FLIGHT = "least_in_flight"
+SELECTORS = (ROUND_ROBIN, LEAST_IN_FLIGHT)
+DEFAULT_DEAD_TIMEOUT = 60.0
+DEFAULT_MAX_DEAD_TIMEOUT = 30 * 60.0
+DEFAULT_FAILURE_THRESHOLD = 3
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+class NoLiveNodesError(ConnectionError):
+    """Raised without sending a request when every node's circuit is open."""
+
+def node_url(node, scheme='http', port=9200):
+    """Normalize a node address to a base URL.
+
+    Args:
+        node (str, tuple or dict): "host", "host:port", "scheme://host:port",
+            a (host, port) tuple or a {"host", "port", "scheme"} dict
+        scheme (str): Scheme used when the address has none
+        port (int): Port used when the address has none
+
+    Returns:
+        str: Base URL such as http://es1:9200
+    """
+    if isinstance(node, dict):
+        return f"{node.get('scheme', scheme)}://{node['host']}:{node.get('port', port)}"
+    if isinstance(node, tuple):
+        host, node_port = node
+        return f"{scheme}://{host}:{node_port}"
+    parts = urlsplit(node if "://" in node else f"{scheme}://{node}")
+    return f"{parts.scheme}://{parts.hostname}:{parts.port or port}"
+
+def sniffed_urls(nodes_info, scheme='http'):
+    """Extract node base URLs from a GET _nodes/http response.
+
+    Args:
+        nodes_info (dict): Decoded _nodes/http response
+        scheme (str): Scheme to reach the nodes with
+
+    Returns:
+        list: Base URLs of every node publishing an HTTP address
+    """
+    urls = []
+    for info in nodes_info.get("nodes", {}).values():
+        address = info.get("http", {}).get("publish_address")
+        if address:
+            # publish_address is "ip:port" or "hostname/ip:port"
+            urls.append(node_url(address.rsplit("/", 1)[-1], scheme))
+    return urls
+
+class Node:
+    """One ElasticSearch node and its circuit breaker state."""
+
+    __slots__ = ("base_url", "in_flight", "failures", "dead_until", "probing", "requests")
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.in_flight = 0
+        self.failures = 0
+        self.dead_until = None
+        self.probing = False
+        self.requests = 0
+
+    def state(self, now):
+        """Return the circuit state: closed, open or half_open (due for a trial request)."""
+        if self.dead_until is None:
+            return CLOSED
+        return OPEN if now < self.dead_until else HALF_OPEN
+
+class NodePool:
+    """Thread-safe set of nodes requests are spread across.
+
+    ``round_robin`` cycles through the live nodes; ``least_in_flight`` picks
+    the live node with the fewest requests outstanding. Each node has a
+    circuit breaker: after failure_threshold consecutive failures its
+    circuit opens and the node is skipped for dead_timeout seconds. Then a
+    single trial request is let through (half open); success closes the
+    circuit, failure opens it again for twice as long, up to
+    max_dead_timeout. When every circuit is open, acquire() raises
+    NoLiveNodesError at once instead of waiting on an unhealthy node.
+    """
+
+    def __init__(self, urls, selector=ROUND_ROBIN, dead_timeout=DEFAULT_DEAD_TIMEOUT,
+                 max_dead_timeout=DEFAULT_MAX_DEAD_TIMEOUT, failure_threshold=DEFAULT_FAILURE_THRESHOLD):
+        """Initialize the pool.
+
+        Args:
+            urls (list): Base URLs of the seed nodes
+            selector (str): "round_robin" (default) or "least_in_flight"
+            dead_timeout (float): Seconds a node is skipped once its circuit opens
+            max_dead_timeout (float): Upper bound on the doubled dead timeout
+            failure_threshold (int): Consecutive failures that open a node's circuit
+        """
+        if selector not in SELECTORS:
+            raise ValueError(f"selector must be one of {SELECTORS}, got {selector!r}")
+        if not urls:
+            raise ValueError("At least one node is required")
+        self.selector = selector
+        self.dead_timeout = dead_timeout
+        self.max_dead_timeout = max_dead_timeout
+        self.failure_threshold = max(1, failure_threshold)
+        self._lock = threading.Lock()
+        self._next = 0
+        self.nodes = [Node(url) for url in dict.fromkeys(urls)]
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def acquire(self):
+        """Pick a node for one request and count it as in flight.
+
+        Returns:
+            Node: The chosen node; pass it to release() when the request ends
+
+        Raises:
+            NoLiveNodesError: If every node's circuit is open
+        """
+        now = time.monotonic()
+        with self._lock:
+            live = [
+                node for node in self.nodes
+                if node.state(now) == CLOSED or (node.state(now) == HALF_OPEN and not node.probing)
+            ]
+            if not live:
+                retry_in = min(node.dead_until for node in self.nodes if node.dead_until is not None) - now
+                raise NoLiveNodesError(
+                    f"All {len(self.nodes)} node(s) are unavailable; next retry in {max(retry_in, 0):.1f}s"
+                )
+            # A half-open node takes one trial request, then waits for its outcome
+            half_open = [node for node in live if node.state(now) == HALF_OPEN]
+            if half_open:
+                node = half_open[0]
+                node.probing = True
+            elif self.selector == LEAST_IN_FLIGHT:
+                node = min(live, key=lambda node: node.in_flight)
+            else:
+                node = live[self._next % len(live)]
+                self._next += 1
+            node.in_flight += 1
+            node.requests += 1
+            return node
+
+    def release(self, node, alive=True):
+        """Finish a request on a node and record whether the node answered.
+
+        Args:
+            node (Node): Node returned by acquire()
+            alive (bool): False if the node could not be reached, timed out or
+                answered as unavailable
+        """
+        with self._lock:
+            node.in_flight -= 1
+            node.probing = False
+            if alive:
+                node.failures = 0
+                node.dead_until = None
+            else:
+                node.failures += 1
+                if node.failures >= self.failure_threshold:
+                    opened = node.failures - self.failure_threshold
+                    timeout = min(self.dead_timeout * 2 ** opened, self.max_dead_timeout)
+                    node.dead_until = time.monotonic() + timeout
+
+    def set_urls(self, urls):
+        """Replace the node set, e.g. after sniffing; known nodes keep their state.
+
+        Args:
+            urls (list): Base URLs of the current nodes; ignored when empty
+        """
+        if not urls:
+            return
+        with self._lock:
+            known = {node.base_url: node for node in self.nodes}
+            self.nodes = [known.get(url) or Node(url) for url in dict.fromkeys(urls)]
+
+    def snapshot(self):
+        """Return the state of every node.
+
+        Returns:
+            list: One dict per node with url, state, in_flight, failures and requests
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "url": node.base_url,
+                    "state": node.state(now),
+                    "in_flight": node.in_flight,
+                    "failures": node.failures,
+                    "requests": node.requests
+                }
+                for node in self.nodes
+            ]
@@ -0,0 +1,78 @@
+"""Client output modes: silent, structured logging, or pretty-printed display."""
+
+import json
+import logging
+
+SILENT = "silent"
+LOG = "log"
+DISPLAY = "display"
+OUTPUT_MODES = (SILENT, LOG, DISPLAY)
+
+logger = logging.getLogger("elasticsearch.ecommerce")
+
+class ClientOutput:
+    """Routes client messages according to the configured output mode.
+
+    - silent: informational messages and hits are dropped; errors still go
+      to the logger, so failures are never swallowed
+    - log: everything goes to the logger with lazy %-style formatting, and
+      hits are only logged at DEBUG level
+    - display: the demo-friendly behaviour of printing every message and
+      every hit with format_product_details
+
+    Messages take logging-style arguments, so nothing is formatted unless it
+    is actually emitted.
+    """
+
+    def __init__(self, mode=SILENT, logger=logger):
+        """Initialize the output.
+
+        Args:
+            mode (str): One of "silent", "log" or "display" (default: silent)
+            logger (logging.Logger): Logger used in log mode and for errors
+        """
+        if mode not in OUTPUT_MODES:
+            raise ValueError(f"output_mode must be one of {', '.join(OUTPUT_MODES)}")
+        self.mode = mode
+        self.logger = logger
+
+    def info(self, msg, *args):
+        """Report progress or a successful operation."""
+        if self.mode == DISPLAY:
+            print(msg % args if args else msg)
+        elif self.mode == LOG:
+            self.logger.info(msg, *args)
+
+    def error(self, msg, *args):
+        """Report a failed operation; logged even in silent mode."""
+        if self.mode == DISPLAY:
+            print(msg % args if args else msg)
+        else:
+            self.logger.error(msg, *args)
+
+    def products(self, products, msg, *args):
+        """Report a list of search hits under a summary line.
+
+        Args:
+            products (list): Product documents
+            msg (str): Summary line, formatted with args
+        """
+        if self.mode == DISPLAY:
+            from .product_generator import format_product_details
+            print("\n" + (msg % args if args else msg))
+            for product in products:
+                print("\n" + "="*50)
+                print(format_product_details(product))
+        elif self.mode == LOG:
+            self.logger.info(msg, *args)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                for product in products:
+                    self.logger.debug("Hit: %s", product)
+
+    def data(self, data, msg, *args):
+        """Report a structured result, e.g. index health, under a summary line."""
+        if self.mode == DISPLAY:
+            print(msg % args if args else msg)
+            print(json.dumps(data, indent=2))
+        elif self.mode == LOG:
+            self.logger.info(msg + " %s", *args, data)
@@ -0,0 +1,78 @@
+"""Helpers for paging through search results with point-in-time and search_after."""
+
+from .projection import source_filter
+
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_KEEP_ALIVE = "1m"
+DEFAULT_SCAN_SORT = [{"ID": "asc"}, {"_shard_doc": "asc"}]
+EXPORT_SORT = [{"_shard_doc": "asc"}]
+
+def build_page_body(query, pit_id, page_size=DEFAULT_PAGE_SIZE, sort=None,
+                    search_after=None, keep_alive=DEFAULT_KEEP_ALIVE,
+                    slice_id=None, max_slices=None, fields=None, exclude=None):
+    """Build the body for one page of a point-in-time search.
+
+    Args:
+        query (dict): Query DSL clause, or None to match every document
+        pit_id (str): Point-in-time ID
+        page_size (int): Number of hits per page
+        sort (list, optional): Stable sort; defaults to ID with a shard tiebreaker
+        search_after (list, optional): Sort values of the previous page's last hit
+        keep_alive (str): How long to keep the point in time open
+        slice_id (int, optional): Slice to read when splitting the scan
+        max_slices (int, optional): Total number of slices
+        fields (list, optional): Source fields to return; all fields when omitted
+        exclude (list, optional): Source fields to leave out
+
+    Returns:
+        dict: Search request body
+    """
+    body = {
+        "size": page_size,
+        "query": query or {"match_all": {}},
+        "pit": {"id": pit_id, "keep_alive": keep_alive},
+        "sort": sort or DEFAULT_SCAN_SORT,
+        "track_total_hits": False
+    }
+    if search_after is not None:
+        body["search_after"] = search_after
+    if max_slices and max_slices > 1:
+        body["slice"] = {"id": slice_id, "max": max_slices}
+    source = source_filter(fields, exclude)
+    if source is not None:
+        body["_source"] = source
+    return body
+
+def next_page_cursor(result, page_size, pit_id):
+    """Return the PIT ID and search_after values for the next page.
+
+    Args:
+        result (dict): Decoded search response
+        page_size (int): Requested page size
+        pit_id (str): Point-in-time ID used for the request
+
+    Returns:
+        tuple: (hits, pit_id, search_after); search_after is None on the last page
+    """
+    hits = result.get("hits", {}).get("hits", [])
+    search_after = hits[-1]["sort"] if len(hits) >= page_size else None
+    return hits, result.get("pit_id") or pit_id, search_after
+
+def scan_page(response, page_size, pit_id):
+    """Check one point-in-time page response and return the cursor for the next page.
+
+    Args:
+        response: Transport response with status_code, json() and text
+        page_size (int): Requested page size
+        pit_id (str): Point-in-time ID used for the request
+
+    Returns:
+        tuple: (hits, pit_id, search_after), as next_page_cursor
+
+    Raises:
+        RuntimeError: If the page request failed, so a partial scan is never
+            mistaken for a complete one
+    """
+    if response.status_code != 200:
+        raise RuntimeError(f"Search failed: {response.text}")
+    return next_page_cursor(response.json(), page_size, pit_id)
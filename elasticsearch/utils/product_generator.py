@@ -1,9 +1,31 @@
 """Utility functions for generating product data."""
 
-from faker import Faker
 import random
 from datetime import datetime
 
+# Product categories and their subcategories
+CATEGORIES = {
+    "Electronics": ["Smartphones", "Laptops", "Headphones", "Tablets", "Accessories"],
+    "Clothing": ["Shirts", "Pants", "Shoes", "Accessories", "Outerwear"],
+    "Books": ["Fiction", "Non-Fiction", "Textbooks", "Comics", "Biographies"],
+    "Home & Garden": ["Furniture", "Tools", "Decor", "Kitchen", "Garden"],
+    "Sports & Outdoors": ["Equipment", "Apparel", "Accessories", "Fitness", "Camping"]
+}
+
+# Brands for each category
+BRANDS = {
+    "Electronics": ["Apple", "Samsung", "Sony", "Bose", "Dell", "HP", "Lenovo"],
+    "Clothing": ["Nike", "Adidas", "Zara", "H&M", "Levi's", "Gucci", "Puma"],
+    "Books": ["Penguin", "HarperCollins", "Random House", "Scholastic", "Wiley"],
+    "Home & Garden": ["IKEA", "Home Depot", "Wayfair", "Williams-Sonoma", "Pottery Barn"],
+    "Sports & Outdoors": ["Nike", "Adidas", "Under Armour", "The North Face", "Columbia"]
+}
+
+def _faker():
+    """Create a Faker instance; faker is slow to import, so only the generator loads it."""
+    from faker import Faker
+    return Faker()
+
 def generate_product_data(num_products=100):
     """Generate sample product data for testing.
     
@@ -13,46 +35,25 @@ def generate_product_data(num_products=100):
     Returns:
         list: List of generated product documents
     """
-    fake = Faker()
-    
-    # Define product categories and their subcategories
-    categories = {
-        "Electronics": ["Smartphones", "Laptops", "Headphones", "Tablets", "Accessories"],
-        "Clothing": ["Shirts", "Pants", "Shoes", "Accessories", "Outerwear"],
-        "Books": ["Fiction", "Non-Fiction", "Textbooks", "Comics", "Biographies"],
-        "Home & Garden": ["Furniture", "Tools", "Decor", "Kitchen", "Garden"],
-        "Sports & Outdoors": ["Equipment", "Apparel", "Accessories", "Fitness", "Camping"]
-    }
-    
-    # Define brands for each category
-    brands = {
-        "Electronics": ["Apple", "Samsung", "Sony", "Bose", "Dell", "HP", "Lenovo"],
-        "Clothing": ["Nike", "Adidas", "Zara", "H&M", "Levi's", "Gucci", "Puma"],
-        "Books": ["Penguin", "HarperCollins", "Random House", "Scholastic", "Wiley"],
-        "Home & Garden": ["IKEA", "Home Depot", "Wayfair", "Williams-Sonoma", "Pottery Barn"],
-        "Sports & Outdoors": ["Nike", "Adidas", "Under Armour", "The North Face", "Columbia"]
-    }
+    fake = _faker()
     
     products = []
     
     for i in range(num_products):
         # Select random category and subcategory
-        category = random.choice(list(categories.keys()))
-        subcategory = random.choice(categories[category])
+        category = random.choice(list(CATEGORIES.keys()))
+        subcategory = random.choice(CATEGORIES[category])
         
         # Generate product data
         product = {
             "ID": i + 1,
-            "Name": {
-                "text": fake.catch_phrase(),
-                "keyword": f"{subcategory} - {fake.word().capitalize()} {fake.word().capitalize()}"
-            },
+            "Name": fake.catch_phrase(),
             "Description": fake.text(max_nb_chars=200),
             "Category": category,
             "Subcategory": subcategory,
             "Price": round(random.uniform(10.0, 2000.0), 2),
             "StockQty": random.randint(0, 1000),
-            "Brand": random.choice(brands[category]),
+            "Brand": random.choice(BRANDS[category]),
             "CreatedTime": fake.date_time_between(start_date="-1y", end_date="now").isoformat(),
             "UpdatedTime": fake.date_time_between(start_date="-1y", end_date="now").isoformat(),
             "Rating": round(random.uniform(0, 5), 1),
@@ -74,7 +75,7 @@ def format_product_details(product):
     """
     return f"""
 Product ID: {product.get('ID', 'N/A')}
-Name: {product.get('Name', {}).get('text', 'N/A')}
+Name: {product.get('Name', 'N/A')}
 Category: {product.get('Category', 'N/A')} > {product.get('Subcategory', 'N/A')}
 Brand: {product.get('Brand', 'N/A')}
 Price: ${product.get('Price', 0):.2f}
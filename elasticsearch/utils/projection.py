@@ -0,0 +1,95 @@
+"""Helpers for trimming responses with _source filtering and filter_path."""
+
+from .bulk_helpers import build_bulk_body
+from .serializer import DEFAULT_SERIALIZER
+
+SEARCH_FILTER_PATH = "took,hits.hits._source"
+SCAN_FILTER_PATH = "took,pit_id,hits.hits._source,hits.hits.sort"
+MSEARCH_FILTER_PATH = "took,responses.hits.hits._source"
+DOC_FILTER_PATH = "found,_source"
+MGET_FILTER_PATH = "docs._id,docs.found,docs._source,docs.error"
+
+def source_filter(fields=None, exclude=None):
+    """Build a _source filter from include and exclude field lists.
+
+    Args:
+        fields (list, optional): Source fields to return
+        exclude (list, optional): Source fields to leave out
+
+    Returns:
+        list or dict: Value for the _source key, or None to return everything
+    """
+    if not fields and not exclude:
+        return None
+    if not exclude:
+        return list(fields)
+    source = {"excludes": list(exclude)}
+    if fields:
+        source["includes"] = list(fields)
+    return source
+
+def apply_source_filter(search_query, fields=None, exclude=None):
+    """Add a _source filter to a search body in place.
+
+    Args:
+        search_query (dict): Search request body
+        fields (list, optional): Source fields to return
+        exclude (list, optional): Source fields to leave out
+
+    Returns:
+        dict: The same search body, for chaining
+    """
+    source = source_filter(fields, exclude)
+    if source is not None:
+        search_query["_source"] = source
+    return search_query
+
+def doc_params(fields=None, exclude=None, filter_path=DOC_FILTER_PATH):
+    """Build query string parameters for a projected GET _doc or _mget request.
+
+    Args:
+        fields (list, optional): Source fields to return
+        exclude (list, optional): Source fields to leave out
+        filter_path (str): Response filter (default: DOC_FILTER_PATH)
+
+    Returns:
+        dict: Query string parameters
+    """
+    params = {"filter_path": filter_path}
+    if fields:
+        params["_source_includes"] = ",".join(fields)
+    if exclude:
+        params["_source_excludes"] = ",".join(exclude)
+    return params
+
+def hit_sources(result):
+    """Extract the product sources from a decoded search response.
+
+    Args:
+        result (dict): Decoded search response, or one _msearch response item
+
+    Returns:
+        list: Source documents of the hits, in order
+    """
+    return [hit.get("_source", {}) for hit in result.get("hits", {}).get("hits", [])]
+
+def msearch_body(query_builders, index_name, fields=None, exclude=None, serializer=DEFAULT_SERIALIZER):
+    """Build an NDJSON _msearch body with one projected search per query builder.
+
+    Args:
+        query_builders (list): Objects implementing to_dict()
+        index_name (str): Index or alias every search runs against
+        fields (list, optional): Source fields to return
+        exclude (list, optional): Source fields to leave out
+        serializer (object): JSON serializer producing bytes
+
+    Returns:
+        bytes: NDJSON request body
+    """
+    # Header/search line pairs use the same NDJSON framing as _bulk
+    header = {"index": index_name}
+    searches = [
+        (header, apply_source_filter({"query": query_builder.to_dict()}, fields, exclude))
+        for query_builder in query_builders
+    ]
+    return build_bulk_body(searches, serializer)
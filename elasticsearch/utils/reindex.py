@@ -0,0 +1,105 @@
+"""Helpers for server-side reindexing into a new index version."""
+
+DEFAULT_POLL_INTERVAL = 5.0
+
+def reindex_body(source, dest, query=None):
+    """Build a _reindex request body.
+
+    Args:
+        source (str or list): Index, alias or indices to copy from
+        dest (str): Concrete index to copy into
+        query (dict, optional): Query DSL clause restricting the documents copied
+
+    Returns:
+        dict: _reindex request body
+    """
+    body = {"source": {"index": source}, "dest": {"index": dest}}
+    if query:
+        body["source"]["query"] = query
+    return body
+
+def reindex_params(slices="auto", requests_per_second=None):
+    """Build the query string of a background _reindex request.
+
+    Args:
+        slices (int or str): Parallel slices; "auto" uses one per shard
+        requests_per_second (float, optional): Throttle; unthrottled when omitted
+
+    Returns:
+        dict: Query string parameters
+    """
+    params = {"slices": slices, "wait_for_completion": "false"}
+    if requests_per_second is not None:
+        params["requests_per_second"] = requests_per_second
+    return params
+
+def task_progress(task):
+    """Summarize a GET _tasks/<task_id> response for a reindex task.
+
+    Args:
+        task (dict): Decoded tasks API response
+
+    Returns:
+        dict: completed, total, done, seconds, docs_per_sec, eta_seconds (None
+            until a rate is known) and failures
+    """
+    info = task.get("task", {})
+    status = info.get("status", {})
+    total = status.get("total", 0)
+    done = sum(status.get(key, 0) for key in ("created", "updated", "deleted", "noops", "version_conflicts"))
+    seconds = info.get("running_time_in_nanos", 0) / 1e9
+    rate = done / seconds if seconds > 0 else 0.0
+
+    failures = list((task.get("response") or {}).get("failures", []))
+    if task.get("error"):
+        failures.append(task["error"])
+
+    return {
+        "completed": task.get("completed", False),
+        "total": total,
+        "done": done,
+        "seconds": seconds,
+        "docs_per_sec": rate,
+        "eta_seconds": (total - done) / rate if rate > 0 else None,
+        "failures": failures
+    }
+
+def reindex_failures(status):
+    """Return why a finished reindex cannot be swapped in, or None if it succeeded.
+
+    Args:
+        status (dict): Final task_progress dict, or None if the task could not be read
+
+    Returns:
+        list or str: Task failures, a description when the status is missing, or None
+    """
+    if status is None:
+        return "task status unavailable"
+    return status["failures"] or None
+
+def reindex_summary(old_indices, dest, status, deleted_old):
+    """Build the summary returned by reindex_products.
+
+    Args:
+        old_indices (list): Concrete indices the aliases pointed at before the swap
+        dest (str): Concrete index the aliases point at now
+        status (dict): Final task_progress dict
+        deleted_old (bool): Whether the old indices were deleted
+
+    Returns:
+        dict: source, dest, documents, seconds, docs_per_sec and deleted_old
+    """
+    return {
+        "source": old_indices,
+        "dest": dest,
+        "documents": status["done"],
+        "seconds": status["seconds"],
+        "docs_per_sec": status["docs_per_sec"],
+        "deleted_old": deleted_old
+    }
+
+def print_reindex_progress(progress):
+    """Progress reporter for reindex_products: documents copied, throughput and ETA."""
+    eta = f"{progress['eta_seconds']:.0f}s" if progress["eta_seconds"] is not None else "unknown"
+    print(f"Reindexed {progress['done']}/{progress['total']} products "
+          f"({progress['docs_per_sec']:.0f} docs/sec, ETA {eta})")
@@ -0,0 +1,86 @@
+"""Timeouts and retry policy applied by the transports to every request."""
+
+from .bulk_helpers import backoff_delay
+
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_READ_TIMEOUT = 30
+DEFAULT_TIMEOUT = (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT)
+DEFAULT_REQUEST_RETRIES = 2
+DEFAULT_RETRY_BACKOFF = 0.1
+DEFAULT_MAX_RETRY_BACKOFF = 2.0
+# Statuses meaning the node, not the request, is the problem
+RETRY_STATUSES = (502, 503, 504)
+IDEMPOTENT_METHODS = ("GET", "HEAD", "PUT", "DELETE")
+IDEMPOTENT_ENDPOINTS = ("_search", "_msearch", "_mget", "_count", "_refresh")
+
+def is_idempotent(method, path):
+    """Return True if a request can be resent without changing its outcome.
+
+    GET, HEAD, PUT and DELETE are idempotent; POST only to read endpoints
+    such as _search, _msearch and _mget. Bulk requests are classified by
+    their actions instead, see bulk_is_idempotent.
+
+    Args:
+        method (str): HTTP method
+        path (str): Request path, e.g. /ecommerce_products/_search
+
+    Returns:
+        bool: True if the request may be retried
+    """
+    if method.upper() in IDEMPOTENT_METHODS:
+        return True
+    endpoint = path.split("?", 1)[0].rstrip("/").rsplit("/", 1)[-1]
+    return endpoint in IDEMPOTENT_ENDPOINTS
+
+def bulk_is_idempotent(actions):
+    """Return True if resending a bulk chunk cannot duplicate or compound writes.
+
+    That holds when every action targets an explicit _id and is an index,
+    delete or partial-document update (not a create or a script).
+
+    Args:
+        actions (list): (action, source) pairs in the chunk
+
+    Returns:
+        bool: True if the chunk may be retried as a whole
+    """
+    for action, source in actions:
+        operation, meta = next(iter(action.items()))
+        if "_id" not in meta or operation not in ("index", "delete", "update"):
+            return False
+        if operation == "update" and "doc" not in source:
+            return False
+    return True
+
+class RetryPolicy:
+    """Bounded retries with jittered exponential backoff for idempotent requests.
+
+    A request is retried when the node could not be reached, the read timed
+    out, or the node answered with one of retry_statuses. Non-idempotent
+    requests are never resent once they may have reached the node.
+    """
+
+    def __init__(self, max_retries=DEFAULT_REQUEST_RETRIES, initial_backoff=DEFAULT_RETRY_BACKOFF,
+                 max_backoff=DEFAULT_MAX_RETRY_BACKOFF, retry_statuses=RETRY_STATUSES):
+        """Initialize the retry policy.
+
+        Args:
+            max_retries (int): Retries after the first attempt; 0 disables retries
+            initial_backoff (float): Base backoff delay in seconds
+            max_backoff (float): Maximum backoff delay in seconds
+            retry_statuses (tuple): HTTP statuses that are retried
+        """
+        if max_retries < 0:
+            raise ValueError("max_retries must be >= 0")
+        self.max_retries = max_retries
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.retry_statuses = tuple(retry_statuses)
+
+    def should_retry(self, retries, idempotent):
+        """Return True if another attempt is allowed after retries retries."""
+        return idempotent and retries < self.max_retries
+
+    def delay(self, retries):
+        """Return the seconds to sleep before retry number retries + 1."""
+        return backoff_delay(retries, self.initial_backoff, self.max_backoff)
@@ -0,0 +1,80 @@
+"""Pluggable JSON serializers: orjson when it is installed, the standard library otherwise."""
+
+import json
+from datetime import date, time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _default(obj):
+    """Encode values JSON has no type for the way orjson does.
+
+    Dates, times and datetimes become ISO 8601 strings, numpy scalars their
+    Python value and numpy arrays lists; anything else falls back to str().
+    """
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    if type(obj).__module__ == "numpy":
+        # Checked by module name so numpy is never imported here
+        if hasattr(obj, "shape") and obj.shape:
+            return obj.tolist()
+        if hasattr(obj, "item"):
+            return obj.item()
+    return str(obj)
+
+class JSONSerializer:
+    """Serializer backed by the standard library json module."""
+
+    name = "json"
+
+    def dumps(self, data):
+        """Encode an object as compact UTF-8 JSON bytes."""
+        return json.dumps(data, separators=(",", ":"), default=_default).encode("utf-8")
+
+    def loads(self, data):
+        """Decode JSON from bytes or str."""
+        return json.loads(data)
+
+class OrjsonSerializer:
+    """Serializer backed by orjson, which encodes straight to bytes."""
+
+    name = "orjson"
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if orjson else 0
+
+    def dumps(self, data):
+        """Encode an object as UTF-8 JSON bytes."""
+        return orjson.dumps(data, default=_default, option=self.options)
+
+    def loads(self, data):
+        """Decode JSON from bytes or str."""
+        return orjson.loads(data)
+
+def get_serializer(serializer=None):
+    """Resolve a serializer by name, or pick the fastest one available.
+
+    Args:
+        serializer (str or object, optional): "json", "orjson", or any object
+            with dumps(obj) -> bytes and loads(data) methods; defaults to
+            orjson when installed, the standard library otherwise
+
+    Returns:
+        object: Serializer instance
+
+    Raises:
+        ValueError: If the name is unknown or orjson is requested but not installed
+    """
+    if serializer is None:
+        return OrjsonSerializer() if orjson else JSONSerializer()
+    if not isinstance(serializer, str):
+        return serializer
+    if serializer == "json":
+        return JSONSerializer()
+    if serializer == "orjson":
+        if orjson is None:
+            raise ValueError("orjson is not installed")
+        return OrjsonSerializer()
+    raise ValueError(f"Unknown serializer: {serializer}")
+
+DEFAULT_SERIALIZER = get_serializer()
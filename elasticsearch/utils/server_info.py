@@ -0,0 +1,40 @@
+"""Process-wide cache of the ElasticSearch root endpoint (GET /) per host."""
+
+import threading
+
+_lock = threading.Lock()
+_server_info = {}
+
+def cached_server_info(base_url):
+    """Return the cached GET / response for a host, or None if it was never probed."""
+    with _lock:
+        return _server_info.get(base_url)
+
+def store_server_info(base_url, info):
+    """Cache the GET / response for a host."""
+    with _lock:
+        _server_info[base_url] = info
+
+def clear_server_info(base_url=None):
+    """Forget the cached response for one host, or for every host."""
+    with _lock:
+        if base_url is None:
+            _server_info.clear()
+        else:
+            _server_info.pop(base_url, None)
+
+def parse_version(number):
+    """Turn a version string such as "8.11.1" or "8.12.0-SNAPSHOT" into a comparable tuple.
+
+    Args:
+        number (str): version.number from GET /
+
+    Returns:
+        tuple: Integer components, e.g. (8, 11, 1)
+    """
+    parts = []
+    for part in number.split("-", 1)[0].split("."):
+        if not part.isdigit():
+            break
+        parts.append(int(part))
+    return tuple(parts)
@@ -0,0 +1,165 @@
+"""Vectorized product data generation with NumPy for large load-test corpora."""
+
+import functools
+from datetime import datetime, timedelta
+from multiprocessing import Pool
+from .product_generator import BRANDS, CATEGORIES
+
+DEFAULT_BATCH_SIZE = 10000
+DESCRIPTION_POOL_SIZE = 4096
+MAX_DESCRIPTION_CHARS = 200
+# Seeded runs date products relative to this, so the whole document is reproducible
+SEEDED_REFERENCE_TIME = datetime(2024, 1, 1)
+
+def _numpy():
+    """Import NumPy, which is only needed for the vectorized generator."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("The vectorized generator requires numpy: pip install numpy") from None
+    return numpy
+
+@functools.lru_cache(maxsize=1)
+def _vocabulary():
+    """Build the word lists and description pool once per process.
+
+    Names are assembled from Faker's catch phrase word lists; descriptions
+    are sampled from a fixed pool of lorem sentences. The pool is built from a constant seed, so it is the
+    same in every process.
+    """
+    np = _numpy()
+    from faker.providers.company.en_US import Provider as CompanyProvider
+    from faker.providers.lorem.en_US import Provider as LoremProvider
+
+    phrase_words = [np.array(words, dtype=object) for words in CompanyProvider.catch_phrase_words]
+    words = np.array(LoremProvider.word_list, dtype=object)
+
+    rng = np.random.default_rng(0)
+    descriptions = []
+    for _ in range(DESCRIPTION_POOL_SIZE):
+        sentences = []
+        length = 0
+        while True:
+            sentence = " ".join(words[rng.integers(0, len(words), rng.integers(4, 12))]).capitalize() + "."
+            if sentences and length + len(sentence) + 1 > MAX_DESCRIPTION_CHARS:
+                break
+            sentences.append(sentence)
+            length += len(sentence) + 1
+        descriptions.append(" ".join(sentences)[:MAX_DESCRIPTION_CHARS])
+
+    categories = list(CATEGORIES)
+    subcategories = np.array([CATEGORIES[category] for category in categories], dtype=object)
+    brand_counts = np.array([len(BRANDS[category]) for category in categories])
+    brands = np.array([BRANDS[category] + [""] * (brand_counts.max() - len(BRANDS[category]))
+                       for category in categories], dtype=object)
+
+    return {
+        "phrase_words": phrase_words,
+        "descriptions": np.array(descriptions, dtype=object),
+        "categories": np.array(categories, dtype=object),
+        "subcategories": subcategories,
+        "brands": brands,
+        "brand_counts": brand_counts
+    }
+
+def _generate_batch(task):
+    """Generate one batch of products from (start_id, size, entropy, batch_index, reference_us)."""
+    start_id, size, entropy, batch_index, reference_us = task
+    np = _numpy()
+    vocabulary = _vocabulary()
+    rng = np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=(batch_index,)))
+
+    category_idx = rng.integers(0, len(vocabulary["categories"]), size)
+    subcategory_idx = rng.integers(0, vocabulary["subcategories"].shape[1], size)
+    brand_idx = (rng.random(size) * vocabulary["brand_counts"][category_idx]).astype(np.int64)
+    categories = vocabulary["categories"][category_idx]
+    subcategories = vocabulary["subcategories"][category_idx, subcategory_idx]
+    brands = vocabulary["brands"][category_idx, brand_idx]
+
+    first, second, third = (words[rng.integers(0, len(words), size)] for words in vocabulary["phrase_words"])
+    names = first + " " + second + " " + third
+    descriptions = vocabulary["descriptions"][rng.integers(0, len(vocabulary["descriptions"]), size)]
+
+    prices = np.round(rng.uniform(10.0, 2000.0, size), 2)
+    stock = rng.integers(0, 1001, size)
+    ratings = np.round(rng.uniform(0, 5, size), 1)
+    active = rng.random(size) < 0.5
+
+    year_us = 365 * 24 * 3600 * 10**6
+    reference = np.datetime64(reference_us, "us")
+    created = np.datetime_as_string(reference - rng.integers(0, year_us, size).astype("timedelta64[us]"), unit="us")
+    updated = np.datetime_as_string(reference - rng.integers(0, year_us, size).astype("timedelta64[us]"), unit="us")
+
+    return [
+        {
+            "ID": product_id,
+            "Name": name,
+            "Description": description,
+            "Category": category,
+            "Subcategory": subcategory,
+            "Price": price,
+            "StockQty": quantity,
+            "Brand": brand,
+            "CreatedTime": created_time,
+            "UpdatedTime": updated_time,
+            "Rating": rating,
+            "Active": is_active
+        }
+        for product_id, name, description, category, subcategory, price, quantity,
+            brand, created_time, updated_time, rating, is_active in zip(
+            range(start_id, start_id + size), names.tolist(), descriptions.tolist(),
+            categories.tolist(), subcategories.tolist(), prices.tolist(), stock.tolist(), brands.tolist(),
+            created.tolist(), updated.tolist(), ratings.tolist(), active.tolist()
+        )
+    ]
+
+def generate_product_batches(num_products, batch_size=DEFAULT_BATCH_SIZE, seed=None, processes=1,
+                             start_id=1, reference_time=None):
+    """Lazily generate products in batches, vectorized with NumPy.
+
+    Produces the same document schema as generate_product_data. Each batch
+    draws from its own random stream derived from the seed and the batch
+    number, so a seeded run yields identical products whatever the number
+    of processes.
+
+    Args:
+        num_products (int): Total number of products to generate
+        batch_size (int): Products per yielded batch (default: 10000)
+        seed (int, optional): Seed for reproducible output; random when omitted
+        processes (int): Worker processes generating batches in parallel (default: 1)
+        start_id (int): ID of the first product (default: 1)
+        reference_time (datetime, optional): Creation and update times fall within
+            the year before it; defaults to SEEDED_REFERENCE_TIME when a seed is
+            given, otherwise to now
+
+    Yields:
+        list: Product documents, in ID order
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    np = _numpy()
+    entropy = np.random.SeedSequence(seed).entropy
+    if reference_time is None:
+        reference_time = SEEDED_REFERENCE_TIME if seed is not None else datetime.now()
+    reference_us = (reference_time - datetime(1970, 1, 1, tzinfo=reference_time.tzinfo)) // timedelta(microseconds=1)
+
+    tasks = (
+        (start_id + offset, min(batch_size, num_products - offset), entropy, batch_index, reference_us)
+        for batch_index, offset in enumerate(range(0, num_products, batch_size))
+    )
+
+    if processes > 1:
+        with Pool(processes) as pool:
+            yield from pool.imap(_generate_batch, tasks)
+    else:
+        for task in tasks:
+            yield _generate_batch(task)
+
+def iter_product_data(num_products, **batch_options):
+    """Lazily generate products one at a time; see generate_product_batches for options.
+
+    Yields:
+        dict: Product documents, in ID order
+    """
+    for batch in generate_product_batches(num_products, **batch_options):
+        yield from batch
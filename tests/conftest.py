@@ -0,0 +1,14 @@
+"""Shared fixtures: clients wired to a scripted in-memory transport."""
+
+import pytest
+
+from elasticsearch.clients.sync_client import EcommerceElasticClient
+
+from fakes import FakeTransport
+
+@pytest.fixture
+def make_client():
+    """Return a factory for sync clients on a FakeTransport with the given replies."""
+    def factory(*replies, **options):
+        return EcommerceElasticClient(transport=FakeTransport(*replies), **options)
+    return factory
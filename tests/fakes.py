@@ -0,0 +1,56 @@
+"""In-memory stand-ins for the transports, so client tests need no server."""
+
+from elasticsearch.clients.operations import Request
+from elasticsearch.clients.transport import Response
+from elasticsearch.utils.compression import TransferStats
+from elasticsearch.utils.serializer import DEFAULT_SERIALIZER
+
+def respond(data=None, status_code=200):
+    """Build a transport Response whose body is data encoded as JSON."""
+    content = DEFAULT_SERIALIZER.dumps(data if data is not None else {})
+    return Response(status_code, content, {}, DEFAULT_SERIALIZER)
+
+class FakeTransport:
+    """Transport that answers requests from a script instead of the network.
+
+    Each scripted reply is a Response, an exception to raise, or a callable
+    taking the Request and returning either. Every request is recorded.
+    """
+
+    base_url = "http://fake:9200"
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.requests = []
+        self.headers = {"Content-Type": "application/json"}
+        self.serializer = DEFAULT_SERIALIZER
+        self.transfer_stats = TransferStats()
+        self.closed = False
+
+    def perform_request(self, *args, **kwargs):
+        request = Request(*args, **kwargs)
+        self.requests.append(request)
+        if not self.replies:
+            raise AssertionError(f"Unexpected request: {request.method} {request.path}")
+        reply = self.replies.pop(0)
+        if callable(reply):
+            reply = reply(request)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    def close(self):
+        self.closed = True
+
+class AioFakeTransport(FakeTransport):
+    """FakeTransport with the coroutine interface of AioTransport."""
+
+    async def perform_request(self, *args, **kwargs):
+        return FakeTransport.perform_request(self, *args, **kwargs)
+
+    async def close(self):
+        self.closed = True
+
+def search_hits(*sources):
+    """Build a _search response body with the given source documents."""
+    return {"took": 1, "hits": {"hits": [{"_source": source} for source in sources]}}
@@ -0,0 +1,59 @@
+"""Tests for versioned index names and read/write aliases."""
+
+from elasticsearch.utils.aliases import (
+    alias_definitions, alias_map, index_version, latest_index, next_index_version, versioned_index_name
+)
+
+from fakes import respond
+
+def test_version_names_round_trip():
+    assert versioned_index_name("products", 3) == "products-v3"
+    assert index_version("products-v3", "products") == 3
+    assert index_version("products-v3-old", "products") is None
+    assert index_version("other-v3", "products") is None
+
+def test_next_and_latest_versions():
+    names = ["products-v2", "products-v10", "products"]
+
+    assert next_index_version(names, "products") == 11
+    assert next_index_version([], "products") == 1
+    assert latest_index(names, "products") == "products-v10"
+
+def test_write_alias_is_the_write_index():
+    assert alias_definitions("products-read", "products-write") == {
+        "products-read": {}, "products-write": {"is_write_index": True}
+    }
+
+def test_alias_map_lists_aliases_per_index():
+    assert alias_map({"products-v1": {"aliases": {"products": {}}}, "tmp": {"aliases": {}}}) == {
+        "products-v1": ["products"], "tmp": []
+    }
+
+def test_first_product_index_gets_version_one_and_the_aliases(make_client):
+    client = make_client(respond({}, 404), respond({}, 404), respond({}, 404), respond({"acknowledged": True}))
+
+    assert client.create_product_index() == "ecommerce_products-v1"
+
+    create = client.transport.requests[-1]
+    assert create.method == "PUT"
+    assert create.path == "/ecommerce_products-v1"
+    assert create.body["aliases"] == {"ecommerce_products": {"is_write_index": True}}
+
+def test_existing_aliased_index_is_kept(make_client):
+    client = make_client(respond({"ecommerce_products-v4": {"aliases": {"ecommerce_products": {}}}}))
+
+    assert client.create_product_index() == "ecommerce_products-v4"
+    assert len(client.transport.requests) == 1
+
+def test_reads_and_writes_use_their_own_aliases(make_client):
+    client = make_client(
+        respond({"found": True, "_source": {"ID": 1}}), respond({"result": "updated"}),
+        read_alias="products-read", write_alias="products-write"
+    )
+
+    client.get_product_by_id(1)
+    client.update_product(2, {"Price": 5})
+
+    read, write = client.transport.requests
+    assert read.path.startswith("/products-read/")
+    assert write.path.startswith("/products-write/")
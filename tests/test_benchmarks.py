@@ -0,0 +1,44 @@
+"""Tests for the benchmark helpers and the in-process ElasticSearch stand-in."""
+
+import json
+
+import pytest
+
+pytest.importorskip("faker")
+
+from benchmarks.run import latency_summary, seeded_products
+from benchmarks.stand_in import StandInServer
+from elasticsearch.clients.sync_client import EcommerceElasticClient
+
+@pytest.fixture(scope="module")
+def stand_in():
+    with StandInServer(search_hits=3) as server:
+        yield server
+
+def test_latency_summary_in_milliseconds():
+    summary = latency_summary([0.004, 0.001, 0.002, 0.003])
+
+    assert summary["samples"] == 4
+    assert summary["p50"] == 2.0
+    assert summary["max"] == 4.0
+    assert summary["mean"] == 2.5
+
+def test_seeded_products_are_reproducible():
+    assert seeded_products(5, seed=7) == seeded_products(5, seed=7)
+
+def test_bulk_response_has_one_item_per_action(stand_in):
+    body = b'{"index":{}}\n{"ID":1}\n{"delete":{"_id":"2"}}\n{"update":{"_id":"3"}}\n{"doc":{}}\n'
+
+    items = json.loads(stand_in.bulk_response(body))["items"]
+
+    assert [next(iter(item)) for item in items] == ["index", "delete", "update"]
+
+def test_clients_run_against_the_stand_in(stand_in):
+    with EcommerceElasticClient(port=stand_in.port) as client:
+        summary = client.bulk_create_products(seeded_products(10, seed=1), chunk_size=4)
+        products = client.search_by_brand("Acme")
+        found = client.get_products_by_ids([5, 6])
+
+    assert summary["indexed"] == 10
+    assert len(products) == 3
+    assert len(found) == 2 and all(found)
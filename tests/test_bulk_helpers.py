@@ -0,0 +1,88 @@
+"""Tests for chunking _bulk actions and summarizing chunk results."""
+
+import json
+
+from elasticsearch.utils.bulk_helpers import (
+    add_chunk_result, build_bulk_body, chunk_actions, delete_actions, new_bulk_summary, new_chunk_result,
+    summarize_bulk_results
+)
+
+def index_actions(count, size=10):
+    return [({"index": {"_index": "products"}}, {"ID": i, "Name": "x" * size}) for i in range(count)]
+
+def test_chunks_are_bounded_by_count():
+    chunks = list(chunk_actions(index_actions(7), chunk_size=3))
+
+    assert [len(chunk) for chunk, _ in chunks] == [3, 3, 1]
+
+def test_chunks_are_bounded_by_bytes():
+    actions = index_actions(6)
+    one_action = len(build_bulk_body(actions[:1]))
+
+    chunks = list(chunk_actions(actions, chunk_size=100, max_chunk_bytes=2 * one_action))
+
+    assert [len(chunk) for chunk, _ in chunks] == [2, 2, 2]
+    assert all(len(body) <= 2 * one_action for _, body in chunks)
+
+def test_oversized_action_is_sent_on_its_own():
+    actions = index_actions(1) + index_actions(1, size=1000) + index_actions(1)
+
+    chunks = list(chunk_actions(actions, max_chunk_bytes=200))
+
+    assert [len(chunk) for chunk, _ in chunks] == [1, 1, 1]
+
+def test_chunk_body_is_ndjson_for_its_actions():
+    actions = index_actions(2) + list(delete_actions([5], "products"))
+
+    [(chunk, body)] = list(chunk_actions(iter(actions)))
+
+    lines = [json.loads(line) for line in body.decode().splitlines()]
+    assert chunk == actions
+    assert lines == [actions[0][0], actions[0][1], actions[1][0], actions[1][1], actions[2][0]]
+    assert body.endswith(b"\n")
+
+def test_chunking_consumes_a_generator_lazily():
+    consumed = []
+
+    def actions():
+        for pair in index_actions(10):
+            consumed.append(pair)
+            yield pair
+
+    chunks = chunk_actions(actions(), chunk_size=2)
+    next(chunks)
+
+    assert len(consumed) == 3
+
+def failed_chunk(failures):
+    result = new_chunk_result(failures)
+    result["failed"] = failures
+    result["failed_items"] = [{"status": 400, "error": i} for i in range(failures)]
+    return result
+
+def test_summary_adds_up_chunk_results():
+    ok = dict(new_chunk_result(5), indexed=5, took=3)
+    retried = dict(new_chunk_result(2), indexed=2, retried=1, took=4)
+
+    summary = summarize_bulk_results(iter([ok, retried]))
+
+    assert summary["indexed"] == 7
+    assert summary["retried"] == 1
+    assert summary["took"] == 7
+    assert summary["errors"] is False
+
+def test_summary_caps_failed_items():
+    summary = summarize_bulk_results([failed_chunk(3), failed_chunk(4)], max_failed_items=5)
+
+    assert summary["failed"] == 7
+    assert summary["errors"] is True
+    assert len(summary["failed_items"]) == 5
+    assert summary["omitted_failed_items"] == 2
+
+def test_add_chunk_result_keeps_the_first_failures():
+    summary = new_bulk_summary()
+    add_chunk_result(summary, failed_chunk(2), max_failed_items=3)
+    add_chunk_result(summary, failed_chunk(2), max_failed_items=3)
+
+    assert [item["error"] for item in summary["failed_items"]] == [0, 1, 0]
+    assert summary["omitted_failed_items"] == 1
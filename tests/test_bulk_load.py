@@ -0,0 +1,54 @@
+"""Tests for ingest-optimized bulk-load settings."""
+
+import pytest
+
+from elasticsearch.utils.index_settings import BULK_LOAD_SETTINGS, current_settings, flatten_settings
+
+from fakes import respond
+
+ORIGINAL = {"products-v1": {"settings": {"index.refresh_interval": "5s"}}}
+
+def test_flatten_settings_uses_dotted_keys():
+    assert flatten_settings({"index": {"refresh_interval": "1s", "blocks": {"write": True}}}) == {
+        "index.refresh_interval": "1s", "index.blocks.write": True
+    }
+
+def test_current_settings_resolve_aliases_and_defaults():
+    assert current_settings(ORIGINAL, "products", BULK_LOAD_SETTINGS) == {
+        "index.refresh_interval": "5s", "index.number_of_replicas": None
+    }
+
+def test_bulk_load_restores_settings_and_refreshes(make_client):
+    client = make_client(respond(ORIGINAL), respond(), respond(), respond())
+
+    with client.bulk_load("products"):
+        pass
+
+    read, apply, restore, refresh = client.transport.requests
+    assert apply.body == BULK_LOAD_SETTINGS
+    assert restore.body == {"index.refresh_interval": "5s", "index.number_of_replicas": None}
+    assert refresh.path == "/products/_refresh"
+
+def test_bulk_load_restores_settings_when_the_block_raises(make_client):
+    client = make_client(respond(ORIGINAL), respond(), respond(), respond())
+
+    with pytest.raises(KeyError):
+        with client.bulk_load("products"):
+            raise KeyError("load failed")
+
+    assert client.transport.requests[2].body["index.refresh_interval"] == "5s"
+
+def test_unreadable_settings_abort_the_load(make_client):
+    client = make_client(respond({"error": "no index"}, 404))
+
+    with pytest.raises(RuntimeError):
+        with client.bulk_load("products"):
+            pass
+
+def test_force_merge_after_a_successful_load(make_client):
+    client = make_client(respond(ORIGINAL), respond(), respond(), respond(), respond())
+
+    with client.bulk_load("products", force_merge=True):
+        pass
+
+    assert client.transport.requests[-1].path == "/products/_forcemerge"
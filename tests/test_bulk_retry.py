@@ -0,0 +1,86 @@
+"""Tests for per-item 429 retries and parallel bulk sending."""
+
+from elasticsearch.utils.bulk_helpers import product_index_actions
+
+from fakes import respond
+
+NO_BACKOFF = {"initial_backoff": 0, "max_backoff": 0}
+
+def items(*statuses):
+    return {"took": 1, "errors": True, "items": [{"index": {"status": status}} for status in statuses]}
+
+def products(count):
+    return [{"ID": i, "Name": f"Product {i}"} for i in range(count)]
+
+def test_only_rejected_items_are_resent(make_client):
+    client = make_client(respond(items(201, 429, 201)), respond(items(201)))
+
+    [result] = client.streaming_bulk(product_index_actions(products(3), "products"), **NO_BACKOFF)
+
+    retry_body = client.transport.requests[1].body
+    assert retry_body.count(b"\n") == 2
+    assert b'"ID":1' in retry_body
+    assert result["indexed"] == 3
+    assert result["retried"] == 1
+    assert result["failed"] == 0
+    assert result["ok"] is True
+
+def test_whole_request_rejected_with_429_is_resent(make_client):
+    client = make_client(respond({"error": "busy"}, 429), respond(items(201, 201)))
+
+    [result] = client.streaming_bulk(product_index_actions(products(2), "products"), **NO_BACKOFF)
+
+    assert len(client.transport.requests) == 2
+    assert result["indexed"] == 2
+    assert result["retried"] == 2
+
+def test_items_still_rejected_after_max_retries_fail(make_client):
+    client = make_client(respond(items(429)), respond(items(429)), respond(items(429)))
+
+    [result] = client.streaming_bulk(
+        product_index_actions(products(1), "products"), max_retries=2, **NO_BACKOFF
+    )
+
+    assert len(client.transport.requests) == 3
+    assert result["failed"] == 1
+    assert result["failed_items"][0]["status"] == 429
+    assert result["ok"] is False
+
+def test_other_item_errors_are_not_retried(make_client):
+    client = make_client(respond(items(201, 400)))
+
+    [result] = client.streaming_bulk(product_index_actions(products(2), "products"), **NO_BACKOFF)
+
+    assert len(client.transport.requests) == 1
+    assert result["indexed"] == 1
+    assert result["failed"] == 1
+
+def test_connection_error_fails_the_chunk(make_client):
+    client = make_client(ConnectionError("refused"))
+
+    [result] = client.streaming_bulk(product_index_actions(products(2), "products"), **NO_BACKOFF)
+
+    assert result["failed"] == 2
+    assert "refused" in result["failed_items"][0]["error"]
+
+def test_parallel_bulk_sends_every_chunk(make_client):
+    def accept_all(request):
+        return respond(items(*[201] * (request.body.count(b"\n") // 2)))
+
+    client = make_client(*[accept_all] * 5)
+
+    results = list(client.parallel_bulk(
+        product_index_actions(products(10), "products"), thread_count=3, chunk_size=2, **NO_BACKOFF
+    ))
+
+    assert len(results) == 5
+    assert sum(result["indexed"] for result in results) == 10
+
+def test_bulk_create_products_summarizes_chunks(make_client):
+    client = make_client(respond(items(201, 201)), respond(items(201, 400)))
+
+    summary = client.bulk_create_products(products(4), chunk_size=2, **NO_BACKOFF)
+
+    assert summary["indexed"] == 3
+    assert summary["failed"] == 1
+    assert summary["errors"] is True
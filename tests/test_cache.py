@@ -0,0 +1,95 @@
+"""Tests for the search result cache and its use by the clients."""
+
+from datetime import datetime
+
+from elasticsearch.models.query_builders import RangeQuery, TermQuery
+from elasticsearch.utils import cache as cache_module
+from elasticsearch.utils.cache import QueryCache
+
+from fakes import respond, search_hits
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def test_entries_expire_after_ttl(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    cache = QueryCache(ttl=10)
+    cache.set("key", b"value")
+
+    clock.now += 9
+    assert cache.get("key") == b"value"
+    clock.now += 2
+    assert cache.get("key") is None
+    assert cache.stats()["size"] == 0
+
+def test_least_recently_used_entry_is_evicted():
+    cache = QueryCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+def test_invalidate_drops_entries_and_stale_in_flight_results():
+    cache = QueryCache()
+    cache.set("a", 1)
+    generation = cache.generation
+
+    cache.invalidate()
+    cache.set("b", 2, generation)
+
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.stats()["invalidations"] == 1
+
+def test_keys_are_canonical_and_accept_datetimes():
+    key = QueryCache.make_key("/p/_search", {"query": {"a": 1, "b": 2}})
+
+    assert key == QueryCache.make_key("/p/_search", {"query": {"b": 2, "a": 1}})
+    assert key != QueryCache.make_key("/q/_search", {"query": {"a": 1, "b": 2}})
+    assert "2024-01-01" in QueryCache.make_key("/p/_search", {"gte": datetime(2024, 1, 1)})
+
+def test_repeated_search_is_served_from_the_cache(make_client):
+    cache = QueryCache()
+    client = make_client(respond(search_hits({"ID": 1})), query_cache=cache)
+
+    first = client.search_products(TermQuery("Brand", "Acme"))
+    second = client.search_products(TermQuery("Brand", "Acme"))
+
+    assert first == second == [{"ID": 1}]
+    assert len(client.transport.requests) == 1
+    assert cache.stats()["hits"] == 1
+
+def test_cache_hits_are_independent_copies(make_client):
+    client = make_client(respond(search_hits({"ID": 1})), query_cache=QueryCache())
+
+    client.search_products(TermQuery("Brand", "Acme"))[0]["ID"] = 99
+
+    assert client.search_products(TermQuery("Brand", "Acme")) == [{"ID": 1}]
+
+def test_writes_invalidate_the_cache(make_client):
+    client = make_client(
+        respond(search_hits({"ID": 1})), respond({"result": "updated"}), respond(search_hits({"ID": 2})),
+        query_cache=QueryCache()
+    )
+
+    client.search_products(TermQuery("Brand", "Acme"))
+    client.update_product(1, {"Price": 5})
+
+    assert client.search_products(TermQuery("Brand", "Acme")) == [{"ID": 2}]
+
+def test_datetime_queries_can_be_cached(make_client):
+    client = make_client(respond(search_hits({"ID": 1})), query_cache=QueryCache())
+    query = RangeQuery("CreatedTime", gte=datetime(2024, 1, 1))
+
+    assert client.search_products(query) == [{"ID": 1}]
+    assert client.search_products(query) == [{"ID": 1}]
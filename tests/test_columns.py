@@ -0,0 +1,52 @@
+"""Tests for compact columnar result sets."""
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from elasticsearch.utils.columns import MISSING_INT, ColumnBuilder, product_columns
+
+from fakes import respond
+
+PRODUCTS = [
+    {"ID": 1, "Price": 9.5, "StockQty": 3, "Rating": 4.0, "Category": "Books", "Subcategory": "Fiction",
+     "Brand": "Acme"},
+    {"ID": 2, "Price": 20, "Category": "Books", "Subcategory": "Poetry", "Brand": "Acme"}
+]
+
+def test_numeric_columns_are_typed_arrays():
+    columns = product_columns(PRODUCTS)
+
+    assert len(columns) == 2
+    assert columns["ID"].dtype == np.int64
+    assert columns["Price"].tolist() == [9.5, 20.0]
+    assert columns["StockQty"].tolist() == [3, MISSING_INT]
+    assert math.isnan(columns["Rating"][1])
+
+def test_string_columns_share_interned_values():
+    columns = product_columns(PRODUCTS)
+
+    assert columns["Category"] == ["Books", "Books"]
+    assert columns["Category"][0] is columns["Category"][1]
+
+def test_rows_are_plain_python_values():
+    row = product_columns(PRODUCTS, ["ID", "Price", "Brand"]).row(0)
+
+    assert row == {"ID": 1, "Price": 9.5, "Brand": "Acme"}
+    assert type(row["ID"]) is int
+
+def test_unknown_columns_are_rejected():
+    with pytest.raises(ValueError):
+        ColumnBuilder(["Description"])
+
+def test_search_columns_pages_only_the_requested_fields(make_client):
+    hits = [{"_source": product, "sort": [product["ID"]]} for product in PRODUCTS]
+    client = make_client(respond({"id": "pit-1"}), respond({"hits": {"hits": hits}}), respond())
+
+    columns = client.search_columns(columns=["ID", "Brand"], page_size=10)
+
+    assert columns["ID"].tolist() == [1, 2]
+    assert columns["Brand"] == ["Acme", "Acme"]
+    assert client.transport.requests[1].body["_source"] == ["ID", "Brand"]
@@ -0,0 +1,44 @@
+"""Tests for request gzip and the raw/wire byte counters."""
+
+import gzip
+import zlib
+
+from elasticsearch.utils.compression import TransferStats, decode_body, prepare_request_body
+
+def test_small_bodies_are_sent_as_is():
+    assert prepare_request_body(b"{}", threshold=1024) == (b"{}", 2, False)
+    assert prepare_request_body(None, threshold=0) == (None, 0, False)
+
+def test_large_bodies_are_gzipped():
+    body = b'{"index":{}}\n' * 200
+
+    sent, raw_size, compressed = prepare_request_body(body.decode(), threshold=1024)
+
+    assert compressed is True
+    assert raw_size == len(body)
+    assert gzip.decompress(sent) == body
+
+def test_compression_is_off_without_a_threshold():
+    body = b"x" * 10000
+
+    assert prepare_request_body(body) == (body, 10000, False)
+
+def test_response_bodies_are_decoded():
+    body = b'{"took":1}'
+
+    assert decode_body(gzip.compress(body), "gzip") == body
+    assert decode_body(zlib.compress(body), "deflate") == body
+    assert decode_body(zlib.compress(body)[2:-4], "deflate") == body
+    assert decode_body(body, None) == body
+
+def test_transfer_stats_report_savings():
+    stats = TransferStats()
+    stats.record(1000, 200, 500, 100)
+    stats.record(10, 10, 0, 0)
+
+    snapshot = stats.snapshot()
+
+    assert snapshot["requests"] == 2
+    assert snapshot["compressed_requests"] == 1
+    assert snapshot["saved_bytes"] == 1200
+    assert snapshot["compression_ratio"] == 1510 / 310
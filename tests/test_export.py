@@ -0,0 +1,42 @@
+"""Tests for the sliced NDJSON export."""
+
+import gzip
+import json
+
+from fakes import respond
+
+def export_handler(request):
+    """Answer PIT open/close and give slice n the products 10n and 10n + 1."""
+    if request.path.endswith("/_pit"):
+        return respond({"id": "pit-1"})
+    if request.method == "DELETE":
+        return respond()
+    slice_id = request.body["slice"]["id"]
+    hits = [{"_source": {"ID": 10 * slice_id + i}, "sort": [i]} for i in range(2)]
+    return respond({"hits": {"hits": hits}})
+
+def test_export_writes_every_slice_as_ndjson(make_client, tmp_path):
+    client = make_client(*[export_handler] * 5)
+    output = tmp_path / "products.ndjson.gz"
+
+    stats = client.export_products(str(output), slices=3, page_size=10)
+
+    with gzip.open(output, "rb") as lines:
+        ids = sorted(json.loads(line)["ID"] for line in lines)
+    assert ids == [0, 1, 10, 11, 20, 21]
+    assert stats["documents"] == 6
+    assert stats["failed_slices"] == []
+    assert client.transport.requests[-1].method == "DELETE"
+
+def test_failed_slice_is_reported(make_client, tmp_path):
+    def fail_slice_one(request):
+        if request.body and request.body.get("slice", {}).get("id") == 1:
+            return respond({"error": "boom"}, 500)
+        return export_handler(request)
+
+    client = make_client(*[fail_slice_one] * 4)
+
+    stats = client.export_products(str(tmp_path / "products.ndjson"), slices=2, page_size=10)
+
+    assert stats["failed_slices"] == [1]
+    assert stats["documents"] == 2
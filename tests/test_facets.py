@@ -0,0 +1,54 @@
+"""Tests for facet aggregations on category pages."""
+
+from elasticsearch.models.query_builders import TermQuery
+from elasticsearch.utils.facets import FACETS_FILTER_PATH, facet_body, parse_facets
+
+from fakes import respond
+
+RESPONSE = {
+    "hits": {"total": {"value": 42}},
+    "aggregations": {
+        "Brand": {"buckets": [{"key": "Acme", "doc_count": 30}, {"key": "Zeta", "doc_count": 12}]},
+        "price": {"buckets": [{"to": 50.0, "doc_count": 10}, {"from": 50.0, "doc_count": 32}]},
+        "rating": {"buckets": [{"key": 4.0, "doc_count": 42}]}
+    }
+}
+
+def test_facet_body_is_a_single_size_zero_search():
+    body = facet_body(
+        {"term": {"Category": "Books"}}, terms_fields=("Brand",), price_ranges=((None, 50), (50, None))
+    )
+
+    assert body["size"] == 0
+    assert body["query"] == {"term": {"Category": "Books"}}
+    assert body["aggs"]["Brand"] == {"terms": {"field": "Brand", "size": 20}}
+    assert body["aggs"]["price"]["range"]["ranges"] == [{"to": 50}, {"from": 50}]
+    assert body["aggs"]["rating"]["histogram"]["interval"] == 1
+
+def test_optional_facets_can_be_skipped():
+    aggs = facet_body(terms_fields=(), price_ranges=(), rating_interval=None)["aggs"]
+
+    assert aggs == {}
+
+def test_parse_facets_returns_compact_buckets():
+    facets = parse_facets(RESPONSE, names=("Brand", "Category"))
+
+    assert facets == {
+        "total": 42,
+        "Brand": [("Acme", 30), ("Zeta", 12)],
+        "Category": [],
+        "price": [(None, 50.0, 10), (50.0, None, 32)],
+        "rating": [(4.0, 42)]
+    }
+
+def test_client_facets_send_one_filtered_request(make_client):
+    client = make_client(respond(RESPONSE))
+
+    facets = client.facets(TermQuery("Category", "Books"))
+
+    [request] = client.transport.requests
+    assert request.body["size"] == 0
+    assert request.body["query"] == {"term": {"Category": "Books"}}
+    assert request.params["filter_path"] == FACETS_FILTER_PATH
+    assert facets["total"] == 42
+    assert facets["Brand"] == [("Acme", 30), ("Zeta", 12)]
@@ -0,0 +1,42 @@
+"""Tests for lazy package exports and the sync client's import-time budget."""
+
+import sys
+import types
+
+import pytest
+
+from benchmarks.import_time import DEFAULT_BUDGET_MS, check_import_budget, cold_import
+from elasticsearch.utils.lazy import lazy_exports
+
+@pytest.fixture
+def package(monkeypatch):
+    module = types.ModuleType("lazy_test_package")
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    module.__all__, module.__getattr__, module.__dir__ = lazy_exports(module.__name__, {"dumps": "json"})
+    return module
+
+def test_exports_resolve_on_first_access_and_are_cached(package):
+    import json
+
+    assert package.__all__ == ["dumps"]
+    assert "dumps" not in vars(package)
+    assert package.dumps is json.dumps
+    assert vars(package)["dumps"] is json.dumps
+
+def test_unknown_names_raise_attribute_error(package):
+    with pytest.raises(AttributeError, match="lazy_test_package"):
+        package.loads
+
+def test_dir_lists_exports_before_they_are_loaded(package):
+    assert "dumps" in package.__dir__()
+
+def test_importing_the_packages_loads_no_heavy_modules():
+    result = cold_import("elasticsearch.clients")
+
+    assert result["loaded"] == []
+
+def test_sync_client_import_stays_within_budget():
+    passed, result = check_import_budget(DEFAULT_BUDGET_MS, runs=5)
+
+    assert result["deferred_loaded"] == []
+    assert passed, f"{result['package_ms']:.1f} ms on top of requests, budget {DEFAULT_BUDGET_MS} ms"
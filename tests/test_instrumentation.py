@@ -0,0 +1,99 @@
+"""Tests for per-operation instrumentation."""
+
+from elasticsearch.utils.instrumentation import Instrumentation, LatencyStats, current_operation, instrumented
+
+from fakes import respond, search_hits
+
+class Recorder:
+    """Minimal instrumented object: anything with an instrumentation attribute."""
+
+    def __init__(self):
+        self.instrumentation = Instrumentation()
+
+    @instrumented
+    def outer(self):
+        current_operation().add_request(10, 20, 0.0)
+        return self.inner()
+
+    @instrumented
+    def inner(self):
+        current_operation().add_request(1, 2, 0.0)
+        return current_operation().operation
+
+    @instrumented
+    def pages(self):
+        for page in range(3):
+            current_operation().add_took(5)
+            yield page
+
+    @instrumented
+    def fail(self):
+        raise RuntimeError("boom")
+
+def test_latency_percentiles():
+    stats = LatencyStats()
+    for ms in range(1, 101):
+        stats.add(ms / 1000)
+
+    snapshot = stats.snapshot()
+
+    assert round(snapshot["p50"]) == 50
+    assert round(snapshot["p99"]) == 99
+    assert round(snapshot["max"]) == 100
+    assert round(snapshot["mean"], 1) == 50.5
+
+def test_latency_reservoir_is_bounded():
+    stats = LatencyStats(reservoir_size=10)
+    for _ in range(100):
+        stats.add(0.001)
+
+    assert len(stats.samples) == 10
+    assert stats.count == 100
+
+def test_nested_calls_belong_to_the_outer_operation():
+    recorder = Recorder()
+
+    assert recorder.outer() == "outer"
+
+    stats = recorder.instrumentation.stats()
+    assert list(stats) == ["outer"]
+    assert stats["outer"]["requests"] == 2
+    assert stats["outer"]["request_bytes"] == 11
+
+def test_generators_are_recorded_when_exhausted():
+    recorder = Recorder()
+
+    pages = recorder.pages()
+    assert recorder.instrumentation.stats() == {}
+    assert list(pages) == [0, 1, 2]
+
+    assert recorder.instrumentation.stats()["pages"]["server_took_ms"] == 15
+
+def test_errors_are_counted_and_reraised():
+    recorder = Recorder()
+
+    try:
+        recorder.fail()
+    except RuntimeError:
+        pass
+
+    assert recorder.instrumentation.stats()["fail"]["errors"] == 1
+
+def test_hooks_receive_records_and_cannot_break_calls():
+    recorder = Recorder()
+    records = []
+    recorder.instrumentation.add_hook(records.append)
+    recorder.instrumentation.add_hook(lambda record: 1 / 0)
+
+    recorder.inner()
+
+    assert [record["operation"] for record in records] == ["inner"]
+
+def test_client_records_server_took(make_client):
+    client = make_client(respond(search_hits({"ID": 1})))
+
+    client.search_by_brand("Acme")
+
+    stats = client.stats()["search_by_brand"]
+    assert stats["count"] == 1
+    assert stats["server_took_ms"] == 1
@@ -0,0 +1,48 @@
+"""Tests for batched _mget lookups."""
+
+import pytest
+
+from elasticsearch.utils.mget import id_batches, mget_sources
+from elasticsearch.utils.projection import MGET_FILTER_PATH
+
+from fakes import respond
+
+def test_id_batches_keep_order_and_stringify():
+    assert list(id_batches([1, 2, 3, 4, 5], 2)) == [["1", "2"], ["3", "4"], ["5"]]
+
+def test_id_batches_reject_empty_batches():
+    with pytest.raises(ValueError):
+        list(id_batches([1], 0))
+
+def test_sources_follow_the_requested_ids():
+    result = {"docs": [
+        {"_id": "3", "found": True, "_source": {"ID": 3}},
+        {"_id": "2", "found": False},
+        {"_id": "1", "found": True, "_source": {"ID": 1}}
+    ]}
+
+    assert mget_sources(result, ["1", "2", "3"]) == [{"ID": 1}, None, {"ID": 3}]
+
+def test_trimmed_error_docs_do_not_shift_later_products():
+    # filter_path drops the _id of an error doc, leaving a shorter docs array
+    result = {"docs": [{"error": {"type": "shard_failure"}}, {"_id": "2", "found": True, "_source": {"ID": 2}}]}
+
+    assert mget_sources(result, ["1", "2"]) == [None, {"ID": 2}]
+
+def test_get_products_by_ids_batches_in_input_order(make_client):
+    def reply(request):
+        docs = [{"_id": i, "found": i != "2", "_source": {"ID": int(i)}} for i in reversed(request.body["ids"])]
+        return respond({"docs": docs})
+
+    client = make_client(reply, reply)
+
+    products = client.get_products_by_ids([1, 2, 3], batch_size=2)
+
+    assert products == [{"ID": 1}, None, {"ID": 3}]
+    assert [request.body for request in client.transport.requests] == [{"ids": ["1", "2"]}, {"ids": ["3"]}]
+    assert client.transport.requests[0].params["filter_path"] == MGET_FILTER_PATH
+
+def test_failed_batch_returns_none(make_client):
+    client = make_client(respond({"error": "boom"}, 500))
+
+    assert client.get_products_by_ids([1]) is None
@@ -0,0 +1,108 @@
+"""Tests for node selection, circuit breakers and sniffing helpers."""
+
+import pytest
+
+from elasticsearch.utils import node_pool
+from elasticsearch.utils.node_pool import (
+    CLOSED, HALF_OPEN, LEAST_IN_FLIGHT, OPEN, NodePool, NoLiveNodesError, node_url, sniffed_urls
+)
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(node_pool.time, "monotonic", clock)
+    return clock
+
+def test_node_addresses_are_normalized():
+    assert node_url("es1") == "http://es1:9200"
+    assert node_url("https://es1:9243") == "https://es1:9243"
+    assert node_url(("es1", 9201)) == "http://es1:9201"
+    assert node_url({"host": "es1", "scheme": "https"}) == "https://es1:9200"
+
+def test_sniffed_urls_use_publish_addresses():
+    info = {"nodes": {
+        "a": {"http": {"publish_address": "es1.local/10.0.0.1:9200"}},
+        "b": {"http": {"publish_address": "10.0.0.2:9200"}},
+        "c": {}
+    }}
+
+    assert sniffed_urls(info) == ["http://10.0.0.1:9200", "http://10.0.0.2:9200"]
+
+def test_round_robin_cycles_through_nodes():
+    pool = NodePool(["http://a:9200", "http://b:9200"])
+
+    picked = []
+    for _ in range(4):
+        node = pool.acquire()
+        picked.append(node.base_url)
+        pool.release(node)
+
+    assert picked == ["http://a:9200", "http://b:9200"] * 2
+
+def test_least_in_flight_prefers_idle_nodes():
+    pool = NodePool(["http://a:9200", "http://b:9200"], selector=LEAST_IN_FLIGHT)
+
+    first = pool.acquire()
+    second = pool.acquire()
+
+    assert first is not second
+
+def test_circuit_opens_then_half_opens_after_dead_timeout(clock):
+    pool = NodePool(["http://a:9200"], dead_timeout=10, failure_threshold=2)
+    for _ in range(2):
+        pool.release(pool.acquire(), alive=False)
+
+    assert pool.snapshot()[0]["state"] == OPEN
+    with pytest.raises(NoLiveNodesError):
+        pool.acquire()
+
+    clock.now += 10
+    assert pool.snapshot()[0]["state"] == HALF_OPEN
+    trial = pool.acquire()
+    with pytest.raises(NoLiveNodesError):
+        pool.acquire()
+
+    pool.release(trial)
+    assert pool.snapshot()[0]["state"] == CLOSED
+
+def test_failed_trial_doubles_the_dead_timeout(clock):
+    pool = NodePool(["http://a:9200"], dead_timeout=10, failure_threshold=1)
+    pool.release(pool.acquire(), alive=False)
+    clock.now += 10
+
+    pool.release(pool.acquire(), alive=False)
+
+    clock.now += 19
+    assert pool.snapshot()[0]["state"] == OPEN
+    clock.now += 1
+    assert pool.snapshot()[0]["state"] == HALF_OPEN
+
+def test_dead_nodes_are_skipped(clock):
+    pool = NodePool(["http://a:9200", "http://b:9200"], failure_threshold=1)
+    pool.release(pool.acquire(), alive=False)
+
+    assert {pool.acquire().base_url for _ in range(3)} == {"http://b:9200"}
+
+def test_set_urls_keeps_known_node_state():
+    pool = NodePool(["http://a:9200"], failure_threshold=5)
+    pool.release(pool.acquire(), alive=False)
+
+    pool.set_urls(["http://a:9200", "http://c:9200"])
+    pool.set_urls([])
+
+    assert [(node["url"], node["failures"]) for node in pool.snapshot()] == [
+        ("http://a:9200", 1), ("http://c:9200", 0)
+    ]
+
+def test_invalid_pools_are_rejected():
+    with pytest.raises(ValueError):
+        NodePool([])
+    with pytest.raises(ValueError):
+        NodePool(["http://a:9200"], selector="random")
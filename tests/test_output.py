@@ -0,0 +1,57 @@
+"""Tests for the silent, log and display output modes."""
+
+import logging
+
+import pytest
+
+from elasticsearch.utils.output import ClientOutput
+
+from fakes import respond, search_hits
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        ClientOutput("verbose")
+
+def test_silent_mode_drops_info_but_logs_errors(capsys, caplog):
+    output = ClientOutput()
+
+    with caplog.at_level(logging.INFO, logger="elasticsearch.ecommerce"):
+        output.info("indexed %s", 1)
+        output.products([{"ID": 1}], "found %s", 1)
+        output.error("failed %s", 2)
+
+    assert capsys.readouterr().out == ""
+    assert [record.getMessage() for record in caplog.records] == ["failed 2"]
+
+def test_log_mode_logs_hits_only_at_debug(caplog):
+    output = ClientOutput("log")
+
+    with caplog.at_level(logging.INFO, logger="elasticsearch.ecommerce"):
+        output.products([{"ID": 1}], "found %s", 1)
+    assert [record.getMessage() for record in caplog.records] == ["found 1"]
+
+    caplog.clear()
+    with caplog.at_level(logging.DEBUG, logger="elasticsearch.ecommerce"):
+        output.products([{"ID": 1}], "found %s", 1)
+    assert len(caplog.records) == 2
+
+def test_display_mode_prints_every_hit(capsys):
+    ClientOutput("display").products([{"ID": 1, "Name": "Lamp"}], "found %s", 1)
+
+    printed = capsys.readouterr().out
+    assert "found 1" in printed
+    assert "Lamp" in printed
+
+def test_searches_print_nothing_by_default(make_client, capsys):
+    client = make_client(respond(search_hits({"ID": 1, "Name": "Lamp"})))
+
+    client.search_by_brand("Acme")
+
+    assert capsys.readouterr().out == ""
+
+def test_message_arguments_are_not_formatted_when_silent():
+    class Exploding:
+        def __str__(self):
+            raise AssertionError("formatted")
+
+    ClientOutput().info("value %s", Exploding())
@@ -0,0 +1,71 @@
+"""Tests that the sync and asyncio clients run the same request plans."""
+
+import asyncio
+import inspect
+
+import pytest
+
+from elasticsearch.clients.operations import ProductOperations
+from elasticsearch.clients.sync_client import EcommerceElasticClient
+from elasticsearch.models.query_builders import TermQuery
+
+from fakes import AioFakeTransport, FakeTransport, respond, search_hits
+
+aio_client = pytest.importorskip("elasticsearch.clients.aio_client")
+
+def run_both(call, *replies):
+    """Run call(client) on a sync and an asyncio client with the same replies."""
+    sync = EcommerceElasticClient(transport=FakeTransport(*replies))
+    aio = aio_client.AioEcommerceClient(transport=AioFakeTransport(*replies))
+    sync_result = call(sync)
+    aio_result = asyncio.run(call(aio))
+    return (sync_result, sync.transport.requests), (aio_result, aio.transport.requests)
+
+def public_operations():
+    return sorted(
+        getattr(ProductOperations, name).operation
+        for name in dir(ProductOperations)
+        if hasattr(getattr(ProductOperations, name), "operation")
+    )
+
+def test_every_plan_is_public_on_both_clients():
+    for name in public_operations():
+        assert callable(getattr(EcommerceElasticClient, name))
+        assert inspect.iscoroutinefunction(getattr(aio_client.AioEcommerceClient, name))
+
+def test_search_sends_the_same_request_and_returns_the_same_result():
+    products = [{"ID": 1, "Brand": "Acme"}, {"ID": 2, "Brand": "Acme"}]
+
+    sync, aio = run_both(
+        lambda client: client.search_products(TermQuery("Brand", "Acme")), respond(search_hits(*products))
+    )
+
+    assert sync == aio
+    assert sync[0] == products
+    [request] = sync[1]
+    assert request.path == "/ecommerce_products/_search"
+    assert request.body == {"query": {"term": {"Brand": "Acme"}}}
+
+def test_transport_errors_are_thrown_into_the_plan():
+    sync, aio = run_both(lambda client: client.get_product_by_id(7), ConnectionError("down"))
+
+    assert sync[0] is None
+    assert aio[0] is None
+
+def test_request_lists_keep_their_order():
+    def mget_reply(request):
+        return respond({"docs": [{"_id": i, "found": True, "_source": {"ID": i}} for i in request.body["ids"]]})
+
+    sync, aio = run_both(
+        lambda client: client.get_products_by_ids(["1", "2", "3"], batch_size=1), *[mget_reply] * 3
+    )
+
+    assert sync[0] == aio[0] == [{"ID": "1"}, {"ID": "2"}, {"ID": "3"}]
+    assert len(aio[1]) == 3
+
+def test_operations_are_instrumented_under_their_public_name():
+    client = EcommerceElasticClient(transport=FakeTransport(respond(search_hits())))
+
+    client.search_products(TermQuery("Brand", "Acme"))
+
+    assert client.stats()["search_products"]["count"] == 1
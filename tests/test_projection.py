@@ -0,0 +1,40 @@
+"""Tests for _source filtering and filter_path on the read paths."""
+
+from elasticsearch.models.query_builders import TermQuery
+from elasticsearch.utils.projection import (
+    DOC_FILTER_PATH, SEARCH_FILTER_PATH, doc_params, hit_sources, source_filter
+)
+
+from fakes import respond, search_hits
+
+def test_source_filter_forms():
+    assert source_filter() is None
+    assert source_filter(["ID", "Name"]) == ["ID", "Name"]
+    assert source_filter(exclude=["Description"]) == {"excludes": ["Description"]}
+    assert source_filter(["ID"], ["Description"]) == {"excludes": ["Description"], "includes": ["ID"]}
+
+def test_doc_params_join_fields():
+    params = doc_params(["ID", "Price"], ["Description"])
+
+    assert params == {
+        "filter_path": DOC_FILTER_PATH, "_source_includes": "ID,Price", "_source_excludes": "Description"
+    }
+
+def test_hit_sources_tolerates_missing_hits():
+    assert hit_sources({}) == []
+    assert hit_sources(search_hits({"ID": 1})) == [{"ID": 1}]
+
+def test_search_sends_projection_and_filter_path(make_client):
+    client = make_client(respond(search_hits({"ID": 1})))
+
+    client.search_products(TermQuery("Brand", "Acme"), fields=["ID"])
+
+    [request] = client.transport.requests
+    assert request.body["_source"] == ["ID"]
+    assert request.params == {"filter_path": SEARCH_FILTER_PATH}
+
+def test_get_by_id_sends_projection(make_client):
+    client = make_client(respond({"found": True, "_source": {"ID": 3}}))
+
+    assert client.get_product_by_id(3, fields=["ID"]) == {"ID": 3}
+    assert client.transport.requests[0].params["_source_includes"] == "ID"
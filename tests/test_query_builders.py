@@ -0,0 +1,56 @@
+"""Tests for the query builders and CriteriaQuery compilation."""
+
+import pytest
+
+from elasticsearch.models.query_builders import BoolQuery, CriteriaQuery, RangeQuery, TermsQuery
+
+from fakes import respond, search_hits
+
+def test_range_query_leaves_out_open_bounds():
+    assert RangeQuery("Price", gte=10).to_dict() == {"range": {"Price": {"gte": 10}}}
+
+def test_bool_query_skips_empty_clauses():
+    assert BoolQuery(filters=[TermsQuery("Brand", ("A", "B"))]).to_dict() == {
+        "bool": {"filter": [{"terms": {"Brand": ["A", "B"]}}]}
+    }
+
+def test_criteria_compile_to_one_bool_query():
+    query = CriteriaQuery([
+        {"name": "laptop", "fuzzy": True},
+        {"price_range": {"min": 100, "max": 500}},
+        {"category": "Electronics"},
+        {"brand": ["Apple", "Sony"]},
+        {"min_rating": 4.0},
+        {"min_stock": 10},
+        {"date_range": {"start": "2024-01-01"}}
+    ])
+
+    assert query.to_dict() == {"bool": {
+        "must": [{"match": {"Name": {"query": "laptop", "fuzziness": "AUTO"}}}],
+        "filter": [
+            {"range": {"Price": {"gte": 100, "lte": 500}}},
+            {"term": {"Category": "Electronics"}},
+            {"terms": {"Brand": ["Apple", "Sony"]}},
+            {"range": {"Rating": {"gte": 4.0}}},
+            {"range": {"StockQty": {"gte": 10}}},
+            {"range": {"CreatedTime": {"gte": "2024-01-01"}}}
+        ]
+    }}
+
+def test_single_criteria_dict_and_exact_name():
+    assert CriteriaQuery({"name": "desk lamp"}).to_dict() == {
+        "bool": {"must": [{"match_phrase": {"Name": {"query": "desk lamp"}}}]}
+    }
+
+def test_unknown_criterion_is_rejected():
+    with pytest.raises(ValueError):
+        CriteriaQuery({"colour": "red"}).to_dict()
+
+def test_search_by_criteria_sends_one_request(make_client):
+    client = make_client(respond(search_hits({"ID": 1})))
+
+    products = client.search_by_criteria([{"category": "Books"}, {"min_stock": 1}])
+
+    [request] = client.transport.requests
+    assert products == [{"ID": 1}]
+    assert request.body["query"] == CriteriaQuery([{"category": "Books"}, {"min_stock": 1}]).to_dict()
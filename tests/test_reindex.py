@@ -0,0 +1,109 @@
+"""Tests for the alias swap plan and zero-downtime reindexing."""
+
+from elasticsearch.utils.aliases import legacy_indices, swap_alias_actions
+from elasticsearch.utils.reindex import reindex_failures, task_progress
+
+from fakes import respond
+
+ALIAS = "ecommerce_products"
+DONE_TASK = {
+    "completed": True,
+    "task": {"status": {"total": 4, "created": 4}, "running_time_in_nanos": 2_000_000_000},
+    "response": {"failures": []}
+}
+
+def test_swap_moves_both_aliases_in_one_request():
+    current = {"products-v1": ["products-read", "products-write"]}
+
+    assert swap_alias_actions("products-read", "products-write", current, "products-v2") == [
+        {"remove": {"index": "products-v1", "alias": "products-read"}},
+        {"remove": {"index": "products-v1", "alias": "products-write"}},
+        {"add": {"index": "products-v2", "alias": "products-read"}},
+        {"add": {"index": "products-v2", "alias": "products-write", "is_write_index": True}}
+    ]
+
+def test_swap_with_a_shared_alias_removes_it_once():
+    actions = swap_alias_actions(ALIAS, ALIAS, {f"{ALIAS}-v1": [ALIAS]}, f"{ALIAS}-v2")
+
+    assert actions == [
+        {"remove": {"index": f"{ALIAS}-v1", "alias": ALIAS}},
+        {"add": {"index": f"{ALIAS}-v2", "alias": ALIAS, "is_write_index": True}}
+    ]
+
+def test_legacy_concrete_index_is_removed_by_the_swap():
+    current = {ALIAS: []}
+
+    assert legacy_indices(current, ALIAS, ALIAS) == [ALIAS]
+    assert swap_alias_actions(ALIAS, ALIAS, current, f"{ALIAS}-v1") == [
+        {"remove_index": {"index": ALIAS}},
+        {"add": {"index": f"{ALIAS}-v1", "alias": ALIAS, "is_write_index": True}}
+    ]
+
+def test_task_progress_and_failures():
+    status = task_progress(DONE_TASK)
+
+    assert status["completed"] is True
+    assert status["done"] == 4
+    assert status["docs_per_sec"] == 2.0
+    assert reindex_failures(status) is None
+    assert reindex_failures(None) == "task status unavailable"
+    assert reindex_failures(task_progress({"error": {"type": "boom"}})) == [{"type": "boom"}]
+
+def cluster(current, task=DONE_TASK):
+    """Route reindex plan requests to canned answers; current is what the alias resolves to."""
+    def route(request):
+        if request.method == "GET" and request.path == f"/{ALIAS}/_alias":
+            return respond({index: {"aliases": dict.fromkeys(aliases, {})} for index, aliases in current.items()})
+        if request.method == "GET" and request.path.endswith("-v*/_alias"):
+            return respond({index: {"aliases": {}} for index in current if index != ALIAS})
+        if request.method == "GET" and request.path.endswith("/_alias"):
+            return respond({request.path.split("/")[1]: {"aliases": {}}})
+        if request.method == "HEAD":
+            return respond({}, 404)
+        if request.method == "GET" and request.path.endswith("/_settings"):
+            return respond({})
+        if request.path == "/_reindex":
+            return respond({"task": "node:1"})
+        if request.path.startswith("/_tasks/"):
+            return respond(task)
+        return respond({"acknowledged": True})
+    return route
+
+def run_reindex(make_client, current, **options):
+    client = make_client(*[cluster(current)] * 20)
+    summary = client.reindex_products(poll_interval=0, **options)
+    return summary, client.transport.requests
+
+def test_reindex_copies_into_the_next_version_and_swaps(make_client):
+    summary, requests = run_reindex(make_client, {f"{ALIAS}-v1": [ALIAS]})
+
+    [reindex] = [request for request in requests if request.path == "/_reindex"]
+    [swap] = [request for request in requests if request.path == "/_aliases"]
+    assert reindex.body == {"source": {"index": ALIAS}, "dest": {"index": f"{ALIAS}-v2"}}
+    assert swap.body["actions"][-1]["add"]["index"] == f"{ALIAS}-v2"
+    assert summary["source"] == [f"{ALIAS}-v1"]
+    assert summary["dest"] == f"{ALIAS}-v2"
+    assert summary["documents"] == 4
+    assert summary["deleted_old"] is False
+
+def test_reindex_can_delete_the_old_index(make_client):
+    summary, requests = run_reindex(make_client, {f"{ALIAS}-v1": [ALIAS]}, delete_old=True)
+
+    assert requests[-1].method == "DELETE"
+    assert summary["deleted_old"] is True
+
+def test_reindex_migrates_a_legacy_concrete_index(make_client):
+    summary, requests = run_reindex(make_client, {ALIAS: []})
+
+    [swap] = [request for request in requests if request.path == "/_aliases"]
+    assert swap.body["actions"][0] == {"remove_index": {"index": ALIAS}}
+    assert summary["dest"] == f"{ALIAS}-v1"
+    assert summary["deleted_old"] is True
+    assert not any(request.method == "DELETE" for request in requests)
+
+def test_failed_copy_leaves_the_aliases_alone(make_client):
+    failed = dict(DONE_TASK, response={"failures": [{"cause": "mapping"}]})
+    client = make_client(*[cluster({f"{ALIAS}-v1": [ALIAS]}, failed)] * 20)
+
+    assert client.reindex_products(poll_interval=0) is None
+    assert not any(request.path == "/_aliases" for request in client.transport.requests)
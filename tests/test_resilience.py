@@ -0,0 +1,81 @@
+"""Tests for idempotency rules, the retry policy and transport retries."""
+
+import pytest
+import requests
+
+from elasticsearch.clients.transport import Transport
+from elasticsearch.utils.resilience import RetryPolicy, bulk_is_idempotent, is_idempotent
+
+NO_BACKOFF = RetryPolicy(max_retries=2, initial_backoff=0, max_backoff=0)
+
+class FakeHTTPResponse:
+    def __init__(self, status_code, content=b"{}"):
+        self.status_code = status_code
+        self.content = content
+        self.headers = {}
+        self.raw = None
+
+class ScriptedSession:
+    """Stands in for requests.Session; each reply is a status code or an exception."""
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.urls = []
+
+    def request(self, method, url, **kwargs):
+        self.urls.append(url)
+        reply = self.replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return FakeHTTPResponse(reply)
+
+def transport(*replies, **options):
+    transport = Transport(retry_policy=NO_BACKOFF, **options)
+    transport._local.session = ScriptedSession(*replies)
+    return transport
+
+def test_idempotent_requests():
+    assert is_idempotent("GET", "/products/_doc/1")
+    assert is_idempotent("post", "/products/_search?size=0")
+    assert not is_idempotent("POST", "/products/_doc")
+    assert not is_idempotent("POST", "/_bulk")
+
+def test_bulk_chunks_are_idempotent_only_with_ids_and_plain_writes():
+    assert bulk_is_idempotent([({"index": {"_id": "1"}}, {}), ({"delete": {"_id": "2"}}, None)])
+    assert not bulk_is_idempotent([({"index": {}}, {})])
+    assert not bulk_is_idempotent([({"create": {"_id": "1"}}, {})])
+    assert not bulk_is_idempotent([({"update": {"_id": "1"}}, {"script": "ctx._source.n++"})])
+
+def test_retry_policy_limits():
+    policy = RetryPolicy(max_retries=1)
+
+    assert policy.should_retry(0, True)
+    assert not policy.should_retry(1, True)
+    assert not policy.should_retry(0, False)
+    with pytest.raises(ValueError):
+        RetryPolicy(max_retries=-1)
+
+def test_unavailable_node_is_retried_for_idempotent_requests():
+    client = transport(503, 503, 200)
+
+    assert client.perform_request("GET", "/products/_search").status_code == 200
+    assert len(client.session.urls) == 3
+
+def test_non_idempotent_requests_are_not_resent():
+    client = transport(503, 200)
+
+    assert client.perform_request("POST", "/products/_doc", body={"ID": 1}).status_code == 503
+    assert len(client.session.urls) == 1
+
+def test_read_timeouts_raise_once_retries_run_out():
+    client = transport(requests.ReadTimeout(), requests.ReadTimeout(), requests.ReadTimeout())
+
+    with pytest.raises(requests.ReadTimeout):
+        client.perform_request("GET", "/products/_doc/1")
+    assert len(client.session.urls) == 3
+
+def test_connect_failures_fail_over_to_the_next_node():
+    client = transport(requests.ConnectTimeout(), 200, hosts=["es1:9200", "es2:9200"])
+
+    assert client.perform_request("POST", "/products/_doc", body={"ID": 1}).status_code == 200
+    assert [url.split("/")[2] for url in client.session.urls] == ["es1:9200", "es2:9200"]
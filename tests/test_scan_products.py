@@ -0,0 +1,49 @@
+"""Tests for point-in-time / search_after streaming."""
+
+import pytest
+
+from fakes import respond
+
+def page(*ids, pit_id="pit-1"):
+    hits = [{"_source": {"ID": i}, "sort": [i, i]} for i in ids]
+    return respond({"pit_id": pit_id, "hits": {"hits": hits}})
+
+def test_scan_pages_with_search_after_and_closes_the_pit(make_client):
+    client = make_client(
+        respond({"id": "pit-1"}), page(1, 2), page(3, 4, pit_id="pit-2"), page(5, pit_id="pit-2"), respond()
+    )
+
+    products = list(client.scan_products(page_size=2))
+
+    assert [product["ID"] for product in products] == [1, 2, 3, 4, 5]
+    open_pit, first, second, third, close = client.transport.requests
+    assert open_pit.path == "/ecommerce_products/_pit"
+    assert "search_after" not in first.body
+    assert second.body["search_after"] == [2, 2]
+    assert third.body["pit"]["id"] == "pit-2"
+    assert close.method == "DELETE"
+    assert close.body == {"id": "pit-2"}
+
+def test_failed_page_raises_and_still_closes_the_pit(make_client):
+    client = make_client(respond({"id": "pit-1"}), page(1, 2), respond({"error": "gone"}, 404), respond())
+
+    products = client.scan_products(page_size=2)
+
+    with pytest.raises(RuntimeError):
+        list(products)
+    assert client.transport.requests[-1].method == "DELETE"
+
+def test_closing_the_stream_early_closes_the_pit(make_client):
+    client = make_client(respond({"id": "pit-1"}), page(1, 2), respond())
+
+    products = client.scan_products(page_size=2)
+    next(products)
+    products.close()
+
+    assert [request.method for request in client.transport.requests] == ["POST", "POST", "DELETE"]
+
+def test_unopenable_pit_raises(make_client):
+    client = make_client(respond({"error": "no index"}, 404))
+
+    with pytest.raises(RuntimeError):
+        list(client.scan_products())
@@ -0,0 +1,50 @@
+"""Tests for the pluggable JSON serializers."""
+
+from datetime import date, datetime, timezone
+
+import pytest
+
+from elasticsearch.utils.serializer import JSONSerializer, OrjsonSerializer, get_serializer, orjson
+
+SERIALIZERS = [JSONSerializer()] + ([OrjsonSerializer()] if orjson else [])
+
+@pytest.mark.parametrize("serializer", SERIALIZERS, ids=lambda serializer: serializer.name)
+def test_round_trip_to_bytes(serializer):
+    data = {"ID": 1, "Name": "Lamp", "Tags": ["a", "b"], "Price": 9.5, "Active": True}
+
+    encoded = serializer.dumps(data)
+
+    assert isinstance(encoded, bytes)
+    assert serializer.loads(encoded) == data
+    assert serializer.loads(encoded.decode()) == data
+
+@pytest.mark.parametrize("serializer", SERIALIZERS, ids=lambda serializer: serializer.name)
+def test_datetimes_are_iso_8601(serializer):
+    data = {"at": datetime(2024, 1, 2, 3, 4, 5), "utc": datetime(2024, 1, 2, tzinfo=timezone.utc),
+            "day": date(2024, 1, 2)}
+
+    assert serializer.loads(serializer.dumps(data)) == {
+        "at": "2024-01-02T03:04:05", "utc": "2024-01-02T00:00:00+00:00", "day": "2024-01-02"
+    }
+
+@pytest.mark.parametrize("serializer", SERIALIZERS, ids=lambda serializer: serializer.name)
+def test_numpy_values_are_plain_numbers(serializer):
+    np = pytest.importorskip("numpy")
+    data = {"ID": np.int64(3), "Price": np.float64(2.5), "Active": np.bool_(True), "IDs": np.arange(3)}
+
+    assert serializer.loads(serializer.dumps(data)) == {"ID": 3, "Price": 2.5, "Active": True, "IDs": [0, 1, 2]}
+
+@pytest.mark.skipif(orjson is None, reason="orjson is not installed")
+def test_both_serializers_encode_the_same_bytes():
+    np = pytest.importorskip("numpy")
+    data = {"at": datetime(2024, 1, 2, 3, 4, 5, 6), "ID": np.int32(7), "Rating": np.float32(4.5)}
+
+    assert JSONSerializer().dumps(data) == OrjsonSerializer().dumps(data)
+
+def test_get_serializer_resolves_names_and_objects():
+    custom = JSONSerializer()
+
+    assert get_serializer("json").name == "json"
+    assert get_serializer(custom) is custom
+    with pytest.raises(ValueError):
+        get_serializer("yaml")
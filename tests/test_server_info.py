@@ -0,0 +1,47 @@
+"""Tests for the lazy, cached connection probe."""
+
+import pytest
+
+from elasticsearch.utils.server_info import clear_server_info, parse_version
+
+from fakes import respond
+
+ROOT = {"cluster_name": "test", "version": {"number": "8.12.0-SNAPSHOT"}}
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_server_info()
+    yield
+    clear_server_info()
+
+def test_parse_version():
+    assert parse_version("8.11.1") == (8, 11, 1)
+    assert parse_version("8.12.0-SNAPSHOT") == (8, 12, 0)
+    assert parse_version("7.x") == (7,)
+
+def test_constructing_a_client_sends_nothing(make_client):
+    client = make_client()
+
+    assert client.transport.requests == []
+
+def test_probe_is_cached_per_host_across_clients(make_client):
+    first = make_client(respond(ROOT))
+    second = make_client()
+
+    assert first.server_version() == (8, 12, 0)
+    assert second.check_connection() is True
+    assert second.transport.requests == []
+
+def test_refresh_probes_again(make_client):
+    client = make_client(respond(ROOT), respond(dict(ROOT, version={"number": "8.13.0"})))
+
+    client.server_version()
+
+    assert client.server_version(refresh=True) == (8, 13, 0)
+
+def test_failed_probes_are_not_cached(make_client):
+    client = make_client(ConnectionError("down"), respond(ROOT))
+
+    assert client.check_connection() is False
+    assert client.check_connection() is True
+    assert len(client.transport.requests) == 2
@@ -0,0 +1,69 @@
+"""Tests for the pooled keep-alive transport."""
+
+import gzip
+import threading
+
+from elasticsearch.clients.async_client import AsyncEcommerceClient
+from elasticsearch.clients.sync_client import EcommerceElasticClient
+from elasticsearch.clients.transport import Response, Transport
+from elasticsearch.utils.serializer import JSONSerializer
+
+from fakes import FakeTransport, respond
+
+class RecordingSession:
+    def __init__(self):
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return type("HTTPResponse", (), {"status_code": 200, "content": b"{}", "headers": {}, "raw": None})()
+
+def test_threads_get_their_own_session_on_one_adapter():
+    transport = Transport()
+    sessions = []
+
+    def use_session():
+        sessions.append(transport.session)
+
+    threads = [threading.Thread(target=use_session) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(session) for session in sessions}) == 3
+    assert all(session.get_adapter("http://localhost:9200") is transport.adapter for session in sessions)
+    assert transport.session is transport.session
+    transport.close()
+
+def test_bodies_are_encoded_once_and_compressed_over_the_threshold():
+    transport = Transport(http_compress=True, compress_threshold=100, serializer="json")
+    session = transport._local.session = RecordingSession()
+
+    transport.perform_request("POST", "/products/_search", body={"query": {"match_all": {}}})
+    transport.perform_request("POST", "/_bulk", body=b'{"index":{}}\n' * 20)
+
+    small, large = session.calls
+    assert small[2]["data"] == b'{"query":{"match_all":{}}}'
+    assert "headers" not in small[2] or not small[2]["headers"]
+    assert large[2]["headers"] == {"Content-Encoding": "gzip"}
+    assert gzip.decompress(large[2]["data"]) == b'{"index":{}}\n' * 20
+    assert transport.transfer_stats.snapshot()["compressed_requests"] == 1
+
+def test_response_decodes_with_the_transport_serializer():
+    response = Response(200, b'{"took":3}', {}, JSONSerializer())
+
+    assert response.json() == {"took": 3}
+    assert response.text == '{"took":3}'
+
+def test_clients_share_one_transport():
+    shared = FakeTransport(respond(), respond())
+    sync = EcommerceElasticClient(transport=shared)
+    threaded = AsyncEcommerceClient(transport=shared, max_workers=1)
+
+    sync.refresh_index("products")
+    threaded.refresh_index("products")
+    threaded.close()
+
+    assert len(shared.requests) == 2
+    assert threaded.headers is sync.headers
@@ -0,0 +1,54 @@
+"""Tests for the vectorized product generator."""
+
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("faker")
+
+from elasticsearch.utils.product_generator import BRANDS, CATEGORIES, generate_product_data
+from elasticsearch.utils.vectorized_generator import (
+    SEEDED_REFERENCE_TIME, generate_product_batches, iter_product_data
+)
+
+def test_seeded_output_is_reproducible():
+    assert list(iter_product_data(50, seed=3, batch_size=16)) == list(iter_product_data(50, seed=3, batch_size=16))
+    assert list(iter_product_data(5, seed=3)) != list(iter_product_data(5, seed=4))
+
+def test_seeded_output_does_not_depend_on_processes():
+    single = list(generate_product_batches(40, batch_size=10, seed=5))
+    pooled = list(generate_product_batches(40, batch_size=10, seed=5, processes=2))
+
+    assert single == pooled
+
+def test_seeded_times_fall_in_the_year_before_the_reference():
+    for product in iter_product_data(100, seed=1):
+        created = datetime.fromisoformat(product["CreatedTime"])
+        assert SEEDED_REFERENCE_TIME.replace(year=2023) <= created <= SEEDED_REFERENCE_TIME
+
+def test_batches_are_bounded_and_in_id_order():
+    batches = list(generate_product_batches(25, batch_size=10, seed=1, start_id=101))
+
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert [product["ID"] for batch in batches for product in batch] == list(range(101, 126))
+
+def test_products_match_the_classic_generator_schema():
+    [classic] = generate_product_data(1)
+
+    for product in iter_product_data(200, seed=2):
+        assert product.keys() == classic.keys()
+        assert isinstance(product["Name"], str)
+        assert product["Subcategory"] in CATEGORIES[product["Category"]]
+        assert product["Brand"] in BRANDS[product["Category"]]
+        assert 10.0 <= product["Price"] <= 2000.0
+        assert 0 <= product["Rating"] <= 5
+
+def test_products_are_plain_python_values():
+    product = next(iter_product_data(1, seed=1))
+
+    assert {type(value) for value in product.values()} <= {int, float, str, bool}
+
+def test_invalid_batch_size_is_rejected():
+    with pytest.raises(ValueError):
+        next(generate_product_batches(10, batch_size=0))